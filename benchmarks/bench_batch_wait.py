@@ -0,0 +1,49 @@
+"""Overhead of `Batch.wait`: time spent waiting after the last job finished, and status requests sent.
+
+    python benchmarks/bench_batch_wait.py --jobs 1000 --job-seconds 5
+"""
+
+import time
+
+from et_engine import Engine
+from et_engine.testing import MockEngine
+
+import common
+
+
+def main() -> None:
+    parser = common.parser(__doc__)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10, 1000], help="Numbers of jobs per batch")
+    parser.add_argument("--job-seconds", type=float, default=2.0, help="Mean duration of a job, in seconds")
+    parser.add_argument("--min-interval", type=float, default=0.5, help="Shortest polling interval, in seconds")
+    parser.add_argument("--max-interval", type=float, default=5.0, help="Longest polling interval, in seconds")
+    args = parser.parse_args()
+
+    results = {}
+    with MockEngine(job_seconds=args.job_seconds, **common.server_kwargs(args)) as server:
+        engine = Engine(server.url)
+        tool = engine.tools.create_tool("benchmark", "benchmark tool")
+
+        for n_jobs in args.jobs:
+            overheads, polls = [], []
+            for _ in range(args.repeat):
+                batch = tool.run_batch(variable_kwargs=[{"i": i} for i in range(n_jobs)])
+                mock_batch = server.batches[batch.batch_id]
+                requests_before = server.request_count
+
+                batch.wait(min_interval=args.min_interval, max_interval=args.max_interval)
+
+                last_job_done = mock_batch.created + max(mock_batch.finish_times)
+                overheads.append(time.time() - last_job_done)
+                polls.append(server.request_count - requests_before)
+
+            results[f"wait overhead, {n_jobs} jobs (s)"] = common.summarize(overheads)
+            results[f"status requests, {n_jobs} jobs"] = common.summarize(polls)
+
+        engine.close()
+
+    common.report(results, args)
+
+
+if __name__ == "__main__":
+    main()
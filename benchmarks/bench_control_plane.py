@@ -0,0 +1,54 @@
+"""Latency of control-plane calls (listings, connects, status, mkdir), on a local mock server.
+
+    python benchmarks/bench_control_plane.py --latency 0.02 --calls 200
+"""
+
+import time
+
+from et_engine import Engine
+from et_engine.testing import MockEngine
+
+import common
+
+
+def main() -> None:
+    parser = common.parser(__doc__)
+    parser.add_argument("--calls", type=int, default=100, help="Number of calls timed per case")
+    parser.add_argument("--resources", type=int, default=50, help="Number of filesystems and tools listed")
+    args = parser.parse_args()
+
+    with MockEngine(**common.server_kwargs(args)) as server:
+        engine = Engine(server.url)
+        for i in range(args.resources):
+            engine.filesystems.create_filesystem(f"fs-{i}")
+            engine.tools.create_tool(f"tool-{i}", "benchmark tool")
+        filesystem = engine.filesystems.connect("fs-0")
+        batch = engine.tools.connect("tool-0").run_batch(variable_kwargs=[{"i": i} for i in range(100)])
+
+        cases = {
+            "list_filesystems": engine.filesystems.list_filesystems,
+            "list_tools": engine.tools.list_tools,
+            "filesystems.connect": lambda: engine.filesystems.connect(f"fs-{args.resources - 1}"),
+            "tools.connect": lambda: engine.tools.connect(f"tool-{args.resources - 1}"),
+            "Batch.status": batch.status,
+            "Filesystem.ls": filesystem.ls,
+            "Filesystem.mkdir": lambda: filesystem.mkdir("benchmark", ignore_exists=True),
+        }
+
+        results = {}
+        for _ in range(args.repeat):
+            for case, call in cases.items():
+                samples = []
+                for _ in range(args.calls):
+                    start = time.perf_counter()
+                    call()
+                    samples.append(time.perf_counter() - start)
+                results.setdefault(f"{case} (s)", []).extend(samples)
+
+        engine.close()
+
+    common.report({case: common.summarize(samples) for case, samples in results.items()}, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Import time of the SDK in a fresh interpreter, as paid by every short-lived tool job.
+
+    python benchmarks/bench_import.py --repeat 20
+"""
+
+import sys
+import json
+import subprocess
+
+import common
+
+
+CASES = {
+    "import et_engine": "import et_engine",
+    "tool side (ArgParser, Logger)": "from et_engine.tools import ArgParser, Logger",
+    "Engine": "from et_engine import Engine",
+    "AsyncEngine": "from et_engine import AsyncEngine",
+}
+
+# Modules a tool-side import must not load
+HEAVY_MODULES = ("requests", "aiohttp", "tqdm", "et_engine_core", "et_engine.clients")
+
+SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    """Times one import statement in a new interpreter.
+
+    Args:
+        statement (str): The import statement.
+
+    Returns:
+        dict: The import time in seconds, and the heavy modules it loaded.
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = common.parser(__doc__, server=False)
+    args = parser.parse_args()
+
+    results = {}
+    for case, statement in CASES.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        results[f"{case} (s)"] = common.summarize([run["seconds"] for run in runs])
+        if case.startswith("tool side") and runs[0]["heavy"]:
+            print(f"WARNING: '{statement}' loaded {', '.join(runs[0]['heavy'])}")
+
+    common.report(results, args)
+
+
+if __name__ == "__main__":
+    main()
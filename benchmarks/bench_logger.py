@@ -0,0 +1,74 @@
+"""Time a tool spends in `Logger` calls, with synchronous and asynchronous writes.
+
+    python benchmarks/bench_logger.py --records 20000 --log-dir /mnt/shared
+
+Point `--log-dir` at the filesystem your jobs log to, since the synchronous mode pays its latency
+on every call.
+"""
+
+import sys
+import json
+import tempfile
+import subprocess
+
+import common
+
+
+# Logger configures the logging module and sys.excepthook globally, so each case runs in its own interpreter
+SCRIPT = """
+import os, time, json
+from et_engine.tools import Logger
+logger = Logger(os.path.join({log_dir!r}, "bench.log"), append=False, asynchronous={asynchronous!r})
+spent = 0.0
+for i in range({records!r}):
+    x = sum(range({work!r}))
+    start = time.perf_counter()
+    logger.info("step %d value %f", i, x * 0.5)
+    spent += time.perf_counter() - start
+start = time.perf_counter()
+logger.close()
+print(json.dumps({{"call": spent / {records!r}, "close": time.perf_counter() - start}}))
+"""
+
+
+def measure(log_dir: str, asynchronous: bool, records: int, work: int) -> dict:
+    """Runs one logging loop in a new interpreter.
+
+    Args:
+        log_dir (str): Directory of the log file.
+        asynchronous (bool): Whether to use the asynchronous Logger.
+        records (int): Number of records logged.
+        work (int): Size of the computation between records.
+
+    Returns:
+        dict: The mean time per logging call and the time `close` took to drain the log, in seconds.
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(log_dir=log_dir, asynchronous=asynchronous, records=records, work=work)],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = common.parser(__doc__, server=False)
+    parser.add_argument("--records", type=int, default=20000, help="Number of records logged per run")
+    parser.add_argument("--work", type=int, default=200, help="Size of the computation between records")
+    parser.add_argument("--log-dir", default=None, help="Directory of the log file. Defaults to a temporary directory")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir=args.log_dir) as log_dir:
+        for mode, asynchronous in (("sync", False), ("async", True)):
+            runs = [measure(log_dir, asynchronous, args.records, args.work) for _ in range(args.repeat)]
+            results[f"{mode} logging call (us)"] = common.summarize([run["call"] * 1e6 for run in runs])
+            results[f"{mode} close (s)"] = common.summarize([run["close"] for run in runs])
+
+    common.report(results, args)
+
+
+if __name__ == "__main__":
+    main()
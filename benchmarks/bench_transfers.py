@@ -0,0 +1,57 @@
+"""Upload and download throughput against file size and chunk size, on a local mock server.
+
+    python benchmarks/bench_transfers.py --sizes 1 16 64 --chunk-sizes 8 32 --bandwidth 200
+"""
+
+import os
+import time
+import tempfile
+
+from et_engine import Engine
+from et_engine.testing import MockEngine
+
+import common
+
+
+MIB = 1024 * 1024
+
+
+def main() -> None:
+    parser = common.parser(__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 64], help="File sizes, in MiB")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[8, 32], help="Chunk sizes, in MiB")
+    parser.add_argument("--checksum", default="sha256", help="Per-part checksum algorithm, or 'none'")
+    args = parser.parse_args()
+    checksum = None if args.checksum == "none" else args.checksum
+
+    results = {}
+    with MockEngine(**common.server_kwargs(args)) as server, tempfile.TemporaryDirectory() as local_dir:
+        engine = Engine(server.url)
+        filesystem = engine.filesystems.create_filesystem("benchmark")
+
+        for size in args.sizes:
+            local_file = os.path.join(local_dir, f"{size}.bin")
+            with open(local_file, "wb") as f:
+                f.write(os.urandom(size * MIB))
+
+            for chunk_size in args.chunk_sizes:
+                uploads, downloads = [], []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    filesystem.upload(local_file, f"{size}.bin", chunk_size=chunk_size * MIB, checksum=checksum)
+                    uploads.append(size / (time.perf_counter() - start))
+
+                    start = time.perf_counter()
+                    filesystem.download(f"{size}.bin", os.path.join(local_dir, "download.bin"), chunk_size=chunk_size * MIB, checksum=checksum)
+                    downloads.append(size / (time.perf_counter() - start))
+
+                results[f"upload {size} MiB / {chunk_size} MiB chunks (MiB/s)"] = common.summarize(uploads)
+                results[f"download {size} MiB / {chunk_size} MiB chunks (MiB/s)"] = common.summarize(downloads)
+
+        engine.close()
+
+    common.report(results, args, higher_is_better=True)
+
+
+if __name__ == "__main__":
+    main()
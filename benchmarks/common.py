@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import argparse
+import statistics
+
+
+def parser(description: str, server: bool = True) -> argparse.ArgumentParser:
+    """Creates an argument parser with the options shared by every benchmark.
+
+    Args:
+        description (str): Description of the benchmark.
+        server (bool, optional): Whether to add the options shaping the mock server. Defaults to True.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+
+    parser = argparse.ArgumentParser(description=description)
+    if server:
+        parser.add_argument("--latency", type=float, default=0.0, help="Latency the mock server adds to every response, in seconds")
+        parser.add_argument("--bandwidth", type=float, default=None, help="Mock server bandwidth cap, in MiB/s")
+        parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of an injected transient failure per request")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the mock server")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each case")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Compare with the results of a previous run, written by --json")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative slowdown against the baseline reported as a regression")
+    return parser
+
+
+def server_kwargs(args: argparse.Namespace) -> dict:
+    """Builds the `MockEngine` options from the shared command-line options.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        dict: Keyword arguments for `MockEngine`.
+    """
+
+    os.environ.setdefault("ET_ENGINE_API_KEY", "benchmark")
+    return {
+        "latency": args.latency,
+        "bandwidth": args.bandwidth * 1024 * 1024 if args.bandwidth else None,
+        "failure_rate": args.failure_rate,
+        "seed": args.seed
+    }
+
+
+def summarize(samples: list[float]) -> dict:
+    """Summarizes repeated measurements.
+
+    Args:
+        samples (list[float]): The measurements.
+
+    Returns:
+        dict: The median, minimum, maximum and 95th percentile.
+    """
+
+    ordered = sorted(samples)
+    return {
+        "median": statistics.median(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p95": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    }
+
+
+def report(results: dict[str, dict], args: argparse.Namespace, higher_is_better: bool = False) -> None:
+    """Prints the results, saves them, and checks them against a baseline.
+
+    Exits with status 1 when a case's median is worse than the baseline's by more than `--tolerance`.
+
+    Args:
+        results (dict[str, dict]): Summaries keyed by case name, see `summarize`.
+        args (argparse.Namespace): The parsed options.
+        higher_is_better (bool, optional): Whether larger medians are better, e.g. for throughput. Defaults to False.
+    """
+
+    width = max(len(case) for case in results)
+    for case, summary in results.items():
+        print(f"{case:<{width}}  median {summary['median']:>12.4f}  p95 {summary['p95']:>12.4f}  min {summary['min']:>12.4f}  max {summary['max']:>12.4f}")
+
+    if args.json_path is not None:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline is None:
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for case, summary in results.items():
+        if case not in baseline or baseline[case]["median"] == 0:
+            continue
+        before, after = baseline[case]["median"], summary["median"]
+        change = (before - after) / before if higher_is_better else (after - before) / before
+        if change > args.tolerance:
+            regressions.append(f"{case}: {before:.4f} -> {after:.4f} ({change:+.0%} worse)")
+
+    if regressions:
+        print("\nRegressions against the baseline:")
+        print("\n".join(regressions))
+        sys.exit(1)
+    print("\nNo regressions against the baseline")
@@ -1,2 +1,30 @@
-from .engine import Engine
-from .tools import Hardware
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import Engine
+    from .aio import AsyncEngine
+    from .tool_clients import Hardware
+
+
+# Public names and the modules defining them. They are imported on first access, so
+# `import et_engine` and `et_engine.tools.ArgParser` stay cheap inside tool containers.
+_LAZY_ATTRIBUTES = {
+    "Engine": ".engine",
+    "AsyncEngine": ".aio",
+    "Hardware": ".tool_clients",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
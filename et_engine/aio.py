@@ -0,0 +1,1352 @@
+import os
+import posixpath
+import shutil
+import tempfile
+import time
+import heapq
+import bisect
+import asyncio
+import aiohttp
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Self
+
+import et_engine_core as etc
+from . import clients
+from . import transfers
+from . import filesystems
+from . import packing
+from . import serialization
+from . import encoding
+from .instrumentation import Hooks, RequestEvent, NO_HOOKS
+from .tool_clients import Hardware, shard_jobs, DEFAULT_JOBS_PER_REQUEST, DEFAULT_MAX_REQUEST_BYTES, DEFAULT_MAX_SUBMIT_WORKERS
+from .batches import GroupStatus, JobChange, JobTable, PollSchedule, gather_paths, jobs_since_params, JOB_SUCCEEDED, DEFAULT_MIN_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_WORKERS
+
+
+DEFAULT_CONNECTION_LIMIT = 100
+
+
+class AsyncTransport:
+    """Long-lived asynchronous HTTP transport shared between asynchronous API clients.
+
+    Wraps a single `aiohttp.ClientSession`, which is opened lazily on first use so that the transport
+    can be constructed outside of a running event loop.
+    """
+
+    def __init__(self, limit: int = DEFAULT_CONNECTION_LIMIT, limit_per_host: int = 0, timeout: int = transfers.DEFAULT_TIMEOUT_SECONDS, control_timeout: int = transfers.DEFAULT_CONTROL_TIMEOUT_SECONDS, retry_policy: clients.RetryPolicy = None, compression: str = None, compress_min_bytes: int = serialization.DEFAULT_COMPRESS_MIN_BYTES, hooks: Hooks = None, request_limiter: clients.TokenBucket = None, bandwidth_limiter: clients.TokenBucket = None) -> None:
+        """Creates a new asynchronous transport.
+
+        Args:
+            limit (int, optional): Maximum number of simultaneous connections. Defaults to DEFAULT_CONNECTION_LIMIT.
+            limit_per_host (int, optional): Maximum number of simultaneous connections per host, 0 for no limit. Defaults to 0.
+            timeout (int, optional): Total timeout of each transfer part, in seconds. Defaults to transfers.DEFAULT_TIMEOUT_SECONDS.
+            control_timeout (int, optional): Total timeout of each API and control request, in seconds. Defaults to transfers.DEFAULT_CONTROL_TIMEOUT_SECONDS.
+            retry_policy (clients.RetryPolicy, optional): Retry policy for every request and transfer part sent through this transport. Defaults to a new clients.RetryPolicy.
+            compression (str, optional): Compression for API request bodies, "gzip" or "zstd", or None to send them uncompressed. Defaults to None.
+            compress_min_bytes (int, optional): Request bodies smaller than this are sent uncompressed. Defaults to serialization.DEFAULT_COMPRESS_MIN_BYTES.
+            hooks (Hooks, optional): Instrumentation hooks notified of every request and transfer. Defaults to the no-op NO_HOOKS.
+            request_limiter (clients.TokenBucket, optional): Limit on API and control requests per second, one token per attempt. Defaults to None, for no limit.
+            bandwidth_limiter (clients.TokenBucket, optional): Limit on transfer part bytes per second, one token per byte. Defaults to None, for no limit.
+
+        Raises:
+            Exception: The compression is not available.
+        """
+
+        if compression is not None and compression not in serialization.available_compressions():
+            raise Exception(f"Compression '{compression}' is not available, options are {serialization.available_compressions()}")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.control_timeout = control_timeout
+        self.retry_policy = retry_policy if retry_policy is not None else clients.RetryPolicy()
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self.hooks = hooks if hooks is not None else NO_HOOKS
+        self.request_limiter = request_limiter
+        self.bandwidth_limiter = bandwidth_limiter
+        # Per-request overhead measured on the first part of the latest transfer, see transfers.Transfer.observe_rtt
+        self.observed_rtt = None
+        self._session = None
+
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared asynchronous client session, created on first access.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+        """
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=client_timeout)
+        return self._session
+
+
+    async def close(self) -> None:
+        """Closes the shared session and all of its connections.
+        """
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class AsyncAPIClient:
+    """Base asynchronous client for interacting with the ET Engine API
+    """
+
+    def __init__(self, url: str = clients.DEFAULT_BASE_URL, transport: AsyncTransport = None) -> None:
+        """Creates a new asynchronous base client.
+
+        Args:
+            url (str, optional): Base endpoint in URL format. Defaults to clients.DEFAULT_BASE_URL.
+            transport (AsyncTransport, optional): Asynchronous transport to send requests through. Defaults to a new transport.
+        """
+        self.url = url
+        self.transport = transport if transport is not None else AsyncTransport()
+
+
+    async def request(self, method: str, path: str, headers: dict = {}, params: dict = {}, data: dict = {}, retry_policy: clients.RetryPolicy = None) -> dict:
+        """Base method for making an asynchronous request to the base endpoint, retrying transient failures.
+
+        Args:
+            method (str): HTTP method to make request to. Supported options are ["GET", "POST", "DELETE"].
+            path (str): Resource path appended to the base URL.
+            headers (dict, optional): Key-value pairs of headers to send with the request. Defaults to {}.
+            params (dict, optional): Key-value pairs of query string params to send with the request. Defaults to {}.
+            data (dict, optional): Key-value pairs of request body data to send with the request. Formatted as a JSON-like dictionary. Defaults to {}.
+            retry_policy (clients.RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
+
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        policy = retry_policy if retry_policy is not None else self.transport.retry_policy
+        body, encoding_headers = serialization.encode_body(data, self.transport.compression, self.transport.compress_min_bytes)
+        url = f"{self.url}{path}"
+        attempts = 0
+        status = None
+        bytes_received = 0
+
+        async def send() -> dict:
+            nonlocal attempts, status, bytes_received
+            attempts += 1
+            if self.transport.request_limiter is not None:
+                await self.transport.request_limiter.acquire_async()
+            async with self.transport.session.request(
+                method,
+                url,
+                headers={**headers, **encoding_headers},
+                params={k: str(v) for k, v in params.items()},
+                data=body,
+                timeout=aiohttp.ClientTimeout(total=self.transport.control_timeout)
+            ) as response:
+                response.raise_for_status()
+                content = await response.read()
+                status, bytes_received = response.status, len(content)
+                if content:
+                    return serialization.loads(content)
+
+        start = time.monotonic()
+        try:
+            result = await policy.call_async(send, idempotent=method.upper() in clients.IDEMPOTENT_METHODS)
+        except Exception as err:
+            self.transport.hooks.on_request(RequestEvent(method, url, policy.status_of(err), time.monotonic() - start, attempts, len(body), 0, err))
+            raise
+        self.transport.hooks.on_request(RequestEvent(method, url, status, time.monotonic() - start, attempts, len(body), bytes_received))
+        return result
+
+
+    async def authorized_request(self, method: str, path: str, headers: dict = {}, params: dict = {}, data: dict = {}, retry_policy: clients.RetryPolicy = None) -> dict:
+        """Similar to the `request` method, but adds an API key authorization header.
+
+        Args:
+            method (str): HTTP method to make request to. Supported options are ["GET", "POST", "DELETE"].
+            path (str): Resource path appended to the base URL.
+            headers (dict, optional): Key-value pairs of headers to send with the request. Defaults to {}.
+            params (dict, optional): Key-value pairs of query string params to send with the request. Defaults to {}.
+            data (dict, optional): Key-value pairs of request body data to send with the request. Formatted as a JSON-like dictionary. Defaults to {}.
+            retry_policy (clients.RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
+
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        headers = {**headers, "Authorization": os.environ["ET_ENGINE_API_KEY"]}
+        return await self.request(method, path, headers=headers, params=params, data=data, retry_policy=retry_policy)
+
+
+    async def get(self, path: str = "", params: dict = {}, retry_policy: clients.RetryPolicy = None) -> dict:
+        """Performs a GET request with authorization at the specified resource path.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            params (dict, optional): Query string params to send with the request. Defaults to {}.
+            retry_policy (clients.RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
+
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        return await self.authorized_request("GET", path, params=params, retry_policy=retry_policy)
+
+
+    async def post(self, path: str = "", data: dict = {}) -> dict:
+        """Performs a POST request with authorization at the specified resource path.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            data (dict, optional): Request body data to send with the request, in a JSON-like dictionary. Defaults to {}.
+
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        return await self.authorized_request("POST", path, data=data)
+
+
+    async def delete(self, path: str = "") -> dict:
+        """Performs a DELETE request with authorization at the specified resource path.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        return await self.authorized_request("DELETE", path)
+
+
+    async def iter_pages(self, path: str = "", params: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> AsyncIterator[list[dict]]:
+        """Lazily fetches a listing one page at a time, see `clients.page_items`.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            params (dict, optional): Query string params to send with every page request, e.g. server-side filters. Defaults to {}.
+            page_size (int, optional): Number of items requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            list[dict]: The JSON descriptions on each page.
+        """
+
+        params = {**params, clients.PAGE_SIZE_PARAM: page_size}
+        while True:
+            items, next_token = clients.page_items(await self.get(path, params=params))
+            yield items
+            if not next_token:
+                return
+            params[clients.PAGE_TOKEN_PARAM] = next_token
+
+
+    async def iter_resources(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> AsyncIterator[dict]:
+        """Lazily iterates over the raw JSON descriptions of a resource listing.
+
+        Args:
+            where (Callable[[dict], bool], optional): Client-side filter applied to each raw JSON description before anything is built from it. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of items requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            dict: Each matching JSON description.
+        """
+
+        async for page in self.iter_pages(params=filters, page_size=page_size):
+            for resource in page:
+                if where is None or where(resource):
+                    yield resource
+
+
+class AsyncFilesystem(etc.Filesystem):
+    """An asynchronous Interface and Client for interacting with an ET Engine Filesystem.
+    """
+
+    def __init__(self, base_url: str, *args, transport: AsyncTransport = None, **kwargs) -> None:
+        """Create an interactive asynchronous ET Engine Filesystem object.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            transport (AsyncTransport, optional): Asynchronous transport shared with the parent client. Defaults to a new transport.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.client = AsyncAPIClient(f"{base_url}/filesystems/{self.filesystem_id}", transport=transport)
+
+
+    def transfer_options(self) -> dict:
+        """Collects the options that run each `transfers.Transfer` on the shared asynchronous transport.
+
+        The transfer takes its retry policy, hooks, limiters and observed round-trip time from the
+        transport, so no synchronous default transport is created.
+
+        Returns:
+            dict: The transport and its timeouts to pass to each `transfers.Transfer`.
+        """
+
+        transport = self.client.transport
+        return {
+            "transport": transport,
+            "timeout": transport.timeout,
+            "control_timeout": transport.control_timeout
+        }
+
+
+    async def upload(self, local_file: str, remote_file: str, chunk_size: int | str = clients.MIN_CHUNK_SIZE_BYTES, min_concurrency: int = transfers.DEFAULT_MIN_CONCURRENCY, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, resume: bool = False, memory_budget: int = transfers.DEFAULT_MEMORY_BUDGET_BYTES, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> str:
+        """Uploads a local file to the specified path on The Engine.
+
+        Args:
+            local_file (str): A valid path to file on the local filesystem.
+            remote_file (str): A valid path to the destination of the remote file, starting from the filesystem root.
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or "auto" to pick it from the file size and observed round-trip time. Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            min_concurrency (int, optional): Floor on the number of parts in flight. Defaults to transfers.DEFAULT_MIN_CONCURRENCY.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            resume (bool, optional): Whether to keep a sidecar manifest of finished parts and continue a matching interrupted transfer. Defaults to False.
+            memory_budget (int, optional): Maximum number of part bytes buffered at once, in bytes. Defaults to transfers.DEFAULT_MEMORY_BUDGET_BYTES.
+            checksum (str, optional): Per-part checksum algorithm, one of transfers.CHECKSUM_ALGORITHMS, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar for the parts. Defaults to True.
+
+        Returns:
+            str: Whole-file digest combined from the part checksums, or None if checksums are disabled.
+        """
+
+        session = self.client.transport.session
+        url = f"{self.client.url}/files/{remote_file}"
+        file_contents = transfers.MultipartUpload(
+            local_file,
+            url,
+            chunk_size=chunk_size,
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            memory_budget=memory_budget,
+            checksum=checksum,
+            progress=progress,
+            **self.transfer_options()
+        )
+        return await file_contents.run_async(session)
+
+
+    async def download(self, remote_file: str, local_file: str, chunk_size: int | str = clients.MIN_CHUNK_SIZE_BYTES, min_concurrency: int = transfers.DEFAULT_MIN_CONCURRENCY, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, resume: bool = False, memory_budget: int = transfers.DEFAULT_MEMORY_BUDGET_BYTES, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> str:
+        """Downloads a copy of a filesystem file to the local machine
+
+        Args:
+            remote_file (str): Path to the remote copy of the file inside the filesystem
+            local_file (str): Path to the destination of the downloaded file
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or "auto" to pick it from the file size and observed round-trip time. Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            min_concurrency (int, optional): Floor on the number of parts in flight. Defaults to transfers.DEFAULT_MIN_CONCURRENCY.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            resume (bool, optional): Whether to keep a sidecar manifest of finished parts and continue a matching interrupted transfer. Defaults to False.
+            memory_budget (int, optional): Maximum number of part bytes buffered at once, in bytes. Defaults to transfers.DEFAULT_MEMORY_BUDGET_BYTES.
+            checksum (str, optional): Per-part checksum algorithm, one of transfers.CHECKSUM_ALGORITHMS, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar for the parts. Defaults to True.
+
+        Returns:
+            str: Whole-file digest combined from the part checksums, or None if checksums are disabled.
+        """
+
+        session = self.client.transport.session
+        url = f"{self.client.url}/files/{remote_file}"
+        file_contents = transfers.MultipartDownload(
+            local_file,
+            url,
+            chunk_size=chunk_size,
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            memory_budget=memory_budget,
+            checksum=checksum,
+            progress=progress,
+            **self.transfer_options()
+        )
+        return await file_contents.run_async(session)
+
+
+    async def mkdir(self, path: str, ignore_exists: bool = False) -> None:
+        """Make a new directory in the remote filesystem.
+
+        Args:
+            path (str): Path to the new directory.
+            ignore_exists (bool, optional): Whether to ignore errors caused by the directory already existing. Defaults to False.
+
+        Raises:
+            aiohttp.ClientResponseError: The directory could not be created, or already exists and `ignore_exists` is False.
+        """
+
+        try:
+            await self.client.post(f"/mkdir/{path}")
+        except aiohttp.ClientResponseError as err:
+            if err.status == 409 and ignore_exists:
+                return
+            raise
+
+
+    async def delete(self, path: str) -> None:
+        """Delete a file on the remote filesystem.
+
+        Args:
+            path (str): Path to the file to be deleted.
+        """
+        await self.client.delete(f"/files/{path}")
+
+
+    async def ls(self, path: str = '') -> dict[str, list]:
+        """List contents of a directory within a filesystem.
+
+        Args:
+            path (str, optional): Path to the directory to perform the ls command. Defaults to ''.
+
+        Returns:
+            dict[str, list]: A dictionary with keys ['directories', 'files'], each of which maps to a list of directories and files within the requested directory, respsectively.
+        """
+
+        return await self.client.get(f"/list/{path}")
+
+
+    async def walk(self, path: str = '', max_workers: int = transfers.DEFAULT_MAX_FILES) -> tuple[dict[str, dict], set[str]]:
+        """Recursively lists a remote directory, listing each level's directories concurrently.
+
+        Args:
+            path (str, optional): Path to the remote directory. A directory that does not exist is treated as empty. Defaults to ''.
+            max_workers (int, optional): Maximum number of concurrent `ls` requests. Defaults to transfers.DEFAULT_MAX_FILES.
+
+        Returns:
+            tuple[dict[str, dict], set[str]]: Files keyed by their path relative to `path` with their known metadata, and the set of relative directory paths.
+        """
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def list_directory(relative_dir: str) -> tuple[str, dict]:
+            async with semaphore:
+                try:
+                    return relative_dir, await self.ls(posixpath.join(path, relative_dir).strip("/"))
+                except aiohttp.ClientResponseError as err:
+                    if err.status == 404:
+                        return relative_dir, {}
+                    raise
+
+        files = {}
+        directories = set()
+        level = [""]
+        while level:
+            level = filesystems.add_listings(await asyncio.gather(*(list_directory(d) for d in level)), files, directories)
+
+        return files, directories
+
+
+    async def sync(self, local_dir: str, remote_dir: str = '', direction: str = filesystems.SYNC_UPLOAD, compare: str = "mtime", max_files: int = transfers.DEFAULT_MAX_FILES, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, chunk_size: int | str = clients.MIN_CHUNK_SIZE_BYTES, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> list[str]:
+        """Synchronizes a local directory with a remote directory, transferring only what changed.
+
+        Args:
+            local_dir (str): Path to the local directory.
+            remote_dir (str, optional): Path to the remote directory, starting from the filesystem root. Defaults to ''.
+            direction (str, optional): filesystems.SYNC_UPLOAD to push local changes, or filesystems.SYNC_DOWNLOAD to pull remote changes. Defaults to filesystems.SYNC_UPLOAD.
+            compare (str, optional): How files are compared, one of filesystems.SYNC_COMPARISONS. Defaults to "mtime".
+            max_files (int, optional): Maximum number of files transferred at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight per file. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or "auto". Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            checksum (str, optional): Per-part checksum algorithm, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar over the files. Defaults to True.
+
+        Returns:
+            list[str]: Relative paths of the files that were transferred.
+        """
+
+        remote_files, remote_directories = await self.walk(remote_dir, max_workers=max_files)
+        relative_paths, directories = await asyncio.to_thread(filesystems.prepare_sync, local_dir, remote_dir, remote_files, remote_directories, direction, compare)
+        for directory in directories:
+            await self.mkdir(directory, ignore_exists=True)
+
+        file_transfers = filesystems.sync_transfers(
+            self.client.url,
+            relative_paths,
+            local_dir,
+            remote_dir,
+            direction,
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size,
+            checksum=checksum,
+            **self.transfer_options()
+        )
+        await transfers.transfer_files(file_transfers, self.client.transport.session, max_files=max_files, progress=progress)
+
+        return filesystems.finish_sync(local_dir, remote_files, relative_paths, direction)
+
+
+    async def upload_packed(self, local_dir: str, remote_dir: str = '', shard_size: int = packing.DEFAULT_SHARD_SIZE_BYTES, small_file_threshold: int = packing.SMALL_FILE_THRESHOLD_BYTES, max_files: int = transfers.DEFAULT_MAX_FILES, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> list[str]:
+        """Uploads a directory of many small files as a few tar shards. See `Filesystem.upload_packed`.
+
+        Args:
+            local_dir (str): Path to the local directory.
+            remote_dir (str, optional): Path to the remote directory, starting from the filesystem root. Defaults to ''.
+            shard_size (int, optional): Target size of each shard, in bytes. Defaults to packing.DEFAULT_SHARD_SIZE_BYTES.
+            small_file_threshold (int, optional): Files at least this large are uploaded on their own. Defaults to packing.SMALL_FILE_THRESHOLD_BYTES.
+            max_files (int, optional): Maximum number of shards and files transferred at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight per file. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            checksum (str, optional): Per-part checksum algorithm, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar over the shards and files. Defaults to True.
+
+        Returns:
+            list[str]: Remote paths, relative to `remote_dir`, of the uploaded shards and large files.
+        """
+
+        shards, large_files, shard_paths, directories = await asyncio.to_thread(filesystems.prepare_packed_upload, local_dir, remote_dir, shard_size=shard_size, small_file_threshold=small_file_threshold)
+        for directory in directories:
+            await self.mkdir(directory, ignore_exists=True)
+
+        shard_dir = tempfile.mkdtemp(prefix="et-shards-")
+        try:
+            packed_transfers = packing.packed_upload_transfers(
+                self.client.url,
+                local_dir,
+                remote_dir,
+                shards,
+                large_files,
+                shard_dir,
+                max_concurrency=max_concurrency,
+                checksum=checksum,
+                progress=False,
+                **self.transfer_options()
+            )
+            await transfers.transfer_files(packed_transfers, self.client.transport.session, max_files=max_files, progress=progress)
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
+
+        remote_shards, _ = await self.walk(posixpath.join(remote_dir, packing.SHARD_DIRECTORY).strip("/"))
+        for path in packing.stale_shards(remote_dir, remote_shards, shard_paths):
+            await self.delete(path)
+
+        return shard_paths + large_files
+
+
+    async def download_packed(self, remote_dir: str, local_dir: str, max_files: int = transfers.DEFAULT_MAX_FILES, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> list[str]:
+        """Downloads a directory written by `upload_packed`, unpacking each shard as soon as it lands.
+
+        Args:
+            remote_dir (str): Path to the remote directory, starting from the filesystem root.
+            local_dir (str): Path to the local directory.
+            max_files (int, optional): Maximum number of shards and files transferred at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight per file. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            checksum (str, optional): Per-part checksum algorithm, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar over the shards and files. Defaults to True.
+
+        Returns:
+            list[str]: Relative paths of the local files written, unpacked or downloaded.
+        """
+
+        remote_files, _ = await self.walk(remote_dir, max_workers=max_files)
+        packed_transfers = list(packing.packed_download_transfers(
+            self.client.url,
+            local_dir,
+            remote_dir,
+            list(remote_files),
+            max_concurrency=max_concurrency,
+            checksum=checksum,
+            progress=False,
+            **self.transfer_options()
+        ))
+        await transfers.transfer_files(packed_transfers, self.client.transport.session, max_files=max_files, progress=progress)
+
+        return packing.finish_packed_download(local_dir, packed_transfers)
+
+
+    @staticmethod
+    def from_json(base_url: str, filesystem_json: dict, transport: AsyncTransport = None) -> Self:
+        """Convert a JSON object to an interactive asynchronous Filesystem.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            filesystem_json (dict): JSON description of the Filesystem.
+            transport (AsyncTransport, optional): Asynchronous transport shared with the parent client. Defaults to None.
+
+        Returns:
+            Self: An AsyncFilesystem object.
+        """
+        base_filesystem = etc.Filesystem.from_json(filesystem_json)
+        return AsyncFilesystem(
+            base_url,
+            filesystem_id=base_filesystem.filesystem_id,
+            filesystem_name=base_filesystem.filesystem_name,
+            transport=transport
+        )
+
+
+class AsyncFilesystemsClient(AsyncAPIClient):
+    """Asynchronous client for interacting with ET Engine Filesystems.
+    """
+
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, transport: AsyncTransport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS) -> None:
+        """Create a new asynchronous client for interacting with ET Engine Filesystems.
+
+        Args:
+            base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            transport (AsyncTransport, optional): Asynchronous transport shared by this client and every Filesystem it creates. Defaults to a new transport.
+            index_ttl (float, optional): Number of seconds `connect` trusts the last filesystem listing. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
+        """
+
+        super().__init__(f"{base_url}/filesystems", transport=transport)
+        self.base_url = base_url
+        self.index = clients.ResourceIndex(
+            lambda fs: etc.Filesystem.from_json(fs).filesystem_id,
+            lambda fs: etc.Filesystem.from_json(fs).filesystem_name,
+            ttl=index_ttl
+        )
+
+
+    async def create_filesystem(self, filesystem_name: str) -> AsyncFilesystem:
+        """Creates a new ET Engine Filesystem resource.
+
+        Args:
+            filesystem_name (str): Unique name of the filesystem to create.
+
+        Returns:
+            AsyncFilesystem: A new interactive Filesystem object.
+        """
+
+        data = {
+            "filesystem_name": filesystem_name
+        }
+        filesystem_json = await self.post(data=data)
+        self.index.put(filesystem_json)
+        return AsyncFilesystem.from_json(self.base_url, filesystem_json, transport=self.transport)
+
+
+    async def list_filesystems(self) -> list[AsyncFilesystem]:
+        """List all the available filesystems.
+
+        Returns:
+            list[AsyncFilesystem]: A list of Filesystem clients.
+        """
+
+        filesystem_list = await self.get()
+        self.index.refresh(filesystem_list)
+        return [AsyncFilesystem.from_json(self.base_url, fs, transport=self.transport) for fs in filesystem_list]
+
+
+    async def iter_filesystems(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> AsyncIterator[AsyncFilesystem]:
+        """Lazily iterates over the available filesystems, fetching one page at a time.
+
+        A Filesystem client is only built for each filesystem the iteration reaches that passes `where`.
+
+        Args:
+            where (Callable[[dict], bool], optional): Filter applied to each filesystem's raw JSON description. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of filesystems requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            AsyncFilesystem: A Filesystem client for each matching filesystem.
+        """
+
+        async for filesystem_json in self.iter_resources(where=where, filters=filters, page_size=page_size):
+            yield AsyncFilesystem.from_json(self.base_url, filesystem_json, transport=self.transport)
+
+
+    async def connect(self, filesystem_name: str) -> AsyncFilesystem:
+        """Connect the client to a specific Filesystem resource.
+
+        Args:
+            filesystem_name (str): Name of the filesystem to connect to.
+
+        Raises:
+            Exception: A filesystem with the specified name does not exist.
+
+        Returns:
+            AsyncFilesystem: A new interactive Filesystem object for the specified filesystem.
+        """
+
+        filesystem_json = self.index.get(name=filesystem_name)
+        if filesystem_json is None:
+            self.index.refresh(await self.get())
+            filesystem_json = self.index.find(name=filesystem_name)
+        if filesystem_json is None:
+            raise Exception("Filesystem does not exist")
+        return AsyncFilesystem.from_json(self.base_url, filesystem_json, transport=self.transport)
+
+
+async def poll_until_finished(status: Callable[[], Awaitable[etc.BatchStatus]], n_jobs: int, interval: int = None, thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
+    """Polls a status until enough jobs have finished. Shared by `AsyncBatch.wait` and `AsyncBatchGroup.wait`.
+
+    Args:
+        status (Callable[[], Awaitable[etc.BatchStatus]]): Fetches the current status, with `succeeded` and `failed` job counts.
+        n_jobs (int): Total number of jobs.
+        interval (int, optional): Fixed number of seconds between polls. If None, the interval adapts to the progress, see `PollSchedule`. Defaults to None.
+        thresh (int, optional): Number of finished jobs to wait for. If None, waits for all `n_jobs`. Defaults to None.
+        min_interval (float, optional): Shortest adaptive interval between polls, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+        max_interval (float, optional): Longest adaptive interval between polls, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+    """
+
+    if thresh is None:
+        thresh = n_jobs
+    schedule = PollSchedule(thresh, min_interval=min_interval, max_interval=max_interval)
+
+    current = await status()
+    completed = current.succeeded + current.failed
+    while completed < thresh:
+        await asyncio.sleep(interval if interval is not None else schedule.next_interval(completed))
+        current = await status()
+        completed = current.succeeded + current.failed
+
+
+class AsyncBatch(etc.Batch):
+    """An asynchronous Interface & Client for interacting with an ET Engine Batch.
+    """
+
+    def __init__(self, base_url: str, *args, transport: AsyncTransport = None, index: clients.ResourceIndex = None, **kwargs) -> None:
+        """Create an interactive asynchronous ET Engine Batch object.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            transport (AsyncTransport, optional): Asynchronous transport shared with the parent client. Defaults to a new transport.
+            index (clients.ResourceIndex, optional): Index of the parent client, updated when this batch is deleted. Defaults to None.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.client = AsyncAPIClient(f"{base_url}/batches/{self.batch_id}", transport=transport)
+        self.index = index
+        self.job_table = None
+        self.jobs_polled_at = None
+
+
+    async def delete(self) -> None:
+        """Delete this batch.
+        * NOTE: This will not cancel any jobs, which will still run and incur costs once deleted.
+        """
+        await self.client.delete()
+        if self.index is not None:
+            self.index.discard(self.batch_id)
+
+
+    async def status(self, max_retries: int = clients.DEFAULT_MAX_ATTEMPTS) -> etc.BatchStatus:
+        """Fetches a summary of the status of all jobs in the Batch.
+
+        Transient failures are retried with backoff according to the transport's `clients.RetryPolicy`.
+
+        Args:
+            max_retries (int, optional): Number of requests to try before raising an exception. Defaults to clients.DEFAULT_MAX_ATTEMPTS.
+
+        Returns:
+            etc.BatchStatus: An et_engine_core.BatchStatus object summarizing the status of all jobs in the Batch.
+        """
+
+        retry_policy = self.client.transport.retry_policy.with_max_attempts(max_retries)
+        batch_status_json = await self.client.get(retry_policy=retry_policy)
+        return etc.BatchStatus.from_json(batch_status_json)
+
+
+    async def jobs(self, refresh: bool = True) -> JobTable:
+        """Returns the per-job state table of the Batch.
+
+        Args:
+            refresh (bool, optional): Whether to poll for job changes first, see `changes`. Defaults to True.
+
+        Returns:
+            JobTable: The state of every job, indexed by job number.
+        """
+
+        if refresh or self.job_table is None:
+            await self.changes()
+        return self.job_table
+
+
+    async def changes(self, since: datetime = None) -> list[JobChange]:
+        """Polls the Batch's jobs and returns the state transitions since the last poll.
+
+        See `batches.Batch.changes`.
+
+        Args:
+            since (datetime, optional): Only request jobs updated after this time. Defaults to the time of the previous poll.
+
+        Returns:
+            list[JobChange]: The transitions seen by this poll.
+        """
+
+        if self.job_table is None:
+            self.job_table = JobTable(self.n_jobs)
+        if since is None:
+            since = self.jobs_polled_at
+
+        polled_at = datetime.now(timezone.utc)
+        changes = []
+        async for page in self.client.iter_pages("/jobs", params=jobs_since_params(since)):
+            changes.extend(self.job_table.apply(page))
+        self.jobs_polled_at = polled_at
+        return changes
+
+
+    async def gather(self, filesystem: AsyncFilesystem, pattern: str, local_dir: str, max_workers: int = transfers.DEFAULT_MAX_FILES, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL, progress: bool = False, **download_kwargs) -> AsyncIterator[str]:
+        """Downloads the output of each job as soon as it succeeds, while the rest of the Batch runs.
+
+        See `batches.Batch.gather`.
+
+        Args:
+            filesystem (AsyncFilesystem): Filesystem the jobs write their outputs to.
+            pattern (str): Remote path of a job's output, with "{i}" standing for the job index, e.g. "results/{i}/out.csv".
+            local_dir (str): Path to the local directory, mirroring the remote layout of the outputs.
+            max_workers (int, optional): Maximum number of outputs downloaded at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            min_interval (float, optional): Shortest adaptive interval between polls, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest adaptive interval between polls, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+            progress (bool, optional): Whether each download shows a progress bar for its parts. Off by default, since many downloads run at once. Defaults to False.
+            **download_kwargs: Options passed to `AsyncFilesystem.download`.
+
+        Yields:
+            str: Local path of each output, in the order the downloads finish.
+        """
+
+        schedule = PollSchedule(self.n_jobs, min_interval=min_interval, max_interval=max_interval)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def download(job_index: int) -> str:
+            async with semaphore:
+                remote_file, local_file = gather_paths(pattern, job_index, local_dir)
+                await filesystem.download(remote_file, local_file, progress=progress, **download_kwargs)
+                return local_file
+
+        pending = set()
+        try:
+            while True:
+                for change in await self.changes():
+                    if change.state == JOB_SUCCEEDED:
+                        pending.add(asyncio.create_task(download(change.job_index)))
+
+                finished = self.job_table.n_finished() >= self.n_jobs
+                next_poll = time.monotonic() + (0 if finished else schedule.next_interval(self.job_table.n_finished()))
+
+                # Hand back downloads as they land until the next poll is due
+                while pending:
+                    timeout = None if finished else max(0, next_poll - time.monotonic())
+                    done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    if not done:
+                        break
+                    for task in done:
+                        yield task.result()
+
+                if finished:
+                    return
+                await asyncio.sleep(max(0, next_poll - time.monotonic()))
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+    async def wait(self, interval: int = None, thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
+        """Wait for the Batch to finish processing without blocking the event loop.
+
+        Args:
+            interval (int, optional): Fixed number of seconds between status refreshes. If None, the interval adapts to the batch's progress, see `PollSchedule`. Defaults to None.
+            thresh (int, optional): Threshold number of jobs to finish waiting, if None then it waits until all jobs finish. Defaults to None.
+            min_interval (float, optional): Shortest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        """
+
+        await poll_until_finished(self.status, self.n_jobs, interval=interval, thresh=thresh, min_interval=min_interval, max_interval=max_interval)
+
+
+    @staticmethod
+    def from_json(base_url: str, batch_json: dict, transport: AsyncTransport = None, index: clients.ResourceIndex = None) -> Self:
+        """Convert a JSON object to an interactive asynchronous Batch.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            batch_json (dict): JSON description of the Batch.
+            transport (AsyncTransport, optional): Asynchronous transport shared with the parent client. Defaults to None.
+            index (clients.ResourceIndex, optional): Index of the parent client. Defaults to None.
+
+        Returns:
+            Self: An AsyncBatch object.
+        """
+        base_batch = etc.Batch.from_json(batch_json)
+        return AsyncBatch(
+            base_url,
+            batch_id=base_batch.batch_id,
+            batch_tool=base_batch.batch_tool,
+            n_jobs=base_batch.n_jobs,
+            batch_hardware=base_batch.batch_hardware,
+            transport=transport,
+            index=index
+        )
+
+
+class AsyncBatchGroup:
+    """One logical batch of jobs submitted to The Engine as several AsyncBatches. See `batches.BatchGroup`.
+    """
+
+    def __init__(self, batches: list[AsyncBatch], max_workers: int = DEFAULT_MAX_POLL_WORKERS) -> None:
+        """Creates a group from AsyncBatches submitted in order.
+
+        Args:
+            batches (list[AsyncBatch]): The member batches, in submission order.
+            max_workers (int, optional): Maximum number of status requests in flight at once. Defaults to DEFAULT_MAX_POLL_WORKERS.
+        """
+
+        self.batches = list(batches)
+        self.max_workers = max_workers
+
+        self.offsets = []
+        self.n_jobs = 0
+        for batch in self.batches:
+            self.offsets.append(self.n_jobs)
+            self.n_jobs += batch.n_jobs
+
+
+    def __len__(self) -> int:
+        return len(self.batches)
+
+
+    def __iter__(self):
+        return iter(self.batches)
+
+
+    def locate(self, job_index: int) -> tuple[AsyncBatch, int]:
+        """Finds the batch holding a job of the group.
+
+        Args:
+            job_index (int): Position of the job in the submitted sweep.
+
+        Raises:
+            Exception: The index is out of range.
+
+        Returns:
+            tuple[AsyncBatch, int]: The batch holding the job, and the job's index within it.
+        """
+
+        if not 0 <= job_index < self.n_jobs:
+            raise Exception(f"Job index {job_index} out of range for a group of {self.n_jobs} jobs")
+        i = bisect.bisect_right(self.offsets, job_index) - 1
+        return self.batches[i], job_index - self.offsets[i]
+
+
+    async def status(self, max_retries: int = clients.DEFAULT_MAX_ATTEMPTS) -> GroupStatus:
+        """Fetches the status of every batch in the group concurrently.
+
+        Args:
+            max_retries (int, optional): Number of requests to try per batch before raising an exception. Defaults to clients.DEFAULT_MAX_ATTEMPTS.
+
+        Returns:
+            GroupStatus: The summed status of the group.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def poll(batch: AsyncBatch) -> etc.BatchStatus:
+            async with semaphore:
+                return await batch.status(max_retries=max_retries)
+
+        return GroupStatus(await asyncio.gather(*(poll(b) for b in self.batches)))
+
+
+    async def wait(self, interval: int = None, thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
+        """Wait for the group to finish processing without blocking the event loop.
+
+        Args:
+            interval (int, optional): Fixed number of seconds between status refreshes. If None, the interval adapts to the group's progress, see `PollSchedule`. Defaults to None.
+            thresh (int, optional): Threshold number of jobs across the group to finish waiting, if None then it waits until all jobs finish. Defaults to None.
+            min_interval (float, optional): Shortest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        """
+
+        await poll_until_finished(self.status, self.n_jobs, interval=interval, thresh=thresh, min_interval=min_interval, max_interval=max_interval)
+
+
+    async def delete(self) -> None:
+        """Delete every batch in the group.
+        * NOTE: This will not cancel any jobs, which will still run and incur costs once deleted.
+        """
+        await asyncio.gather(*(b.delete() for b in self.batches))
+
+
+async def as_completed(batches: Iterable[AsyncBatch], thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL, max_workers: int = DEFAULT_MAX_POLL_WORKERS) -> AsyncIterator[AsyncBatch]:
+    """Watches many batches from one coroutine and yields each as it finishes. See `batches.as_completed`.
+
+    Args:
+        batches (Iterable[AsyncBatch]): The batches to watch.
+        thresh (int, optional): Number of finished jobs at which a batch counts as done. If None, each batch waits for all of its jobs. Defaults to None.
+        min_interval (float, optional): Shortest interval between polls of a batch, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+        max_interval (float, optional): Longest interval between polls of a batch, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        max_workers (int, optional): Maximum number of status requests in flight at once. Defaults to DEFAULT_MAX_POLL_WORKERS.
+
+    Yields:
+        AsyncBatch: Each batch, in the order they finish.
+    """
+
+    batches = list(batches)
+    schedules = [
+        PollSchedule(b.n_jobs if thresh is None else thresh, min_interval=min_interval, max_interval=max_interval)
+        for b in batches
+    ]
+    loop = asyncio.get_running_loop()
+    due_times = [(loop.time(), i) for i in range(len(batches))]
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def poll(i: int) -> etc.BatchStatus:
+        async with semaphore:
+            return await batches[i].status()
+
+    while due_times:
+
+        now = loop.time()
+        if due_times[0][0] > now:
+            await asyncio.sleep(due_times[0][0] - now)
+            continue
+
+        due = []
+        while due_times and due_times[0][0] <= now:
+            due.append(heapq.heappop(due_times)[1])
+
+        for i, status in zip(due, await asyncio.gather(*(poll(i) for i in due))):
+            completed = status.succeeded + status.failed
+            if completed >= schedules[i].thresh:
+                yield batches[i]
+            else:
+                polled = loop.time()
+                heapq.heappush(due_times, (polled + schedules[i].next_interval(completed, polled), i))
+
+
+async def wait_all(batches: Iterable[AsyncBatch], thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL, max_workers: int = DEFAULT_MAX_POLL_WORKERS) -> list[AsyncBatch]:
+    """Waits for many batches to finish, see `as_completed`.
+
+    Args:
+        batches (Iterable[AsyncBatch]): The batches to wait for.
+        thresh (int, optional): Number of finished jobs at which a batch counts as done. If None, each batch waits for all of its jobs. Defaults to None.
+        min_interval (float, optional): Shortest interval between polls of a batch, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+        max_interval (float, optional): Longest interval between polls of a batch, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        max_workers (int, optional): Maximum number of status requests in flight at once. Defaults to DEFAULT_MAX_POLL_WORKERS.
+
+    Returns:
+        list[AsyncBatch]: The batches, in the order they finished.
+    """
+
+    return [batch async for batch in as_completed(batches, thresh=thresh, min_interval=min_interval, max_interval=max_interval, max_workers=max_workers)]
+
+
+class AsyncBatchesClient(AsyncAPIClient):
+    """Asynchronous client for interacting with ET Engine Batches.
+    """
+
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, transport: AsyncTransport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS) -> None:
+        """Create a new asynchronous client for interacting with ET Engine Batches.
+
+        Args:
+            base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            transport (AsyncTransport, optional): Asynchronous transport shared by this client and every Batch it creates. Defaults to a new transport.
+            index_ttl (float, optional): Number of seconds `connect` trusts the last batch listing. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
+        """
+
+        super().__init__(f"{base_url}/batches", transport=transport)
+        self.base_url = base_url
+        self.index = clients.ResourceIndex(lambda b: etc.Batch.from_json(b).batch_id, ttl=index_ttl)
+
+
+    async def connect(self, batch_id: str) -> AsyncBatch:
+        """Connect to a specific Batch
+
+        Args:
+            batch_id (str): unique ID of the batch
+
+        Raises:
+            Exception: No batch with the specified ID
+
+        Returns:
+            AsyncBatch: A new Batch client.
+        """
+
+        batch_json = self.index.get(resource_id=batch_id)
+        if batch_json is None:
+            self.index.refresh(await self.get())
+            batch_json = self.index.find(resource_id=batch_id)
+        if batch_json is None:
+            raise Exception("Batch does not exist")
+        return AsyncBatch.from_json(self.base_url, batch_json, transport=self.transport, index=self.index)
+
+
+    async def list_batches(self) -> list[AsyncBatch]:
+        """Lists all the available batches.
+
+        Returns:
+            list[AsyncBatch]: A list of Batch clients to each available resource.
+        """
+
+        batches_list = await self.get()
+        self.index.refresh(batches_list)
+        return [AsyncBatch.from_json(self.base_url, b, transport=self.transport, index=self.index) for b in batches_list]
+
+
+    async def iter_batches(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> AsyncIterator[AsyncBatch]:
+        """Lazily iterates over the available batches, fetching one page at a time.
+
+        A Batch client is only built for each batch the iteration reaches that passes `where`.
+
+        Args:
+            where (Callable[[dict], bool], optional): Filter applied to each batch's raw JSON description. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of batches requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            AsyncBatch: A Batch client for each matching batch.
+        """
+
+        async for batch_json in self.iter_resources(where=where, filters=filters, page_size=page_size):
+            yield AsyncBatch.from_json(self.base_url, batch_json, transport=self.transport, index=self.index)
+
+
+    async def clear_batches(self) -> None:
+        """Deletes all batches.
+        """
+        await self.delete()
+        self.index.invalidate()
+
+
+class AsyncTool(etc.Tool):
+    """Asynchronous client for interacting with a specific tool.
+    """
+
+    def __init__(self, base_url: str, *args, transport: AsyncTransport = None, index: clients.ResourceIndex = None, **kwargs) -> None:
+        """Create an interactive asynchronous ET Engine Tool object.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            transport (AsyncTransport, optional): Asynchronous transport shared with the parent client. Defaults to a new transport.
+            index (clients.ResourceIndex, optional): Index of the parent client, updated when this tool is deleted. Defaults to None.
+        """
+        super().__init__(*args, **kwargs)
+        self.client = AsyncAPIClient(f"{base_url}/tools/{self.tool_id}", transport=transport)
+        self.base_url = base_url
+        self.index = index
+
+
+    async def run_batch(self, fixed_kwargs: dict = {}, variable_kwargs: list[dict] = [], hardware: Hardware = None) -> AsyncBatch:
+        """Submits a parallelized batch of jobs. Arrays among the arguments are encoded as in `Tool.run_batch`.
+
+        Args:
+            fixed_kwargs (dict, optional): Key-value arguments to be passed into each job in the batch. Defaults to {}.
+            variable_kwargs (list, optional): Variable arguments to be passed into separate jobs in the batch. Defaults to [].
+            hardware (Hardware, optional): The compute hardware to run for each job in the batch. Defaults to default hardware.
+
+        Returns:
+            AsyncBatch: The batch of jobs submitted to The Engine
+        """
+
+        data = {
+            'fixed_args': encoding.encode_arrays(fixed_kwargs),
+            'variable_args': [encoding.encode_arrays(job_kwargs) for job_kwargs in variable_kwargs]
+        }
+
+        if hardware is None:
+            data['hardware'] = Hardware().to_json()
+        else:
+            assert isinstance(hardware, Hardware)
+            data['hardware'] = hardware.to_json()
+
+        batch_json = await self.client.post(data=data)
+        return AsyncBatch.from_json(self.base_url, batch_json, transport=self.client.transport)
+
+
+    async def stream_batch(self, variable_kwargs: Iterable[dict], fixed_kwargs: dict = {}, hardware: Hardware = None, jobs_per_request: int = DEFAULT_JOBS_PER_REQUEST, max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES, max_workers: int = DEFAULT_MAX_SUBMIT_WORKERS) -> AsyncBatchGroup:
+        """Submits a very large sweep of jobs as a group of bounded batches. See `Tool.stream_batch`.
+
+        Args:
+            variable_kwargs (Iterable[dict]): Variable arguments of each job. May be a lazy generator.
+            fixed_kwargs (dict, optional): Key-value arguments to be passed into each job. Defaults to {}.
+            hardware (Hardware, optional): The compute hardware to run for each job. Defaults to default hardware.
+            jobs_per_request (int, optional): Maximum number of jobs per batch. Defaults to DEFAULT_JOBS_PER_REQUEST.
+            max_request_bytes (int, optional): Approximate maximum size of each request's job arguments, in bytes. Defaults to DEFAULT_MAX_REQUEST_BYTES.
+            max_workers (int, optional): Maximum number of batch submissions in flight at once. Defaults to DEFAULT_MAX_SUBMIT_WORKERS.
+
+        Returns:
+            AsyncBatchGroup: One handle over every submitted batch, in sweep order.
+        """
+
+        pending = []
+        batches = []
+        try:
+            for shard in shard_jobs(variable_kwargs, jobs_per_request=jobs_per_request, max_request_bytes=max_request_bytes):
+                if len(pending) >= max_workers:
+                    batches.append(await pending.pop(0))
+                pending.append(asyncio.create_task(self.run_batch(fixed_kwargs, shard, hardware)))
+            for task in pending:
+                batches.append(await task)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+
+        return AsyncBatchGroup(batches)
+
+
+    async def status(self) -> dict:
+        """Fetches the current status of the tool.
+
+        Returns:
+            dict: A JSON-like dictionary describing the tool status.
+        """
+        return await self.client.get()
+
+
+    async def delete(self) -> None:
+        """Deletes the tool [NOTE: This action cannot be un-done!]
+        """
+        response = await self.client.delete()
+        if self.index is not None:
+            self.index.discard(self.tool_id)
+        return response
+
+
+    @staticmethod
+    def from_json(base_url: str, tool_json: dict, transport: AsyncTransport = None, index: clients.ResourceIndex = None) -> Self:
+        """Convert a JSON object to an interactive asynchronous Tool.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            tool_json (dict): JSON description of the tool.
+            transport (AsyncTransport, optional): Asynchronous transport shared with the parent client. Defaults to None.
+            index (clients.ResourceIndex, optional): Index of the parent client. Defaults to None.
+
+        Returns:
+            Self: An AsyncTool object.
+        """
+        return AsyncTool(base_url, transport=transport, index=index, **tool_json)
+
+
+class AsyncToolsClient(AsyncAPIClient):
+    """Asynchronous client for interacting with ET Engine Tools.
+    """
+
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, transport: AsyncTransport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS) -> None:
+        """Create a new asynchronous client for interacting with ET Engine Tools.
+
+        Args:
+            base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            transport (AsyncTransport, optional): Asynchronous transport shared by this client and every Tool it creates. Defaults to a new transport.
+            index_ttl (float, optional): Number of seconds `connect` trusts the last tool listing. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
+        """
+        super().__init__(f"{base_url}/tools", transport=transport)
+        self.base_url = base_url
+        self.index = clients.ResourceIndex(lambda t: t["tool_id"], lambda t: t["tool_name"], ttl=index_ttl)
+
+
+    async def create_tool(self, tool_name: str, tool_description: str) -> AsyncTool:
+        """Create a new ET Engine Tool.
+
+        Args:
+            tool_name (str): Unique name of the tool.
+            tool_description (str): Description of what the tool does.
+
+        Returns:
+            AsyncTool: A client for the newly-created Tool.
+        """
+        data = {
+            "tool_name": tool_name,
+            "tool_description": tool_description
+        }
+        tool_json = await self.post(data=data)
+        self.index.put(tool_json)
+        return AsyncTool.from_json(self.base_url, tool_json, transport=self.transport, index=self.index)
+
+
+    async def list_tools(self) -> list[AsyncTool]:
+        """Lists all the available tools.
+
+        Returns:
+            list[AsyncTool]: A list of individual Tool clients.
+        """
+        tools_list = await self.get()
+        self.index.refresh(tools_list)
+        return [AsyncTool.from_json(self.base_url, t, transport=self.transport, index=self.index) for t in tools_list]
+
+
+    async def iter_tools(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> AsyncIterator[AsyncTool]:
+        """Lazily iterates over the available tools, fetching one page at a time.
+
+        A Tool client is only built for each tool the iteration reaches that passes `where`.
+
+        Args:
+            where (Callable[[dict], bool], optional): Filter applied to each tool's raw JSON description. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of tools requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            AsyncTool: A Tool client for each matching tool.
+        """
+
+        async for tool_json in self.iter_resources(where=where, filters=filters, page_size=page_size):
+            yield AsyncTool.from_json(self.base_url, tool_json, transport=self.transport, index=self.index)
+
+
+    async def connect(self, tool_name: str) -> AsyncTool:
+        """Connect to a specific Tool.
+
+        Args:
+            tool_name (str): Name of the Tool to connect to.
+
+        Raises:
+            Exception: No Tool exists with the specified name.
+
+        Returns:
+            AsyncTool: A new Tool client.
+        """
+        tool_json = self.index.get(name=tool_name)
+        if tool_json is None:
+            self.index.refresh(await self.get())
+            tool_json = self.index.find(name=tool_name)
+        if tool_json is None:
+            raise Exception("Tool does not exist")
+        return AsyncTool.from_json(self.base_url, tool_json, transport=self.transport, index=self.index)
+
+
+class AsyncEngine:
+    """Main asynchronous client for interacting with the ET Engine.
+
+    Every sub-client shares one long-lived `aiohttp.ClientSession`. Use it as an asynchronous context
+    manager, or call `close()` when done:
+
+        async with AsyncEngine() as engine:
+            fs = await engine.filesystems.connect("my-filesystem")
+            await fs.upload("local.bin", "remote.bin")
+    """
+
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, limit: int = DEFAULT_CONNECTION_LIMIT, timeout: int = transfers.DEFAULT_TIMEOUT_SECONDS, control_timeout: int = transfers.DEFAULT_CONTROL_TIMEOUT_SECONDS, transport: AsyncTransport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS, retry_policy: clients.RetryPolicy = None, compression: str = None, hooks: Hooks = None, requests_per_second: float = None, bytes_per_second: float = None) -> None:
+        """Create a new asynchronous Engine client.
+
+        Args:
+            base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            limit (int, optional): Maximum number of simultaneous connections on the shared session. Defaults to DEFAULT_CONNECTION_LIMIT.
+            timeout (int, optional): Total timeout of each transfer part, in seconds. Defaults to transfers.DEFAULT_TIMEOUT_SECONDS.
+            control_timeout (int, optional): Total timeout of each API and control request, in seconds. Defaults to transfers.DEFAULT_CONTROL_TIMEOUT_SECONDS.
+            transport (AsyncTransport, optional): An existing transport to share. If given, `limit`, `timeout` and `control_timeout` are ignored. Defaults to None.
+            index_ttl (float, optional): Number of seconds each sub-client trusts its last resource listing when connecting. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
+            retry_policy (clients.RetryPolicy, optional): Retry policy for every request and transfer part. Ignored if `transport` is given. Defaults to a new clients.RetryPolicy.
+            compression (str, optional): Compression for API request bodies, "gzip" or "zstd", or None to send them uncompressed. Ignored if `transport` is given. Defaults to None.
+            hooks (Hooks, optional): Instrumentation hooks notified of every request, transfer part and transfer. Ignored if `transport` is given. Defaults to no-op hooks.
+            requests_per_second (float, optional): Limit on API and control requests per second, shared by every coroutine using this Engine. Ignored if `transport` is given. Defaults to None, for no limit.
+            bytes_per_second (float, optional): Limit on transfer bytes per second, shared by every transfer started from this Engine. Ignored if `transport` is given. Defaults to None, for no limit.
+        """
+        if transport is None:
+            transport = AsyncTransport(
+                limit=limit,
+                timeout=timeout,
+                control_timeout=control_timeout,
+                retry_policy=retry_policy,
+                compression=compression,
+                hooks=hooks,
+                request_limiter=clients.TokenBucket(requests_per_second) if requests_per_second else None,
+                bandwidth_limiter=clients.TokenBucket(bytes_per_second) if bytes_per_second else None
+            )
+        self.transport = transport
+
+        self.filesystems = AsyncFilesystemsClient(base_url, transport=transport, index_ttl=index_ttl)
+        self.tools = AsyncToolsClient(base_url, transport=transport, index_ttl=index_ttl)
+        self.batches = AsyncBatchesClient(base_url, transport=transport, index_ttl=index_ttl)
+
+
+    async def close(self) -> None:
+        """Closes the shared session held by this Engine.
+        """
+        await self.transport.close()
+
+
+    async def __aenter__(self) -> Self:
+        return self
+
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
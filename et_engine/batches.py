@@ -1,24 +1,322 @@
+import os
 import time
+import heapq
+import bisect
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from tqdm import tqdm
-from typing import Self
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Iterable, Iterator, NamedTuple, Self
 
 import et_engine_core as etc
 from . import clients
+from . import transfers
+from .filesystems import Filesystem
+
+
+DEFAULT_MIN_POLL_INTERVAL = 2
+DEFAULT_MAX_POLL_INTERVAL = 60
+DEFAULT_MAX_POLL_WORKERS = 8
+JOB_UNKNOWN = "unknown"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOBS_SINCE_PARAM = "since"
+JOBS_SINCE_OVERLAP_SECONDS = 5
+# Job counts of a batch status summed by GroupStatus
+GROUP_STATUS_FIELDS = ("succeeded", "failed", "running")
+
+
+class JobChange(NamedTuple):
+    """A state transition of one job in a batch.
+    """
+
+    job_index: int
+    previous: str
+    state: str
+
+
+def parse_job(job_json: dict) -> tuple[int, str]:
+    """Reads the index and state of a job from its JSON description.
+
+    Args:
+        job_json (dict): JSON description of the job, with its index under "job_index" or "index" and its state under "status" or "state".
+
+    Returns:
+        tuple[int, str]: The job's index in the batch and its state.
+    """
+
+    job_index = job_json["job_index"] if "job_index" in job_json else job_json["index"]
+    state = job_json["status"] if "status" in job_json else job_json["state"]
+    return int(job_index), state
+
+
+class JobTable:
+    """Compact per-job state table of a batch.
+
+    States are interned to small codes and stored one byte per job in an array indexed by job number,
+    so tables for batches with many thousands of jobs stay small and cheap to scan.
+    """
+
+    def __init__(self, n_jobs: int) -> None:
+        """Creates a table with every job in the JOB_UNKNOWN state.
+
+        Args:
+            n_jobs (int): Number of jobs in the batch.
+        """
+
+        self.state_names = [JOB_UNKNOWN]
+        self.state_codes = {JOB_UNKNOWN: 0}
+        self.states = array("B", bytes(n_jobs))
+
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+
+    def __getitem__(self, job_index: int) -> str:
+        return self.state_names[self.states[job_index]]
+
+
+    def code(self, state: str) -> int:
+        """Returns the code of a state, interning it if it is new.
+
+        Args:
+            state (str): Name of the state.
+
+        Raises:
+            Exception: More than 256 distinct states were seen.
+
+        Returns:
+            int: The state's code.
+        """
+
+        code = self.state_codes.get(state)
+        if code is None:
+            if len(self.state_names) > 255:
+                raise Exception("Too many distinct job states")
+            code = len(self.state_names)
+            self.state_names.append(state)
+            self.state_codes[state] = code
+        return code
+
+
+    def update(self, job_index: int, state: str) -> JobChange:
+        """Records the state of one job.
+
+        Args:
+            job_index (int): Index of the job in the batch.
+            state (str): The job's current state.
+
+        Returns:
+            JobChange: The transition, or None if the job's state did not change.
+        """
+
+        if job_index >= len(self.states):
+            self.states.extend(bytes(job_index + 1 - len(self.states)))
+
+        code = self.code(state)
+        previous = self.states[job_index]
+        if previous == code:
+            return None
+        self.states[job_index] = code
+        return JobChange(job_index, self.state_names[previous], state)
+
+
+    def apply(self, jobs: Iterable[dict]) -> list[JobChange]:
+        """Records the states of many jobs.
+
+        Args:
+            jobs (Iterable[dict]): JSON descriptions of the jobs, see `parse_job`.
+
+        Returns:
+            list[JobChange]: The transitions, in the order the jobs were given.
+        """
+
+        changes = []
+        for job_json in jobs:
+            change = self.update(*parse_job(job_json))
+            if change is not None:
+                changes.append(change)
+        return changes
+
+
+    def indices(self, state: str) -> list[int]:
+        """Lists the jobs in a state.
+
+        Args:
+            state (str): Name of the state.
+
+        Returns:
+            list[int]: Indices of the jobs currently in that state.
+        """
+
+        code = self.state_codes.get(state)
+        if code is None:
+            return []
+        return [i for i, c in enumerate(self.states) if c == code]
+
+
+    def n_finished(self) -> int:
+        """Counts the jobs that succeeded or failed.
+
+        Returns:
+            int: Number of finished jobs.
+        """
+
+        return sum(self.states.count(self.state_codes[s]) for s in (JOB_SUCCEEDED, JOB_FAILED) if s in self.state_codes)
+
+
+    def counts(self) -> dict[str, int]:
+        """Counts the jobs in each state.
+
+        Returns:
+            dict[str, int]: Number of jobs per state name.
+        """
+
+        return {self.state_names[code]: n for code, n in Counter(self.states).items()}
+
+
+def gather_paths(pattern: str, job_index: int, local_dir: str) -> tuple[str, str]:
+    """Resolves the remote output of a job and its local destination.
+
+    Args:
+        pattern (str): Remote path of a job's output, with "{i}" standing for the job index, e.g. "results/{i}/out.csv".
+        job_index (int): Index of the job in the batch.
+        local_dir (str): Path to the local directory outputs are gathered into.
+
+    Returns:
+        tuple[str, str]: The remote path, and the local path mirroring it under `local_dir`.
+    """
+
+    remote_file = pattern.format(i=job_index).strip("/")
+    local_file = os.path.join(local_dir, *remote_file.split("/"))
+    os.makedirs(os.path.dirname(local_file) or ".", exist_ok=True)
+    return remote_file, local_file
+
+
+def jobs_since_params(since: datetime) -> dict:
+    """Builds the query params of an incremental job listing.
+
+    The cursor is moved back by JOBS_SINCE_OVERLAP_SECONDS to absorb clock skew; jobs listed twice are
+    harmless, since the job table only reports real transitions.
+
+    Args:
+        since (datetime): Time of the previous poll, or None for a full listing.
+
+    Returns:
+        dict: The query params.
+    """
+
+    if since is None:
+        return {}
+    return {JOBS_SINCE_PARAM: (since - timedelta(seconds=JOBS_SINCE_OVERLAP_SECONDS)).isoformat()}
+
+
+class PollSchedule:
+    """Adaptive interval between status polls of one batch.
+
+    Polls start fast, back off exponentially while no progress is seen, and otherwise follow the
+    estimated time left to reach the threshold, so they tighten as the batch nears completion.
+    """
+
+    def __init__(self, thresh: int, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
+        """Creates a new poll schedule.
+
+        Args:
+            thresh (int): Number of finished jobs the batch is being waited on for.
+            min_interval (float, optional): Shortest interval between polls, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest interval between polls, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        """
+
+        self.thresh = thresh
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.interval = min_interval
+        self.first_sample = None
+
+
+    def next_interval(self, completed: int, now: float = None) -> float:
+        """Records a poll and returns how long to wait before the next one.
+
+        Args:
+            completed (int): Number of finished jobs reported by the poll.
+            now (float, optional): Monotonic time of the poll. Defaults to the current time.
+
+        Returns:
+            float: Seconds until the next poll.
+        """
+
+        if now is None:
+            now = time.monotonic()
+        if self.first_sample is None:
+            self.first_sample = (now, completed)
+            return self.interval
+
+        start, start_completed = self.first_sample
+        progress = completed - start_completed
+        if progress <= 0:
+            self.interval = min(self.interval * 2, self.max_interval)
+            return self.interval
+
+        rate = progress / (now - start)
+        eta = (self.thresh - completed) / rate
+
+        # Poll a few times over the remaining ETA, so the poll after the threshold lands soon after it
+        self.interval = min(max(eta / 4, self.min_interval), self.max_interval)
+        return self.interval
+
+
+def poll_until_finished(status: Callable[[], etc.BatchStatus], n_jobs: int, interval: int = None, thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
+    """Polls a status until enough jobs have finished, with a progress bar. Shared by `Batch.wait` and `BatchGroup.wait`.
+
+    Args:
+        status (Callable[[], etc.BatchStatus]): Fetches the current status, with `succeeded` and `failed` job counts.
+        n_jobs (int): Total number of jobs.
+        interval (int, optional): Fixed number of seconds between polls. If None, the interval adapts to the progress, see `PollSchedule`. Defaults to None.
+        thresh (int, optional): Number of finished jobs to wait for. If None, waits for all `n_jobs`. Defaults to None.
+        min_interval (float, optional): Shortest adaptive interval between polls, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+        max_interval (float, optional): Longest adaptive interval between polls, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+    """
+
+    if thresh is None:
+        thresh = n_jobs
+    schedule = PollSchedule(thresh, min_interval=min_interval, max_interval=max_interval)
+
+    with tqdm(total=n_jobs) as pbar:
+
+        current = status()
+        completed = current.succeeded + current.failed
+        pbar.update(completed - pbar.n)
+
+        while completed < thresh:
+
+            time.sleep(interval if interval is not None else schedule.next_interval(completed))
+            current = status()
+            completed = current.succeeded + current.failed
+            pbar.update(completed - pbar.n)
 
 
 class Batch(etc.Batch):
     """An Interface & Client for interacting with an ET Engine Batch.
     """
 
-    def __init__(self, base_url: str, *args, **kwargs) -> None:
+    def __init__(self, base_url: str, *args, transport: clients.Transport = None, index: clients.ResourceIndex = None, **kwargs) -> None:
         """Create an interactive ET Engine Batch object.
 
         Args:
             base_url (str): Base endpoint for requests.
+            transport (clients.Transport, optional): Pooled transport shared with the parent client. Defaults to the shared default transport.
+            index (clients.ResourceIndex, optional): Index of the parent client, updated when this batch is deleted. Defaults to None.
         """
     
         super().__init__(*args, **kwargs)
-        self.client = clients.APIClient(f"{base_url}/batches/{self.batch_id}")
+        self.client = clients.APIClient(f"{base_url}/batches/{self.batch_id}", transport=transport)
+        self.index = index
+        self.job_table = None
+        self.jobs_polled_at = None
 
 
     def delete(self) -> None:
@@ -26,67 +324,146 @@ class Batch(etc.Batch):
         * NOTE: This will not cancel any jobs, which will still run and incur costs once deleted.
         """
         self.client.delete()
+        if self.index is not None:
+            self.index.discard(self.batch_id)
         
 
-    def status(self, max_retries: int = 5) -> etc.BatchStatus:
+    def status(self, max_retries: int = clients.DEFAULT_MAX_ATTEMPTS) -> etc.BatchStatus:
         """Fetches a summary of the status of all jobs in the Batch.
 
-        Args:
-            max_retries (int, optional): Number of requests to try before raising an exception. Defaults to 5.
+        Transient failures are retried with backoff according to the transport's `clients.RetryPolicy`.
 
-        Raises:
-            Exception: Max retries exceeded.
+        Args:
+            max_retries (int, optional): Number of requests to try before raising an exception. Defaults to clients.DEFAULT_MAX_ATTEMPTS.
 
         Returns:
             etc.BatchStatus: An et_engine_core.BatchStatus object summarizing the status of all jobs in the Batch.
         """
 
-        num_tries = 0
-        while num_tries < max_retries:
+        retry_policy = self.client.transport.retry_policy.with_max_attempts(max_retries)
+        batch_status_json = self.client.get(retry_policy=retry_policy)
+        return etc.BatchStatus.from_json(batch_status_json)
+        
 
-            try:
-                batch_status_json = self.client.get()
-                return etc.BatchStatus.from_json(batch_status_json)
-            
-            except:
-                num_tries += 1
+    def jobs(self, refresh: bool = True) -> JobTable:
+        """Returns the per-job state table of the Batch.
 
-        raise Exception("max retries exceeded")
-        
+        Args:
+            refresh (bool, optional): Whether to poll for job changes first, see `changes`. Defaults to True.
+
+        Returns:
+            JobTable: The state of every job, indexed by job number.
+        """
 
-    def wait(self, interval: int = 15, thresh: int = None) -> None:
+        if refresh or self.job_table is None:
+            self.changes()
+        return self.job_table
+
+
+    def changes(self, since: datetime = None) -> list[JobChange]:
+        """Polls the Batch's jobs and returns the state transitions since the last poll.
+
+        Only jobs updated since the previous poll are requested, and the local job table filters out
+        jobs whose state did not actually change. The first poll reports every job's move out of
+        JOB_UNKNOWN.
+
+        Args:
+            since (datetime, optional): Only request jobs updated after this time. Defaults to the time of the previous poll.
+
+        Returns:
+            list[JobChange]: The transitions seen by this poll.
+        """
+
+        if self.job_table is None:
+            self.job_table = JobTable(self.n_jobs)
+        if since is None:
+            since = self.jobs_polled_at
+
+        polled_at = datetime.now(timezone.utc)
+        changes = []
+        for page in self.client.iter_pages("/jobs", params=jobs_since_params(since)):
+            changes.extend(self.job_table.apply(page))
+        self.jobs_polled_at = polled_at
+        return changes
+
+
+    def wait(self, interval: int = None, thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
         """Wait for the Batch to finish processing.
 
         Args:
-            interval (int, optional): Number of seconds between status refreshes, in seconds. Defaults to 15.
+            interval (int, optional): Fixed number of seconds between status refreshes. If None, the interval adapts to the batch's progress, see `PollSchedule`. Defaults to None.
             thresh (int, optional): Threshold number of jobs to finish waiting, if None then it waits until all jobs finish. Defaults to None.
+            min_interval (float, optional): Shortest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
         """
 
-        status = self.status()
+        poll_until_finished(self.status, self.n_jobs, interval=interval, thresh=thresh, min_interval=min_interval, max_interval=max_interval)
 
-        if thresh is None:
-            thresh = self.n_jobs
 
-        with tqdm(total=self.n_jobs) as pbar:
+    def gather(self, filesystem: Filesystem, pattern: str, local_dir: str, max_workers: int = transfers.DEFAULT_MAX_FILES, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL, progress: bool = False, **download_kwargs) -> Iterator[str]:
+        """Downloads the output of each job as soon as it succeeds, while the rest of the Batch runs.
 
-            status = self.status()
-            completed = status.succeeded + status.failed
-                
-            while completed < thresh:
+        The Batch's jobs are polled with `changes` on an adaptive `PollSchedule`, and every job newly seen
+        as succeeded has its output downloaded by a bounded pool of workers. Failed jobs are skipped; see
+        `jobs` for which ones they were.
 
-                time.sleep(interval)
-                status = self.status()
-                completed = status.succeeded + status.failed
-                pbar.update(completed - pbar.n)
+        Args:
+            filesystem (Filesystem): Filesystem the jobs write their outputs to.
+            pattern (str): Remote path of a job's output, with "{i}" standing for the job index, e.g. "results/{i}/out.csv".
+            local_dir (str): Path to the local directory, mirroring the remote layout of the outputs.
+            max_workers (int, optional): Maximum number of outputs downloaded at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            min_interval (float, optional): Shortest adaptive interval between polls, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest adaptive interval between polls, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+            progress (bool, optional): Whether each download shows a progress bar for its parts. Off by default, since many downloads run at once. Defaults to False.
+            **download_kwargs: Options passed to `Filesystem.download`.
+
+        Yields:
+            str: Local path of each output, in the order the downloads finish.
+        """
+
+        schedule = PollSchedule(self.n_jobs, min_interval=min_interval, max_interval=max_interval)
+
+        def download(job_index: int) -> str:
+            remote_file, local_file = gather_paths(pattern, job_index, local_dir)
+            filesystem.download(remote_file, local_file, progress=progress, **download_kwargs)
+            return local_file
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = set()
+        try:
+            while True:
+                for change in self.changes():
+                    if change.state == JOB_SUCCEEDED:
+                        pending.add(executor.submit(download, change.job_index))
+
+                finished = self.job_table.n_finished() >= self.n_jobs
+                next_poll = time.monotonic() + (0 if finished else schedule.next_interval(self.job_table.n_finished()))
+
+                # Hand back downloads as they land until the next poll is due
+                while pending:
+                    timeout = None if finished else max(0, next_poll - time.monotonic())
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    if not done:
+                        break
+                    for future in done:
+                        yield future.result()
+
+                if finished:
+                    return
+                time.sleep(max(0, next_poll - time.monotonic()))
+        finally:
+            executor.shutdown(cancel_futures=True)
 
 
     @staticmethod
-    def from_json(base_url: str, batch_json: dict) -> Self:
+    def from_json(base_url: str, batch_json: dict, transport: clients.Transport = None, index: clients.ResourceIndex = None) -> Self:
         """Convert a JSON object to an interactive Batch.
 
         Args:
             base_url (str): Base endpoint for requests.
             batch_json (dict): JSON description of the Batch.
+            transport (clients.Transport, optional): Pooled transport shared with the parent client. Defaults to None.
+            index (clients.ResourceIndex, optional): Index of the parent client. Defaults to None.
 
         Returns:
             Self: A Batch object.
@@ -97,29 +474,213 @@ class Batch(etc.Batch):
             batch_id=base_batch.batch_id, 
             batch_tool=base_batch.batch_tool, 
             n_jobs=base_batch.n_jobs, 
-            batch_hardware=base_batch.batch_hardware
+            batch_hardware=base_batch.batch_hardware,
+            transport=transport,
+            index=index
         )
         return new_batch
 
 
+class GroupStatus:
+    """Aggregate status of a BatchGroup.
+
+    Each of the GROUP_STATUS_FIELDS (`succeeded`, `failed` and `running`) is summed over the member
+    statuses into an attribute of the same name. A field missing from a member status counts as 0.
+    """
+
+    def __init__(self, statuses: list[etc.BatchStatus]) -> None:
+        """Sums the statuses of the batches in a group.
+
+        Args:
+            statuses (list[etc.BatchStatus]): Status of each batch in the group, in order.
+        """
+
+        self.statuses = statuses
+        for field in GROUP_STATUS_FIELDS:
+            setattr(self, field, sum(getattr(status, field, 0) for status in statuses))
+
+
+class BatchGroup:
+    """One logical batch of jobs submitted to The Engine as several Batches.
+
+    Jobs keep their position in the original sweep: job `i` of the group is job `i - offset` of the
+    Batch that holds it, see `locate`.
+    """
+
+    def __init__(self, batches: list[Batch], max_workers: int = DEFAULT_MAX_POLL_WORKERS) -> None:
+        """Creates a group from Batches submitted in order.
+
+        Args:
+            batches (list[Batch]): The member Batches, in submission order.
+            max_workers (int, optional): Maximum number of status requests in flight at once. Defaults to DEFAULT_MAX_POLL_WORKERS.
+        """
+
+        self.batches = list(batches)
+        self.max_workers = max_workers
+
+        self.offsets = []
+        self.n_jobs = 0
+        for batch in self.batches:
+            self.offsets.append(self.n_jobs)
+            self.n_jobs += batch.n_jobs
+
+
+    def __len__(self) -> int:
+        return len(self.batches)
+
+
+    def __iter__(self) -> Iterator[Batch]:
+        return iter(self.batches)
+
+
+    def locate(self, job_index: int) -> tuple[Batch, int]:
+        """Finds the Batch holding a job of the group.
+
+        Args:
+            job_index (int): Position of the job in the submitted sweep.
+
+        Raises:
+            Exception: The index is out of range.
+
+        Returns:
+            tuple[Batch, int]: The Batch holding the job, and the job's index within it.
+        """
+
+        if not 0 <= job_index < self.n_jobs:
+            raise Exception(f"Job index {job_index} out of range for a group of {self.n_jobs} jobs")
+        i = bisect.bisect_right(self.offsets, job_index) - 1
+        return self.batches[i], job_index - self.offsets[i]
+
+
+    def status(self, max_retries: int = clients.DEFAULT_MAX_ATTEMPTS) -> GroupStatus:
+        """Fetches the status of every Batch in the group concurrently.
+
+        Args:
+            max_retries (int, optional): Number of requests to try per Batch before raising an exception. Defaults to clients.DEFAULT_MAX_ATTEMPTS.
+
+        Returns:
+            GroupStatus: The summed status of the group.
+        """
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            statuses = list(executor.map(lambda b: b.status(max_retries=max_retries), self.batches))
+        return GroupStatus(statuses)
+
+
+    def wait(self, interval: int = None, thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL) -> None:
+        """Wait for the group to finish processing.
+
+        Args:
+            interval (int, optional): Fixed number of seconds between status refreshes. If None, the interval adapts to the group's progress, see `PollSchedule`. Defaults to None.
+            thresh (int, optional): Threshold number of jobs across the group to finish waiting, if None then it waits until all jobs finish. Defaults to None.
+            min_interval (float, optional): Shortest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+            max_interval (float, optional): Longest adaptive interval between status refreshes, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        """
+
+        poll_until_finished(self.status, self.n_jobs, interval=interval, thresh=thresh, min_interval=min_interval, max_interval=max_interval)
+
+
+    def delete(self) -> None:
+        """Delete every Batch in the group.
+        * NOTE: This will not cancel any jobs, which will still run and incur costs once deleted.
+        """
+        for batch in self.batches:
+            batch.delete()
+
+
+def as_completed(batches: Iterable[Batch], thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL, max_workers: int = DEFAULT_MAX_POLL_WORKERS) -> Iterator[Batch]:
+    """Watches many batches from one scheduler and yields each as it finishes.
+
+    Every batch gets its own `PollSchedule`, and the batches that are due are polled together on a
+    small thread pool, so watching many batches costs one loop instead of one blocking `wait` each.
+
+    Args:
+        batches (Iterable[Batch]): The batches to watch.
+        thresh (int, optional): Number of finished jobs at which a batch counts as done. If None, each batch waits for all of its jobs. Defaults to None.
+        min_interval (float, optional): Shortest interval between polls of a batch, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+        max_interval (float, optional): Longest interval between polls of a batch, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        max_workers (int, optional): Maximum number of status requests in flight at once. Defaults to DEFAULT_MAX_POLL_WORKERS.
+
+    Yields:
+        Batch: Each batch, in the order they finish.
+    """
+
+    batches = list(batches)
+    schedules = [
+        PollSchedule(b.n_jobs if thresh is None else thresh, min_interval=min_interval, max_interval=max_interval)
+        for b in batches
+    ]
+    due_times = [(time.monotonic(), i) for i in range(len(batches))]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while due_times:
+
+            now = time.monotonic()
+            if due_times[0][0] > now:
+                time.sleep(due_times[0][0] - now)
+                continue
+
+            due = []
+            while due_times and due_times[0][0] <= now:
+                due.append(heapq.heappop(due_times)[1])
+
+            for i, status in zip(due, executor.map(lambda i: batches[i].status(), due)):
+                completed = status.succeeded + status.failed
+                if completed >= schedules[i].thresh:
+                    yield batches[i]
+                else:
+                    polled = time.monotonic()
+                    heapq.heappush(due_times, (polled + schedules[i].next_interval(completed, polled), i))
+
+
+def wait_all(batches: Iterable[Batch], thresh: int = None, min_interval: float = DEFAULT_MIN_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL, max_workers: int = DEFAULT_MAX_POLL_WORKERS, progress: bool = True) -> list[Batch]:
+    """Waits for many batches to finish, see `as_completed`.
+
+    Args:
+        batches (Iterable[Batch]): The batches to wait for.
+        thresh (int, optional): Number of finished jobs at which a batch counts as done. If None, each batch waits for all of its jobs. Defaults to None.
+        min_interval (float, optional): Shortest interval between polls of a batch, in seconds. Defaults to DEFAULT_MIN_POLL_INTERVAL.
+        max_interval (float, optional): Longest interval between polls of a batch, in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        max_workers (int, optional): Maximum number of status requests in flight at once. Defaults to DEFAULT_MAX_POLL_WORKERS.
+        progress (bool, optional): Whether to show a progress bar over the batches. Defaults to True.
+
+    Returns:
+        list[Batch]: The batches, in the order they finished.
+    """
+
+    batches = list(batches)
+    finished = []
+    with tqdm(total=len(batches), unit="batch", disable=not progress) as pbar:
+        for batch in as_completed(batches, thresh=thresh, min_interval=min_interval, max_interval=max_interval, max_workers=max_workers):
+            finished.append(batch)
+            pbar.update(1)
+    return finished
+
+
 class BatchesClient(clients.APIClient):
     """Client for interacting with ET Engine Batches.
     """
     
-    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL) -> None:
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, transport: clients.Transport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS) -> None:
         """Create a new client for interacting with ET Engine Batches.
 
         Args:
             base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            transport (clients.Transport, optional): Pooled transport shared by this client and every Batch it creates. Defaults to the shared default transport.
+            index_ttl (float, optional): Number of seconds `connect` trusts the last batch listing. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
         """
 
-        super().__init__(f"{base_url}/batches")
+        super().__init__(f"{base_url}/batches", transport=transport)
         self.base_url = base_url
+        self.index = clients.ResourceIndex(lambda b: etc.Batch.from_json(b).batch_id, ttl=index_ttl)
 
 
     def connect(self, batch_id: str) -> Batch:
         """Connect to a specific Batch
 
+        The batch is looked up in the client's index, which is only refreshed from the API when it is
+        stale or does not know the ID.
+
         Args:
             batch_id (str): unique ID of the batch
 
@@ -129,11 +690,13 @@ class BatchesClient(clients.APIClient):
         Returns:
             Batch: A new Batch client.
         """
-        batches_list = self.list_batches()
-        for b in batches_list:
-            if b.batch_id == batch_id:
-                return b
-        raise Exception("Batch does not exist")
+        batch_json = self.index.get(resource_id=batch_id)
+        if batch_json is None:
+            self.index.refresh(self.get())
+            batch_json = self.index.find(resource_id=batch_id)
+        if batch_json is None:
+            raise Exception("Batch does not exist")
+        return Batch.from_json(self.base_url, batch_json, transport=self.transport, index=self.index)
 
 
     
@@ -145,11 +708,31 @@ class BatchesClient(clients.APIClient):
         """
 
         batches_list = self.get()
-        return [Batch.from_json(self.base_url, b) for b in batches_list]
+        self.index.refresh(batches_list)
+        return [Batch.from_json(self.base_url, b, transport=self.transport, index=self.index) for b in batches_list]
+
+
+    def iter_batches(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> Iterator[Batch]:
+        """Lazily iterates over the available batches, fetching one page at a time.
+
+        A Batch client is only built for each batch the iteration reaches that passes `where`.
+
+        Args:
+            where (Callable[[dict], bool], optional): Filter applied to each batch's raw JSON description. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of batches requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            Batch: A Batch client for each matching batch.
+        """
+
+        for batch_json in self.iter_resources(where=where, filters=filters, page_size=page_size):
+            yield Batch.from_json(self.base_url, batch_json, transport=self.transport, index=self.index)
 
 
     def clear_batches(self) -> None:
         """Deletes all batches.
         """
         self.delete()
+        self.index.invalidate()
 
@@ -1,407 +1,705 @@
 import os
 import requests
-import json
-import math
-
-import asyncio
 import aiohttp
-import aiofiles
-
-from tqdm import tqdm
+import asyncio
+from . import serialization
+from .instrumentation import Hooks, RequestEvent, NO_HOOKS
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterator
 
 
 MIN_CHUNK_SIZE_BYTES = 8 * 1024 * 1024
 MAX_CHUNK_SIZE_BYTES = 64 * 1024 * 1024
 DEFAULT_BASE_URL = "https://api.exploretech.ai/v1"
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_INDEX_TTL_SECONDS = 60
+DEFAULT_PAGE_SIZE = 500
+PAGE_SIZE_PARAM = "limit"
+PAGE_TOKEN_PARAM = "next_token"
+PAGE_ITEMS_KEY = "items"
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 30
+DEFAULT_RETRY_BUDGET_SECONDS = 300
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class TransientError(Exception):
+    """An error that is expected to go away if the operation is retried.
+    """
 
 
-class APIClient:
-    """Base client for interacting with the ET Engine API
+class RetryPolicy:
+    """Decides whether and when a failed operation is retried.
+
+    Transient failures (connection errors, timeouts, TransientError and the TRANSIENT_STATUS_CODES) are
+    retried with exponential backoff and full jitter, or after the server's `Retry-After` on 429 and
+    503. Anything else is fatal and raised immediately. Non-idempotent requests are only retried when
+    the server rejected them outright (429 or 503). Each operation gets at most `max_attempts` tries
+    and `budget` seconds; once either runs out, the last error is raised.
     """
 
-    def __init__(self, url: str = DEFAULT_BASE_URL) -> None:
-        """Creates a new base client.
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS, base_delay: float = DEFAULT_BASE_DELAY_SECONDS, max_delay: float = DEFAULT_MAX_DELAY_SECONDS, budget: float = DEFAULT_RETRY_BUDGET_SECONDS) -> None:
+        """Creates a new retry policy.
 
         Args:
-            url (str, optional): Base endpoint in URL format. Defaults to DEFAULT_BASE_URL.
+            max_attempts (int, optional): Maximum number of tries per operation, including the first. Defaults to DEFAULT_MAX_ATTEMPTS.
+            base_delay (float, optional): Backoff ceiling after the first failure, in seconds. It doubles on every further failure. Defaults to DEFAULT_BASE_DELAY_SECONDS.
+            max_delay (float, optional): Longest wait between tries, in seconds. Defaults to DEFAULT_MAX_DELAY_SECONDS.
+            budget (float, optional): Total time an operation may spend, including its retries, in seconds. Defaults to DEFAULT_RETRY_BUDGET_SECONDS.
         """
-        self.url = url
 
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
 
-    def request(self, method: str, path: str, headers: dict = {}, params: dict = {}, data: dict = {}) -> dict:
-        """Base method for making a request to the base endpoint.
+
+    def with_max_attempts(self, max_attempts: int) -> "RetryPolicy":
+        """Returns a copy of this policy with a different number of tries.
 
         Args:
-            method (str): HTTP method to make request to. Supported options are ["GET", "POST", "DELETE"].
-            path (str): Resource path appended to the base URL.
-            headers (dict, optional): Key-value pairs of headers to send with the request. Defaults to {}.
-            params (dict, optional): Key-value pairs of query string params to send with the request. Defaults to {}.
-            data (dict, optional): Key-value paris of request body to data to send with the request. Formatted as a JSON-like dictionary. Defaults to {}.
+            max_attempts (int): Maximum number of tries per operation, including the first.
 
         Returns:
-            dict: The response data formatted as a JSON-like dictionary.
+            RetryPolicy: The new policy.
         """
 
-        response = requests.request(
-            method,
-            f"{self.url}{path}",
-            headers=headers,
-            params=params,
-            data=json.dumps(data)
-        )
-        response.raise_for_status()
-        if response.text:
-           return response.json()
-    
+        return RetryPolicy(max_attempts=max_attempts, base_delay=self.base_delay, max_delay=self.max_delay, budget=self.budget)
 
-    def authorized_request(self, method: str, path: str, headers: dict = {}, params: dict = {}, data: dict = {}) -> dict:
-        """Similar to the `request` method, but adds an API key authorization header.
+
+    @staticmethod
+    def status_of(error: BaseException) -> int:
+        """Returns the HTTP status code carried by an error, if any.
 
         Args:
-            method (str): HTTP method to make request to. Supported options are ["GET", "POST", "DELETE"].
-            path (str): Resource path appended to the base URL.
-            headers (dict, optional): Key-value pairs of headers to send with the request. Defaults to {}.
-            params (dict, optional): Key-value pairs of query string params to send with the request. Defaults to {}.
-            data (dict, optional): Key-value paris of request body to data to send with the request. Formatted as a JSON-like dictionary. Defaults to {}.
+            error (BaseException): The error raised by a failed operation.
 
         Returns:
-            dict: The response data formatted as a JSON-like dictionary.
+            int: The HTTP status code, or None.
         """
 
-        headers["Authorization"] = os.environ["ET_ENGINE_API_KEY"]
-        return self.request(method, path, headers=headers, params=params, data=data)
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return error.response.status_code
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status
+        return None
 
 
-    def get(self, path: str = "", params: dict = {}) -> dict:
-        """Performs a GET request with authorization at the specified resource path.
+    def is_transient(self, error: BaseException, idempotent: bool = True) -> bool:
+        """Classifies an error as transient (worth retrying) or fatal.
 
         Args:
-            path (str, optional): Resource path appended to the base URL. Defaults to "".
-            params (dict, optional): Query string params to send with the request. Defaults to {}.
+            error (BaseException): The error raised by a failed operation.
+            idempotent (bool, optional): Whether the operation can safely run more than once. Defaults to True.
 
         Returns:
-            dict: The response data formatted as a JSON-like dictionary.
+            bool: Whether the operation should be retried.
         """
 
-        return self.authorized_request("GET", path, params=params)
-        
+        status = self.status_of(error)
+        if status is not None:
+            if not idempotent:
+                return status in RETRY_AFTER_STATUS_CODES
+            return status in TRANSIENT_STATUS_CODES
+
+        if not idempotent:
+            return False
+        return isinstance(error, (
+            TransientError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            asyncio.TimeoutError,
+            ConnectionError
+        ))
+
+
+    def retry_after(self, error: BaseException) -> float:
+        """Reads the server's requested wait from a 429 or 503 response.
 
-    def post(self, path: str = "", data: dict = {}) -> dict:
-        """Performs a POST request with authorization at the specified resource path.
+        Args:
+            error (BaseException): The error raised by a failed operation.
+
+        Returns:
+            float: Seconds to wait, or None if the server didn't say.
+        """
+
+        if self.status_of(error) not in RETRY_AFTER_STATUS_CODES:
+            return None
+
+        if isinstance(error, requests.exceptions.HTTPError):
+            headers = error.response.headers
+        else:
+            headers = error.headers
+        value = headers.get("Retry-After") if headers is not None else None
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+    def next_delay(self, error: BaseException, attempt: int, deadline: float, idempotent: bool = True) -> float:
+        """Returns how long to wait before retrying a failed operation.
 
         Args:
-            path (str, optional): Resource path appended to the base URL. Defaults to "".
-            data (dict, optional): Request body data to send with the request, in a JSON-like dictionary. Defaults to {}.
+            error (BaseException): The error raised by the failed try.
+            attempt (int): Number of tries made so far.
+            deadline (float): Monotonic time at which the operation's budget runs out.
+            idempotent (bool, optional): Whether the operation can safely run more than once. Defaults to True.
 
         Returns:
-            dict: The response data formatted as a JSON-like dictionary.
+            float: Seconds to wait, or None if the error should be raised instead.
         """
 
-        return self.authorized_request("POST", path, data=data)
-        
+        if attempt >= self.max_attempts or not self.is_transient(error, idempotent=idempotent):
+            return None
+
+        delay = self.retry_after(error)
+        if delay is None:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+        if time.monotonic() + delay > deadline:
+            return None
+        return delay
 
-    def delete(self, path: str = "") -> dict:
-        """Performs a DELETE request with authorization at the specified resource path.
+
+    def call(self, operation: Callable[[], object], idempotent: bool = True) -> object:
+        """Runs an operation, retrying it according to this policy.
 
         Args:
-            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            operation (Callable[[], object]): The operation. It should raise on failure.
+            idempotent (bool, optional): Whether the operation can safely run more than once. Defaults to True.
 
         Returns:
-            dict: The response data formatted as a JSON-like dictionary.
+            object: The operation's result.
         """
 
-        return self.authorized_request("DELETE", path)
-        
+        deadline = time.monotonic() + self.budget
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except Exception as err:
+                attempt += 1
+                delay = self.next_delay(err, attempt, deadline, idempotent=idempotent)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+
+    async def call_async(self, operation: Callable[[], Awaitable], idempotent: bool = True) -> object:
+        """Runs an asynchronous operation, retrying it according to this policy without blocking the event loop.
 
-class MultipartUpload:
-    """Client for handling parallelized multipart uploads to ET Engine.
+        Args:
+            operation (Callable[[], Awaitable]): Returns a new awaitable for each try. It should raise on failure.
+            idempotent (bool, optional): Whether the operation can safely run more than once. Defaults to True.
+
+        Returns:
+            object: The operation's result.
+        """
 
-    NOTE: This needs to be combined with Multipart Download because of duplicate code.
+        deadline = time.monotonic() + self.budget
+        attempt = 0
+        while True:
+            try:
+                return await operation()
+            except Exception as err:
+                attempt += 1
+                delay = self.next_delay(err, attempt, deadline, idempotent=idempotent)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by threads and coroutines.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each acquisition reserves its
+    tokens immediately, possibly driving the bucket negative, and then waits out the debt, so callers
+    are served in order and one large request (e.g. a 64 MiB part) never starves behind small ones.
     """
 
-    def __init__(self, local_file: str, url: str, chunk_size: int = MIN_CHUNK_SIZE_BYTES, timeout: int = 7200) -> None:
-        """Create a new Multipart Upload job.
+    def __init__(self, rate: float, burst: float = None) -> None:
+        """Creates a new, full token bucket.
 
         Args:
-            local_file (str): Valid path the local file to upload.
-            url (str): Full URL of the remote file destination.
-            chunk_size (int, optional): Size of each chunk, in bytes. Defaults to MIN_CHUNK_SIZE_BYTES.
-            timeout (int, optional): Client timeout, in seconds. Defaults to 7200.
+            rate (float): Tokens added per second, e.g. requests or bytes per second.
+            burst (float, optional): Capacity of the bucket. Defaults to one second's worth of tokens, and at least 1.
+
+        Raises:
+            Exception: The rate is not positive.
         """
 
-        self.local_file = local_file
-        self.url = url
+        if rate <= 0:
+            raise Exception("Token bucket rate must be positive")
 
-        self.file_size_bytes = os.stat(local_file).st_size
-        self.num_parts = math.ceil(self.file_size_bytes / chunk_size)
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
 
-        self.chunk_size = chunk_size
-        self.timeout = timeout
-        self.upload_id = None
 
+    def reserve(self, amount: float = 1) -> float:
+        """Takes tokens from the bucket.
 
-    def request_upload(self) -> None:
-        """Initialize the upload with a POST request.
+        Args:
+            amount (float, optional): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: Number of seconds to wait before using them.
         """
 
-        response = requests.post(
-            self.url, 
-            data=json.dumps({
-                'size': self.file_size_bytes
-            }), 
-            headers={
-                'Authorization': os.environ['ET_ENGINE_API_KEY']
-            }
-        )
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
 
-        response.raise_for_status()
-        upload_details = response.json()
-        self.upload_id = upload_details['uploadId']
-        
-    
-    def upload(self) -> None:
-        """Launch the parallelized upload.
+
+    def acquire(self, amount: float = 1) -> None:
+        """Takes tokens from the bucket, sleeping until they are available.
+
+        Args:
+            amount (float, optional): Number of tokens to take. Defaults to 1.
         """
 
-        asyncio.run(self.upload_parts_in_parallel())
-    
+        delay = self.reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
+
+
+    async def acquire_async(self, amount: float = 1) -> None:
+        """Takes tokens from the bucket, waiting until they are available without blocking the event loop.
+
+        Args:
+            amount (float, optional): Number of tokens to take. Defaults to 1.
+        """
+
+        delay = self.reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
-    def complete_upload(self) -> None:
-        """Confirm the upload is complete with a POST request.
+class Transport:
+    """Pooled, keep-alive HTTP transport shared between API clients.
+
+    A single transport holds one `requests.Session`, so every client that shares it reuses open
+    TCP+TLS connections instead of performing a new handshake for each request.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_block: bool = False, retry_policy: RetryPolicy = None, compression: str = None, compress_min_bytes: int = serialization.DEFAULT_COMPRESS_MIN_BYTES, hooks: Hooks = None, request_limiter: TokenBucket = None, bandwidth_limiter: TokenBucket = None) -> None:
+        """Creates a new pooled transport.
+
+        Args:
+            pool_connections (int, optional): Number of distinct hosts to keep connection pools for. Defaults to DEFAULT_POOL_CONNECTIONS.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to DEFAULT_POOL_MAXSIZE.
+            pool_block (bool, optional): Whether to block when the pool is exhausted instead of opening extra connections. Defaults to False.
+            retry_policy (RetryPolicy, optional): Retry policy for every request sent through this transport. Defaults to a new RetryPolicy.
+            compression (str, optional): Compression for API request bodies, "gzip" or "zstd", or None to send them uncompressed. Defaults to None.
+            compress_min_bytes (int, optional): Request bodies smaller than this are sent uncompressed. Defaults to serialization.DEFAULT_COMPRESS_MIN_BYTES.
+            hooks (Hooks, optional): Instrumentation hooks notified of every request and transfer. Defaults to the no-op NO_HOOKS.
+            request_limiter (TokenBucket, optional): Limit on API and control requests per second, one token per attempt. Defaults to None, for no limit.
+            bandwidth_limiter (TokenBucket, optional): Limit on transfer part bytes per second, one token per byte. Defaults to None, for no limit.
 
         Raises:
-            Exception: The upload has not been initialized yet.
+            Exception: The compression is not available.
         """
 
-        if self.upload_id is None:
-            raise Exception("Upload not yet initialized")
-        
-        response = requests.post(
-            self.url,
-            data=json.dumps({
-                'uploadId': self.upload_id,
-                'complete': True
-            }),
-            headers={
-                'Authorization': os.environ['ET_ENGINE_API_KEY']
-            }
+        if compression is not None and compression not in serialization.available_compressions():
+            raise Exception(f"Compression '{compression}' is not available, options are {serialization.available_compressions()}")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self.hooks = hooks if hooks is not None else NO_HOOKS
+        self.request_limiter = request_limiter
+        self.bandwidth_limiter = bandwidth_limiter
+        # Per-request overhead measured on the first part of the latest transfer, see Transfer.observe_rtt
+        self.observed_rtt = None
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
         )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-        response.raise_for_status()
 
-    
-    async def upload_part(self, starting_byte: int, session: aiohttp.ClientSession) -> int:
-        """Uploads one part in a multipart upload.
+    def request(self, method: str, url: str, retry_policy: RetryPolicy = None, **kwargs) -> requests.Response:
+        """Sends a request over a pooled connection, retrying transient failures.
 
         Args:
-            starting_byte (int): Index of the first byte in the part.
-            session (aiohttp.ClientSession): The base asynchronous client session.
+            method (str): HTTP method of the request.
+            url (str): Full URL of the request.
+            retry_policy (RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
+            **kwargs: Additional keyword arguments passed to `requests.Session.request`.
 
         Raises:
-            Exception: The upload has not yet been initialized.
-            Exception: Something went wrong with the upload.
-            Exception: Max retries exceeded.
+            requests.exceptions.HTTPError: The request still failed with a transient status code once its retries ran out.
 
         Returns:
-            int: HTTP status code of the response.
+            requests.Response: The raw HTTP response.
         """
 
-        if self.upload_id is None:
-            raise Exception("Upload not yet initialized")
-
-        async with aiofiles.open(self.local_file, mode='rb') as file:
-
-            await file.seek(starting_byte)
-            chunk = await file.read(self.chunk_size)
-            chunk_length = len(chunk)
-
-            content_range = f"[{self.upload_id}]:{starting_byte}-{starting_byte+chunk_length}"
-
-            headers = {
-                'Authorization': os.environ['ET_ENGINE_API_KEY'],
-                'Content-Range': content_range
-            }
-
-            n_tries = 0
-            while n_tries < 5:
-                try:
-                    async with session.put(self.url, data=chunk, headers=headers) as response:
-                        if not response.ok:
-                            raise Exception(f"Error uploading part: {response.text}")
-                        return response.status
-                except:
-                    n_tries += 1
-            raise Exception("Max retries exceeded")
-                            
-        
-    async def upload_parts_in_parallel(self) -> list[int]:
-        """Creates the parallelized upload tasks and defines how they run, but does not execute them.
+        policy = retry_policy if retry_policy is not None else self.retry_policy
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempts = 0
+
+        def send() -> requests.Response:
+            nonlocal attempts
+            attempts += 1
+            if self.request_limiter is not None:
+                self.request_limiter.acquire()
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code in TRANSIENT_STATUS_CODES:
+                response.raise_for_status()
+            return response
+
+        bytes_sent = len(kwargs.get("data") or b"")
+        start = time.monotonic()
+        try:
+            response = policy.call(send, idempotent=idempotent)
+        except Exception as err:
+            self.hooks.on_request(RequestEvent(method, url, policy.status_of(err), time.monotonic() - start, attempts, bytes_sent, 0, err))
+            raise
+        self.hooks.on_request(RequestEvent(method, url, response.status_code, time.monotonic() - start, attempts, bytes_sent, len(response.content)))
+        return response
+
+
+    def close(self) -> None:
+        """Closes all pooled connections.
+        """
+
+        self.session.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def page_items(page: list | dict) -> tuple[list[dict], str]:
+    """Splits one page of a listing into its items and the token of the next page.
+
+    Paginated listings are objects holding the page under PAGE_ITEMS_KEY and the token of the next
+    page under PAGE_TOKEN_PARAM. A plain JSON list is an unpaginated listing, and so the only page.
+
+    Args:
+        page (list | dict): A decoded listing response.
+
+    Returns:
+        tuple[list[dict], str]: The items on the page, and the token of the next page or None if it is the last.
+    """
+
+    if page is None:
+        return [], None
+    if isinstance(page, list):
+        return page, None
+    return page.get(PAGE_ITEMS_KEY, []), page.get(PAGE_TOKEN_PARAM)
+
+
+def default_transport() -> Transport:
+    """Returns the process-wide transport used by clients created without an explicit transport.
+
+    Returns:
+        Transport: The shared default transport.
+    """
+
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+class ResourceIndex:
+    """Name and ID index over a resource listing, so lookups don't re-download the whole account.
+
+    Entries are kept as raw JSON and only turned into interactive objects when they are returned.
+    The index goes stale after `ttl` seconds, and is updated explicitly when resources are created
+    or deleted through the clients that share it.
+    """
+
+    def __init__(self, id_of: Callable[[dict], str], name_of: Callable[[dict], str] = None, ttl: float = DEFAULT_INDEX_TTL_SECONDS) -> None:
+        """Creates a new, empty resource index.
+
+        Args:
+            id_of (Callable[[dict], str]): Returns the unique ID of a resource from its JSON description.
+            name_of (Callable[[dict], str], optional): Returns the unique name of a resource from its JSON description, if resources have one. Defaults to None.
+            ttl (float, optional): Number of seconds a listing stays fresh. Set to 0 to disable caching. Defaults to DEFAULT_INDEX_TTL_SECONDS.
+        """
+
+        self.id_of = id_of
+        self.name_of = name_of
+        self.ttl = ttl
+
+        self.by_id = {}
+        self.by_name = {}
+        self.loaded_at = None
+        self.lock = threading.Lock()
+
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the index holds a listing younger than its TTL.
+        """
+
+        return self.loaded_at is not None and time.monotonic() - self.loaded_at < self.ttl
+
+
+    def refresh(self, resources: list[dict]) -> None:
+        """Replaces the index with a complete listing.
+
+        Args:
+            resources (list[dict]): JSON descriptions of every resource.
+        """
+
+        by_id = {}
+        by_name = {}
+        for resource in resources:
+            by_id[self.id_of(resource)] = resource
+            if self.name_of is not None:
+                by_name[self.name_of(resource)] = resource
+
+        with self.lock:
+            self.by_id = by_id
+            self.by_name = by_name
+            self.loaded_at = time.monotonic()
+
+
+    def get(self, resource_id: str = None, name: str = None) -> dict:
+        """Looks a resource up by ID or by name, if the index is fresh.
+
+        Args:
+            resource_id (str, optional): Unique ID of the resource. Defaults to None.
+            name (str, optional): Unique name of the resource. Defaults to None.
 
         Returns:
-            list[int]: A list of HTTP status codes.
+            dict: JSON description of the resource, or None if it is not indexed or the index is stale.
         """
 
-        connector = aiohttp.TCPConnector(limit=5)
-        client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        if not self.fresh:
+            return None
+        return self.find(resource_id=resource_id, name=name)
 
-        async with aiohttp.ClientSession(timeout=client_timeout, connector=connector) as session:
-            upload_part_tasks = set()
-            for starting_byte in range(0, self.file_size_bytes, self.chunk_size):
-                task = asyncio.create_task(
-                    self.upload_part(starting_byte, session)
-                )
-                upload_part_tasks.add(task)
 
-            parts = []
-            for task in tqdm(asyncio.as_completed(upload_part_tasks), desc=f"[{self.file_size_bytes / 1024 / 1024 // 1} MB] {self.local_file}", total=len(upload_part_tasks)):
-                part_status = await task
-                parts.append(part_status)
+    def find(self, resource_id: str = None, name: str = None) -> dict:
+        """Looks a resource up by ID or by name, however old the index is.
 
-            return parts
-        
-    
-class MultipartDownload:
-    """Client for handling parallelized multipart downloads to ET Engine.
+        Args:
+            resource_id (str, optional): Unique ID of the resource. Defaults to None.
+            name (str, optional): Unique name of the resource. Defaults to None.
+
+        Returns:
+            dict: JSON description of the resource, or None if it is not indexed.
+        """
+
+        if resource_id is not None:
+            return self.by_id.get(resource_id)
+        return self.by_name.get(name)
 
-    NOTE: This needs to be combined with Multipart Upload because of duplicate code.
-    """
 
-    def __init__(self, local_file: str, url: str, chunk_size: int = MIN_CHUNK_SIZE_BYTES, timeout: int = 7200) -> None:
-        """Create a new Multipart Download job.
+    def put(self, resource: dict) -> None:
+        """Adds or replaces a single resource, e.g. after creating it.
 
         Args:
-            local_file (str): Valid path the local file to upload.
-            url (str): Full URL of the remote file source.
-            chunk_size (int, optional): Size of each chunk, in bytes. Defaults to MIN_CHUNK_SIZE_BYTES.
-            timeout (int, optional): Client timeout, in seconds. Defaults to 7200.
+            resource (dict): JSON description of the resource.
         """
-        self.local_file = local_file
-        self.url = url
 
-        self.file_size_bytes = None
-        self.num_parts = None
-        self.download_id = None
-        self.chunk_size = chunk_size
+        with self.lock:
+            self.by_id[self.id_of(resource)] = resource
+            if self.name_of is not None:
+                self.by_name[self.name_of(resource)] = resource
 
-        self.timeout = timeout
 
-        
-    def request_download(self) -> None:
-        """Initialize the download with a GET request.
+    def discard(self, resource_id: str) -> None:
+        """Removes a single resource, e.g. after deleting it.
+
+        Args:
+            resource_id (str): Unique ID of the resource.
         """
 
-        response = requests.get(
-            self.url,
-            params={
-                "init": True
-            },
-            headers={
-                'Authorization': os.environ['ET_ENGINE_API_KEY']
-            }
-        )
-        if not response.ok:
-            raise Exception(response.text)
-    
-        download_info = response.json()
-        self.file_size_bytes = download_info['size']
-        self.download_id = download_info['download_id']
-        self.num_parts = math.ceil(self.file_size_bytes / self.chunk_size)
+        with self.lock:
+            resource = self.by_id.pop(resource_id, None)
+            if resource is not None and self.name_of is not None:
+                self.by_name.pop(self.name_of(resource), None)
 
-        self.initialize_file()
 
+    def invalidate(self) -> None:
+        """Marks the whole index stale, so the next lookup fetches a new listing.
+        """
 
-    def initialize_file(self) -> None:
-        """Creates a local file to be filled in parts during the download.
+        with self.lock:
+            self.by_id = {}
+            self.by_name = {}
+            self.loaded_at = None
 
-        Raises:
-            Exception: The download has not been initialized.
+
+class APIClient:
+    """Base client for interacting with the ET Engine API
+    """
+
+    def __init__(self, url: str = DEFAULT_BASE_URL, transport: Transport = None) -> None:
+        """Creates a new base client.
+
+        Args:
+            url (str, optional): Base endpoint in URL format. Defaults to DEFAULT_BASE_URL.
+            transport (Transport, optional): Pooled transport to send requests through. Defaults to the shared default transport.
         """
+        self.url = url
+        self.transport = transport if transport is not None else default_transport()
 
-        if self.file_size_bytes is None or self.download_id is None or self.num_parts is None:
-            raise Exception("Download not yet initialized")
-        
-        destination = f"{self.local_file}.{self.download_id}"
-        with open(destination, "wb") as f:
-            f.seek(self.file_size_bytes - 1)
-            f.write(b'\0')
 
+    def request(self, method: str, path: str, headers: dict = {}, params: dict = {}, data: dict = {}, retry_policy: RetryPolicy = None) -> dict:
+        """Base method for making a request to the base endpoint.
+
+        Args:
+            method (str): HTTP method to make request to. Supported options are ["GET", "POST", "DELETE"].
+            path (str): Resource path appended to the base URL.
+            headers (dict, optional): Key-value pairs of headers to send with the request. Defaults to {}.
+            params (dict, optional): Key-value pairs of query string params to send with the request. Defaults to {}.
+            data (dict, optional): Key-value paris of request body to data to send with the request. Formatted as a JSON-like dictionary. Defaults to {}.
+            retry_policy (RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
 
-    def download(self) -> None:
-        """Launch the paralellized download.
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
         """
 
-        asyncio.run(self.download_parts_in_parallel())
+        body, encoding_headers = serialization.encode_body(data, self.transport.compression, self.transport.compress_min_bytes)
+        response = self.transport.request(
+            method,
+            f"{self.url}{path}",
+            retry_policy=retry_policy,
+            headers={**headers, **encoding_headers},
+            params=params,
+            data=body
+        )
+        response.raise_for_status()
+        if response.content:
+           return serialization.loads(response.content)
+    
 
+    def authorized_request(self, method: str, path: str, headers: dict = {}, params: dict = {}, data: dict = {}, retry_policy: RetryPolicy = None) -> dict:
+        """Similar to the `request` method, but adds an API key authorization header.
 
-    def complete_download(self) -> None:
-        """Complete the download by renaming the temporary file
+        Args:
+            method (str): HTTP method to make request to. Supported options are ["GET", "POST", "DELETE"].
+            path (str): Resource path appended to the base URL.
+            headers (dict, optional): Key-value pairs of headers to send with the request. Defaults to {}.
+            params (dict, optional): Key-value pairs of query string params to send with the request. Defaults to {}.
+            data (dict, optional): Key-value paris of request body to data to send with the request. Formatted as a JSON-like dictionary. Defaults to {}.
+            retry_policy (RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
+
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
         """
-        
-        destination = f"{self.local_file}.{self.download_id}"
-        os.rename(destination, self.local_file)
 
+        headers["Authorization"] = os.environ["ET_ENGINE_API_KEY"]
+        return self.request(method, path, headers=headers, params=params, data=data, retry_policy=retry_policy)
 
-    async def download_part(self, starting_byte: int, session: aiohttp.ClientSession) -> int:
-        """Downloads one part in the multipart download.
+
+    def get(self, path: str = "", params: dict = {}, retry_policy: RetryPolicy = None) -> dict:
+        """Performs a GET request with authorization at the specified resource path.
 
         Args:
-            starting_byte (int): Index of the first byte in the part.
-            session (aiohttp.ClientSession): The base asynchronous client session.
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            params (dict, optional): Query string params to send with the request. Defaults to {}.
+            retry_policy (RetryPolicy, optional): Retry policy for this request. Defaults to the transport's policy.
 
-        Raises:
-            Exception: Something went wrong with the upload.
-            Exception: Max retries exceeded.
+        Returns:
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        return self.authorized_request("GET", path, params=params, retry_policy=retry_policy)
+        
+
+    def post(self, path: str = "", data: dict = {}) -> dict:
+        """Performs a POST request with authorization at the specified resource path.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            data (dict, optional): Request body data to send with the request, in a JSON-like dictionary. Defaults to {}.
 
         Returns:
-            int: HTTP status code of the response.
+            dict: The response data formatted as a JSON-like dictionary.
         """
 
-        destination = f"{self.local_file}.{self.download_id}"
-        async with aiofiles.open(destination, mode='r+b') as f:
-
-            await f.seek(starting_byte, 0)
-            content_range = f"{starting_byte}-{starting_byte+self.chunk_size}"
-
-            headers = {
-                'Authorization': os.environ['ET_ENGINE_API_KEY'],
-                'Content-Range': content_range
-            }
-
-            n_tries = 0
-            while n_tries < 1:
-                try:
-                    async with session.get(self.url, headers=headers) as response:
-                        if not response.ok:
-                            raise Exception(f"Error uploading part: {response.text}")
-                        
-                        await f.write(await response.content.read())
-                        return response.status
-                except:
-                    n_tries += 1
-            raise Exception("Max retries exceeded")
-                            
+        return self.authorized_request("POST", path, data=data)
         
-    async def download_parts_in_parallel(self) -> list[int]:
-        """Creates the parallelized download tasks and defines how they run, but does not execute them.
+
+    def delete(self, path: str = "") -> dict:
+        """Performs a DELETE request with authorization at the specified resource path.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
 
         Returns:
-            list[int]: A list of HTTP status codes.
+            dict: The response data formatted as a JSON-like dictionary.
+        """
+
+        return self.authorized_request("DELETE", path)
+
+
+    def iter_pages(self, path: str = "", params: dict = {}, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[list[dict]]:
+        """Lazily fetches a listing one page at a time, see `page_items`.
+
+        Args:
+            path (str, optional): Resource path appended to the base URL. Defaults to "".
+            params (dict, optional): Query string params to send with every page request, e.g. server-side filters. Defaults to {}.
+            page_size (int, optional): Number of items requested per page. Defaults to DEFAULT_PAGE_SIZE.
+
+        Yields:
+            list[dict]: The JSON descriptions on each page.
         """
 
-        connector = aiohttp.TCPConnector(limit=5)
-        client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        params = {**params, PAGE_SIZE_PARAM: page_size}
+        while True:
+            items, next_token = page_items(self.get(path, params=params))
+            yield items
+            if not next_token:
+                return
+            params[PAGE_TOKEN_PARAM] = next_token
+
 
-        async with aiohttp.ClientSession(timeout=client_timeout, connector=connector) as session:
-            download_part_tasks = set()
-            for starting_byte in range(0, self.file_size_bytes, self.chunk_size):
-                task = asyncio.create_task(
-                    self.download_part(starting_byte, session)
-                )
-                download_part_tasks.add(task)
+    def iter_resources(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[dict]:
+        """Lazily iterates over the raw JSON descriptions of a resource listing.
 
-            parts = []
-            for task in tqdm(asyncio.as_completed(download_part_tasks), desc=f"[{self.file_size_bytes / 1024 / 1024 // 1} MB] {self.local_file}", total=len(download_part_tasks)):
-                part_status = await task
-                parts.append(part_status)
+        Args:
+            where (Callable[[dict], bool], optional): Client-side filter applied to each raw JSON description before anything is built from it. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API, for servers that filter listings. Defaults to {}.
+            page_size (int, optional): Number of items requested per page. Defaults to DEFAULT_PAGE_SIZE.
+
+        Yields:
+            dict: Each matching JSON description.
+        """
 
-            return parts
\ No newline at end of file
+        for page in self.iter_pages(params=filters, page_size=page_size):
+            for resource in page:
+                if where is None or where(resource):
+                    yield resource
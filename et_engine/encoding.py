@@ -0,0 +1,175 @@
+import sys
+import base64
+import binascii
+from array import array
+
+
+# Encoded arrays are plain strings, so they travel through the batch request JSON and the job's
+# environment variables unchanged: "etarray:<dtype>:<shape>:<base64 little-endian bytes>", where
+# dtype is a NumPy-style type string (e.g. "<f8") and shape is comma-separated (e.g. "100,3").
+ARRAY_PREFIX = "etarray:"
+
+# Linux caps each environment variable ("name=value") at MAX_ARG_STRLEN, 128 KiB, so an encoded array
+# must stay below it with room for the name. That is about 95 KiB of array data.
+MAX_ENCODED_BYTES = 127 * 1024
+
+# array typecodes by NumPy-style kind and item size. The sizes of C types vary by platform, so the
+# table is built from the typecodes available here.
+_TYPECODES = {}
+for _typecode in "bBhHiIlLqQfd":
+    _kind = "f" if _typecode in "fd" else ("u" if _typecode.isupper() else "i")
+    _TYPECODES.setdefault((_kind, array(_typecode).itemsize), _typecode)
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def dtype_of(typecode: str) -> str:
+    """Converts an `array` typecode to a little-endian NumPy-style type string.
+
+    Args:
+        typecode (str): The `array` typecode, e.g. "d".
+
+    Returns:
+        str: The type string, e.g. "<f8".
+    """
+
+    kind = "f" if typecode in "fd" else ("u" if typecode.isupper() else "i")
+    return f"<{kind}{array(typecode).itemsize}"
+
+
+def typecode_of(dtype: str) -> str:
+    """Converts a NumPy-style type string to the matching `array` typecode.
+
+    Args:
+        dtype (str): The type string, e.g. "<f8" or "|u1".
+
+    Raises:
+        Exception: No `array` typecode holds this type.
+
+    Returns:
+        str: The typecode, e.g. "d".
+    """
+
+    # Booleans decode to unsigned bytes.
+    kind = "u" if dtype[1:2] == "b" else dtype[1:2]
+    try:
+        return _TYPECODES[(kind, int(dtype[2:]))]
+    except (KeyError, IndexError, ValueError):
+        raise Exception(f"Unsupported array dtype '{dtype}'")
+
+
+def is_array(value: object) -> bool:
+    """Checks whether a value is a numeric array that `encode_array` can encode.
+
+    Args:
+        value (object): Any value.
+
+    Returns:
+        bool: True for an `array.array`, or a NumPy array of booleans, integers or floats.
+    """
+
+    if isinstance(value, array):
+        return value.typecode != "u"
+    dtype = getattr(value, "dtype", None)
+    return dtype is not None and hasattr(value, "tobytes") and getattr(dtype, "kind", None) in ("b", "i", "u", "f")
+
+
+def is_encoded(value: object) -> bool:
+    """Checks whether a value is an array encoded by `encode_array`.
+
+    Args:
+        value (object): Any value.
+
+    Returns:
+        bool: True if the value is an encoded array string.
+    """
+
+    return isinstance(value, str) and value.startswith(ARRAY_PREFIX)
+
+
+def encode_array(value: object) -> str:
+    """Encodes a numeric array as a compact string, about 1.4 bytes of text per byte of data.
+
+    Args:
+        value (object): An `array.array` or a NumPy array. NumPy arrays of any shape are encoded in C order.
+
+    Raises:
+        Exception: The value is not a numeric array, or its encoding is longer than MAX_ENCODED_BYTES.
+
+    Returns:
+        str: The encoded array.
+    """
+
+    if isinstance(value, array) and value.typecode != "u":
+        dtype = dtype_of(value.typecode)
+        shape = str(len(value))
+        if _BIG_ENDIAN:
+            value = array(value.typecode, value)
+            value.byteswap()
+        data = value.tobytes()
+
+    elif is_array(value):
+        little_endian = value.dtype.newbyteorder("<")
+        dtype = little_endian.str
+        shape = ",".join(str(n) for n in value.shape)
+        data = value.astype(little_endian, copy=False).tobytes()
+
+    else:
+        raise Exception(f"Cannot encode {type(value).__name__} as an array")
+
+    header = f"{ARRAY_PREFIX}{dtype}:{shape}:"
+    encoded_bytes = len(header) + 4 * ((len(data) + 2) // 3)
+    if encoded_bytes > MAX_ENCODED_BYTES:
+        raise Exception(
+            f"Encoded array of {len(data)} bytes would be {encoded_bytes} bytes, over the {MAX_ENCODED_BYTES} byte limit of a job argument. "
+            "Upload large arrays to a filesystem and pass their path instead"
+        )
+
+    return f"{header}{base64.b64encode(data).decode('ascii')}"
+
+
+def decode_array(value: str, numpy: bool = False) -> object:
+    """Decodes an array encoded by `encode_array`.
+
+    Args:
+        value (str): The encoded array.
+        numpy (bool, optional): Whether to return a NumPy array with the original dtype and shape, instead of a flat `array.array`. Defaults to False.
+
+    Raises:
+        Exception: The value is not a valid encoded array.
+
+    Returns:
+        object: The decoded `array.array`, or NumPy array if `numpy` is True.
+    """
+
+    try:
+        _, dtype, shape, data = value.split(":", 3)
+        shape = tuple(int(n) for n in shape.split(",")) if shape else ()
+        data = base64.b64decode(data, validate=True)
+    except (ValueError, binascii.Error) as e:
+        raise Exception(f"Invalid encoded array: {e}")
+
+    if numpy:
+        import numpy as np
+        return np.frombuffer(bytearray(data), dtype=dtype).reshape(shape)
+
+    decoded = array(typecode_of(dtype))
+    decoded.frombytes(data)
+    if _BIG_ENDIAN:
+        decoded.byteswap()
+    return decoded
+
+
+def encode_arrays(kwargs: dict) -> dict:
+    """Encodes every array among a job's arguments, leaving other values unchanged.
+
+    Args:
+        kwargs (dict): Key-value arguments of a job.
+
+    Returns:
+        dict: The arguments, with arrays replaced by their `encode_array` strings. `kwargs` itself is returned when it holds no arrays.
+    """
+
+    if not any(is_array(value) for value in kwargs.values()):
+        return kwargs
+    return {key: encode_array(value) if is_array(value) else value for key, value in kwargs.items()}
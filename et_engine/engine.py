@@ -1,19 +1,49 @@
-from .clients import DEFAULT_BASE_URL
-from .tools import ToolsClient
+from .clients import DEFAULT_BASE_URL, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_INDEX_TTL_SECONDS, RetryPolicy, TokenBucket, Transport
+from .tool_clients import ToolsClient
 from .filesystems import FilesystemsClient
 from .batches import BatchesClient
+from .instrumentation import Hooks
 
 
 class Engine:
     """Main client for interacting with the ET Engine.
     """
 
-    def __init__(self, base_url: str = DEFAULT_BASE_URL) -> None:
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, transport: Transport = None, index_ttl: float = DEFAULT_INDEX_TTL_SECONDS, retry_policy: RetryPolicy = None, compression: str = None, hooks: Hooks = None, requests_per_second: float = None, bytes_per_second: float = None) -> None:
         """Create a new Engine client.
 
+        All sub-clients, and every Filesystem, Tool and Batch they create, share a single pooled transport.
+
         Args:
             base_url (str, optional): Base endpoint for requests. Defaults to DEFAULT_BASE_URL.
+            pool_connections (int, optional): Number of distinct hosts to keep connection pools for. Defaults to DEFAULT_POOL_CONNECTIONS.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to DEFAULT_POOL_MAXSIZE.
+            transport (Transport, optional): An existing transport to share. If given, the pool sizes are ignored. Defaults to None.
+            index_ttl (float, optional): Number of seconds each sub-client trusts its last resource listing when connecting. Defaults to DEFAULT_INDEX_TTL_SECONDS.
+            retry_policy (RetryPolicy, optional): Retry policy for every request. Ignored if `transport` is given. Defaults to a new RetryPolicy.
+            compression (str, optional): Compression for API request bodies, "gzip" or "zstd", or None to send them uncompressed. Ignored if `transport` is given. Defaults to None.
+            hooks (Hooks, optional): Instrumentation hooks notified of every request, transfer part and transfer. Ignored if `transport` is given. Defaults to no-op hooks.
+            requests_per_second (float, optional): Limit on API and control requests per second, shared by every thread using this Engine. Ignored if `transport` is given. Defaults to None, for no limit.
+            bytes_per_second (float, optional): Limit on transfer bytes per second, shared by every transfer started from this Engine. Ignored if `transport` is given. Defaults to None, for no limit.
+        """
+        if transport is None:
+            transport = Transport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                retry_policy=retry_policy,
+                compression=compression,
+                hooks=hooks,
+                request_limiter=TokenBucket(requests_per_second) if requests_per_second else None,
+                bandwidth_limiter=TokenBucket(bytes_per_second) if bytes_per_second else None
+            )
+        self.transport = transport
+
+        self.filesystems = FilesystemsClient(base_url, transport=transport, index_ttl=index_ttl)
+        self.tools = ToolsClient(base_url, transport=transport, index_ttl=index_ttl)
+        self.batches = BatchesClient(base_url, transport=transport, index_ttl=index_ttl)
+
+
+    def close(self) -> None:
+        """Closes the pooled connections held by this Engine.
         """
-        self.filesystems = FilesystemsClient(base_url)
-        self.tools = ToolsClient(base_url)
-        self.batches = BatchesClient(base_url)
+        self.transport.close()
@@ -1,55 +1,414 @@
+import os
+import base64
+import hashlib
+import posixpath
+import shutil
+import tempfile
+import asyncio
 import requests
-from typing import Self
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Self
 
 import et_engine_core as etc
 from . import clients
+from . import transfers
+from . import packing
+
+
+SYNC_UPLOAD = "upload"
+SYNC_DOWNLOAD = "download"
+SYNC_COMPARISONS = ("exists", "size", "mtime", "hash")
+
+
+def scan_local(local_dir: str) -> dict[str, dict]:
+    """Recursively lists the files in a local directory with `os.scandir`.
+
+    Transfer manifests and other hidden bookkeeping files are skipped.
+
+    Args:
+        local_dir (str): Path to the local directory.
+
+    Returns:
+        dict[str, dict]: Maps each file's "/"-separated path relative to `local_dir` to its "size" and "mtime".
+    """
+
+    files = {}
+    if not os.path.isdir(local_dir):
+        return files
+
+    pending = [""]
+    while pending:
+        relative_dir = pending.pop()
+        with os.scandir(os.path.join(local_dir, relative_dir)) as entries:
+            for entry in entries:
+                relative_path = posixpath.join(relative_dir, entry.name) if relative_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(relative_path)
+                elif entry.is_file() and not entry.name.endswith(transfers.MANIFEST_SUFFIX):
+                    stat = entry.stat()
+                    files[relative_path] = {"size": stat.st_size, "mtime": stat.st_mtime}
+    return files
+
+
+def parse_remote_entry(entry: str | dict) -> tuple[str, dict]:
+    """Normalizes one entry of an `ls` listing.
+
+    Entries may be plain names or JSON objects; in the latter case the optional "size", "mtime"
+    (or "modified", as epoch seconds or an ISO-8601 string) and "sha256" fields are kept.
+
+    Args:
+        entry (str | dict): A file or directory entry returned by `ls`.
+
+    Returns:
+        tuple[str, dict]: The entry's base name and its known metadata.
+    """
+
+    if not isinstance(entry, dict):
+        return posixpath.basename(str(entry).rstrip("/")), {}
+
+    name = posixpath.basename(str(entry.get("name", entry.get("path", ""))).rstrip("/"))
+    mtime = entry.get("mtime", entry.get("modified"))
+    if isinstance(mtime, str):
+        try:
+            mtime = datetime.fromisoformat(mtime.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            mtime = None
+
+    return name, {"size": entry.get("size"), "mtime": mtime, "sha256": entry.get("sha256")}
+
+
+def local_checksum(local_file: str) -> str:
+    """Computes the whole-file SHA-256 of a local file, as a base64 string.
+
+    Args:
+        local_file (str): Path to the local file.
+
+    Returns:
+        str: The base64-encoded digest.
+    """
+
+    with open(local_file, "rb") as f:
+        return base64.b64encode(hashlib.file_digest(f, "sha256").digest()).decode()
+
+
+def needs_sync(source: dict, destination: dict, compare: str) -> bool:
+    """Decides whether a file must be copied from source to destination.
+
+    Unknown metadata on either side is treated as a difference, so files are only skipped when they
+    are known to match.
+
+    Args:
+        source (dict): Metadata of the source file.
+        destination (dict): Metadata of the destination file, or None if it does not exist.
+        compare (str): Comparison mode, one of SYNC_COMPARISONS.
+
+    Returns:
+        bool: Whether the file must be transferred.
+    """
+
+    if destination is None:
+        return True
+    if compare == "exists":
+        return False
+    if source.get("size") is None or source.get("size") != destination.get("size"):
+        return True
+    if compare == "mtime":
+        return source.get("mtime") is None or destination.get("mtime") is None or source["mtime"] > destination["mtime"]
+    if compare == "hash":
+        return source.get("sha256") is None or source.get("sha256") != destination.get("sha256")
+    return False
+
+
+def plan_sync(local_files: dict[str, dict], remote_files: dict[str, dict], local_dir: str, direction: str, compare: str) -> list[str]:
+    """Lists the relative paths that differ between the local and remote trees.
+
+    Args:
+        local_files (dict[str, dict]): Local files, as returned by `scan_local`.
+        remote_files (dict[str, dict]): Remote files, keyed by the same relative paths.
+        local_dir (str): Path to the local directory, used to hash files when `compare` is "hash".
+        direction (str): Either SYNC_UPLOAD or SYNC_DOWNLOAD.
+        compare (str): Comparison mode, one of SYNC_COMPARISONS.
+
+    Raises:
+        Exception: Invalid direction or comparison mode.
+
+    Returns:
+        list[str]: Relative paths of the files to transfer.
+    """
+
+    if direction not in (SYNC_UPLOAD, SYNC_DOWNLOAD):
+        raise Exception(f"Invalid sync direction '{direction}', options are {(SYNC_UPLOAD, SYNC_DOWNLOAD)}")
+    if compare not in SYNC_COMPARISONS:
+        raise Exception(f"Invalid sync comparison '{compare}', options are {SYNC_COMPARISONS}")
+
+    source, destination = (local_files, remote_files) if direction == SYNC_UPLOAD else (remote_files, local_files)
+
+    if compare == "hash":
+        candidates = [p for p in local_files if p in remote_files and local_files[p]["size"] == remote_files[p].get("size")]
+        with ThreadPoolExecutor() as executor:
+            digests = executor.map(local_checksum, (os.path.join(local_dir, p) for p in candidates))
+            for relative_path, digest in zip(candidates, digests):
+                local_files[relative_path]["sha256"] = digest
+
+    return sorted(p for p, info in source.items() if needs_sync(info, destination.get(p), compare))
+
+
+def directories_to_create(remote_dir: str, relative_paths: Iterable[str], remote_directories: set[str], remote_dir_exists: bool) -> list[str]:
+    """Lists the remote directories needed to hold some files, ancestors first, so they can be created in order.
+
+    Args:
+        remote_dir (str): Path to the remote directory the files are relative to.
+        relative_paths (Iterable[str]): "/"-separated paths of the files, relative to `remote_dir`.
+        remote_directories (set[str]): Directories known to exist under `remote_dir`, relative to it.
+        remote_dir_exists (bool): Whether `remote_dir` itself is known to exist. If not, it and its ancestors are included.
+
+    Returns:
+        list[str]: Full paths of the directories to create, starting from the filesystem root, parents before children.
+    """
+
+    remote_dir = remote_dir.strip("/")
+    missing = set()
+    if remote_dir and not remote_dir_exists:
+        parts = remote_dir.split("/")
+        missing |= {"/".join(parts[:depth]) for depth in range(1, len(parts) + 1)}
+
+    for relative_path in relative_paths:
+        parts = posixpath.dirname(relative_path).split("/")
+        for depth in range(1, len(parts) + 1):
+            directory = "/".join(parts[:depth])
+            if directory and directory not in remote_directories:
+                missing.add(posixpath.join(remote_dir, directory))
+
+    # A parent's path is a prefix of its children's, so it sorts first
+    return sorted(missing)
+
+
+def set_local_mtimes(local_dir: str, remote_files: dict[str, dict], relative_paths: list[str]) -> None:
+    """Copies known remote modification times onto downloaded files, so later "mtime" syncs see them as unchanged.
+
+    Args:
+        local_dir (str): Path to the local directory.
+        remote_files (dict[str, dict]): Remote files with their known metadata.
+        relative_paths (list[str]): Relative paths of the downloaded files.
+    """
+
+    for relative_path in relative_paths:
+        mtime = remote_files[relative_path].get("mtime")
+        if mtime is not None:
+            os.utime(os.path.join(local_dir, *relative_path.split("/")), (mtime, mtime))
+
+
+def add_listings(listings: Iterable[tuple[str, dict]], files: dict[str, dict], directories: set[str]) -> list[str]:
+    """Adds one level of a remote walk to its files and directories.
+
+    Args:
+        listings (Iterable[tuple[str, dict]]): Each listed directory, relative to the walked path, with its `ls` listing (None or {} if it does not exist).
+        files (dict[str, dict]): Files found so far, keyed by relative path, updated in place.
+        directories (set[str]): Relative directory paths found so far, updated in place.
+
+    Returns:
+        list[str]: Relative paths of the subdirectories to list on the next level.
+    """
+
+    next_level = []
+    for relative_dir, listing in listings:
+        listing = listing or {}
+        for entry in listing.get("files", []):
+            name, info = parse_remote_entry(entry)
+            files[posixpath.join(relative_dir, name) if relative_dir else name] = info
+        for entry in listing.get("directories", []):
+            name, _ = parse_remote_entry(entry)
+            relative_path = posixpath.join(relative_dir, name) if relative_dir else name
+            directories.add(relative_path)
+            next_level.append(relative_path)
+    return next_level
+
+
+def prepare_sync(local_dir: str, remote_dir: str, remote_files: dict[str, dict], remote_directories: set[str], direction: str, compare: str) -> tuple[list[str], list[str]]:
+    """Scans the local tree and plans a sync against a walked remote tree.
+
+    Args:
+        local_dir (str): Path to the local directory.
+        remote_dir (str): Path to the remote directory.
+        remote_files (dict[str, dict]): Remote files, as returned by `Filesystem.walk`.
+        remote_directories (set[str]): Remote directories, as returned by `Filesystem.walk`.
+        direction (str): Either SYNC_UPLOAD or SYNC_DOWNLOAD.
+        compare (str): Comparison mode, one of SYNC_COMPARISONS.
+
+    Returns:
+        tuple[list[str], list[str]]: Relative paths of the files to transfer, and the remote directories to create first, parents before children.
+    """
+
+    relative_paths = plan_sync(scan_local(local_dir), remote_files, local_dir, direction, compare)
+    if direction != SYNC_UPLOAD or not relative_paths:
+        return relative_paths, []
+    return relative_paths, directories_to_create(remote_dir, relative_paths, remote_directories, bool(remote_files or remote_directories))
+
+
+def sync_transfers(url: str, relative_paths: list[str], local_dir: str, remote_dir: str, direction: str, **transfer_kwargs) -> Iterator[transfers.Transfer]:
+    """Lazily creates the transfers for a sync.
+
+    Args:
+        url (str): Base URL of the filesystem.
+        relative_paths (list[str]): Relative paths of the files to transfer.
+        local_dir (str): Path to the local directory.
+        remote_dir (str): Path to the remote directory.
+        direction (str): Either SYNC_UPLOAD or SYNC_DOWNLOAD.
+        **transfer_kwargs: Options passed to each `transfers.Transfer`.
+
+    Yields:
+        transfers.Transfer: One transfer per file.
+    """
+
+    for relative_path in relative_paths:
+        local_file = os.path.join(local_dir, *relative_path.split("/"))
+        file_url = f"{url}/files/{posixpath.join(remote_dir, relative_path).strip('/')}"
+        if direction == SYNC_UPLOAD:
+            yield transfers.MultipartUpload(local_file, file_url, progress=False, **transfer_kwargs)
+        else:
+            os.makedirs(os.path.dirname(local_file) or ".", exist_ok=True)
+            yield transfers.MultipartDownload(local_file, file_url, progress=False, **transfer_kwargs)
+
+
+def finish_sync(local_dir: str, remote_files: dict[str, dict], relative_paths: list[str], direction: str) -> list[str]:
+    """Copies the remote modification times onto the files of a finished download sync.
+
+    Args:
+        local_dir (str): Path to the local directory.
+        remote_files (dict[str, dict]): Remote files with their known metadata.
+        relative_paths (list[str]): Relative paths of the transferred files.
+        direction (str): Either SYNC_UPLOAD or SYNC_DOWNLOAD.
+
+    Returns:
+        list[str]: The transferred relative paths.
+    """
+
+    if direction == SYNC_DOWNLOAD:
+        set_local_mtimes(local_dir, remote_files, relative_paths)
+    return relative_paths
+
+
+def prepare_packed_upload(local_dir: str, remote_dir: str, shard_size: int = packing.DEFAULT_SHARD_SIZE_BYTES, small_file_threshold: int = packing.SMALL_FILE_THRESHOLD_BYTES) -> tuple[list[list[str]], list[str], list[str], list[str]]:
+    """Scans a local directory and plans its packed upload.
+
+    Args:
+        local_dir (str): Path to the local directory.
+        remote_dir (str): Path to the remote directory.
+        shard_size (int, optional): Target size of each shard, in bytes. Defaults to packing.DEFAULT_SHARD_SIZE_BYTES.
+        small_file_threshold (int, optional): Files at least this large are uploaded on their own. Defaults to packing.SMALL_FILE_THRESHOLD_BYTES.
+
+    Returns:
+        tuple[list[list[str]], list[str], list[str], list[str]]: The relative paths in each shard, the large files, the shards' remote paths relative to `remote_dir`, and the remote directories to create first, parents before children.
+    """
+
+    shards, large_files = packing.plan_shards(scan_local(local_dir), shard_size=shard_size, small_file_threshold=small_file_threshold)
+    shard_paths = [posixpath.join(packing.SHARD_DIRECTORY, packing.shard_name(i)) for i in range(len(shards))]
+    return shards, large_files, shard_paths, directories_to_create(remote_dir, shard_paths + large_files, set(), False)
 
 
 class Filesystem(etc.Filesystem):
     """An Interface and Client for interacting with an ET Engine Filesystem.
     """
 
-    def __init__(self, base_url: str, *args, **kwargs) -> None:
+    def __init__(self, base_url: str, *args, transport: clients.Transport = None, **kwargs) -> None:
         """Create an interactive ET Engine Filesystem object.
 
         Args:
             base_url (str): Base endpoint for requests.
+            transport (clients.Transport, optional): Pooled transport shared with the parent client. Defaults to the shared default transport.
         """
 
         super().__init__(*args, **kwargs)
-        self.client = clients.APIClient(f"{base_url}/filesystems/{self.filesystem_id}")
+        self.client = clients.APIClient(f"{base_url}/filesystems/{self.filesystem_id}", transport=transport)
 
 
-    def upload(self, local_file: str, remote_file: str, chunk_size: int = clients.MIN_CHUNK_SIZE_BYTES) -> None:
+    def transfer_options(self) -> dict:
+        """Collects the options that run each `transfers.Transfer` on the shared transport.
+
+        Returns:
+            dict: The transport to pass to each `transfers.Transfer`.
+        """
+
+        return {"transport": self.client.transport}
+
+
+    def upload(self, local_file: str, remote_file: str, chunk_size: int | str = clients.MIN_CHUNK_SIZE_BYTES, min_concurrency: int = transfers.DEFAULT_MIN_CONCURRENCY, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, resume: bool = False, memory_budget: int = transfers.DEFAULT_MEMORY_BUDGET_BYTES, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> str:
         """Uploads a local file to the specified path on The Engine.
 
         Args:
             local_file (str): A valid path to file on the local filesystem.
             remote_file (str): A valid path to the destination of the remote file, starting from the filesystem root.
-            chunk_size (int, optional): Size of each chunk, in bytes. Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or "auto" to pick it from the file size and observed round-trip time. Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            min_concurrency (int, optional): Floor on the number of parts in flight. Defaults to transfers.DEFAULT_MIN_CONCURRENCY.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            resume (bool, optional): Whether to keep a sidecar manifest of finished parts and continue a matching interrupted transfer. Defaults to False.
+            memory_budget (int, optional): Maximum number of part bytes buffered at once, in bytes. Defaults to transfers.DEFAULT_MEMORY_BUDGET_BYTES.
+            checksum (str, optional): Per-part checksum algorithm, one of transfers.CHECKSUM_ALGORITHMS, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar for the parts. Defaults to True.
+
+        Returns:
+            str: Whole-file digest combined from the part checksums, or None if checksums are disabled.
         """
         
         url = f"{self.client.url}/files/{remote_file}"
-        file_contents = clients.MultipartUpload(local_file, url, chunk_size=chunk_size)
+        file_contents = transfers.MultipartUpload(
+            local_file,
+            url,
+            chunk_size=chunk_size,
+            transport=self.client.transport,
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            memory_budget=memory_budget,
+            checksum=checksum,
+            progress=progress
+        )
         file_contents.request_upload()
         file_contents.upload()
         file_contents.complete_upload()
+        return file_contents.file_checksum
 
     
-    def download(self, remote_file: str, local_file: str, chunk_size: int = clients.MIN_CHUNK_SIZE_BYTES) -> None:
+    def download(self, remote_file: str, local_file: str, chunk_size: int | str = clients.MIN_CHUNK_SIZE_BYTES, min_concurrency: int = transfers.DEFAULT_MIN_CONCURRENCY, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, resume: bool = False, memory_budget: int = transfers.DEFAULT_MEMORY_BUDGET_BYTES, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> str:
         """Downloads a copy of a filesystem file to the local machine
 
         Args:
             remote_file (str): Path to the remote copy of the file inside the filesystem
             local_file (str): Path to the destination of the downloaded file
-            chunk_size (int, optional): Size of each chunk, in bytes. Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or "auto" to pick it from the file size and observed round-trip time. Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            min_concurrency (int, optional): Floor on the number of parts in flight. Defaults to transfers.DEFAULT_MIN_CONCURRENCY.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            resume (bool, optional): Whether to keep a sidecar manifest of finished parts and continue a matching interrupted transfer. Defaults to False.
+            memory_budget (int, optional): Maximum number of part bytes buffered at once, in bytes. Defaults to transfers.DEFAULT_MEMORY_BUDGET_BYTES.
+            checksum (str, optional): Per-part checksum algorithm, one of transfers.CHECKSUM_ALGORITHMS, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar for the parts. Defaults to True.
+
+        Returns:
+            str: Whole-file digest combined from the part checksums, or None if checksums are disabled.
         """
 
         url = f"{self.client.url}/files/{remote_file}"
-        file_contents = clients.MultipartDownload(local_file, url, chunk_size=chunk_size)
+        file_contents = transfers.MultipartDownload(
+            local_file,
+            url,
+            chunk_size=chunk_size,
+            transport=self.client.transport,
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            memory_budget=memory_budget,
+            checksum=checksum,
+            progress=progress
+        )
         file_contents.request_download()
-        file_contents.download()
+        try:
+            file_contents.download()
+        except BaseException:
+            file_contents.abort_download()
+            raise
         file_contents.complete_download()
+        return file_contents.file_checksum
 
 
     def mkdir(self, path: str, ignore_exists: bool = False) -> None:
@@ -58,13 +417,17 @@ class Filesystem(etc.Filesystem):
         Args:
             path (str): Path to the new directory.
             ignore_exists (bool, optional): Whether to ignore errors caused by the directory already existing. Defaults to False.
+
+        Raises:
+            requests.exceptions.HTTPError: The directory could not be created, or already exists and `ignore_exists` is False.
         """
 
         try:
             self.client.post(f"/mkdir/{path}")
         except requests.exceptions.HTTPError as err:
-            if err.response.status_code == 409 and ignore_exists:
+            if err.response is not None and err.response.status_code == 409 and ignore_exists:
                 return
+            raise
 
 
     def delete(self, path: str) -> None:
@@ -87,15 +450,184 @@ class Filesystem(etc.Filesystem):
         """
         
         return self.client.get(f"/list/{path}")
-    
+
+
+    def walk(self, path: str = '', max_workers: int = transfers.DEFAULT_MAX_FILES) -> tuple[dict[str, dict], set[str]]:
+        """Recursively lists a remote directory, listing each level's directories concurrently.
+
+        Args:
+            path (str, optional): Path to the remote directory. A directory that does not exist is treated as empty. Defaults to ''.
+            max_workers (int, optional): Maximum number of concurrent `ls` requests. Defaults to transfers.DEFAULT_MAX_FILES.
+
+        Returns:
+            tuple[dict[str, dict], set[str]]: Files keyed by their path relative to `path` with their known metadata, and the set of relative directory paths.
+        """
+
+        def list_directory(relative_dir: str) -> tuple[str, dict]:
+            try:
+                return relative_dir, self.ls(posixpath.join(path, relative_dir).strip("/"))
+            except requests.exceptions.HTTPError as err:
+                if err.response is not None and err.response.status_code == 404:
+                    return relative_dir, {}
+                raise
+
+        files = {}
+        directories = set()
+        level = [""]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level:
+                level = add_listings(executor.map(list_directory, level), files, directories)
+
+        return files, directories
+
+
+    def sync(self, local_dir: str, remote_dir: str = '', direction: str = SYNC_UPLOAD, compare: str = "mtime", max_files: int = transfers.DEFAULT_MAX_FILES, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, chunk_size: int | str = clients.MIN_CHUNK_SIZE_BYTES, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> list[str]:
+        """Synchronizes a local directory with a remote directory, transferring only what changed.
+
+        Both trees are walked, diffed by `compare`, and the differing files are transferred with
+        file-level and part-level concurrency on a single asynchronous session.
+
+        Args:
+            local_dir (str): Path to the local directory.
+            remote_dir (str, optional): Path to the remote directory, starting from the filesystem root. Defaults to ''.
+            direction (str, optional): SYNC_UPLOAD to push local changes, or SYNC_DOWNLOAD to pull remote changes. Defaults to SYNC_UPLOAD.
+            compare (str, optional): How files are compared, one of SYNC_COMPARISONS. "mtime" transfers files whose size differs or whose source is newer, "size" only compares sizes, and "hash" compares whole-file SHA-256 digests and requires the listing to report "sha256". Defaults to "mtime".
+            max_files (int, optional): Maximum number of files transferred at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight per file, and on connections overall. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or "auto". Defaults to clients.MIN_CHUNK_SIZE_BYTES.
+            checksum (str, optional): Per-part checksum algorithm, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar over the files. Defaults to True.
+
+        Returns:
+            list[str]: Relative paths of the files that were transferred.
+        """
+
+        remote_files, remote_directories = self.walk(remote_dir, max_workers=max_files)
+        relative_paths, directories = prepare_sync(local_dir, remote_dir, remote_files, remote_directories, direction, compare)
+        for directory in directories:
+            self.mkdir(directory, ignore_exists=True)
+
+        file_transfers = sync_transfers(
+            self.client.url,
+            relative_paths,
+            local_dir,
+            remote_dir,
+            direction,
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size,
+            checksum=checksum,
+            **self.transfer_options()
+        )
+
+        async def run() -> None:
+            async with transfers.transfer_session(max(max_files, max_concurrency)) as session:
+                await transfers.transfer_files(file_transfers, session, max_files=max_files, progress=progress)
+
+        asyncio.run(run())
+
+        return finish_sync(local_dir, remote_files, relative_paths, direction)
+
+
+    def upload_packed(self, local_dir: str, remote_dir: str = '', shard_size: int = packing.DEFAULT_SHARD_SIZE_BYTES, small_file_threshold: int = packing.SMALL_FILE_THRESHOLD_BYTES, max_files: int = transfers.DEFAULT_MAX_FILES, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> list[str]:
+        """Uploads a directory of many small files as a few tar shards.
+
+        Files smaller than `small_file_threshold` are streamed into uncompressed tar shards of about
+        `shard_size` bytes under `{remote_dir}/.etshards/`, so a batch of small inputs costs a few
+        shard uploads instead of three round trips per file. Larger files are uploaded on their own.
+        Shards left over from an earlier, larger pack are deleted. Use `download_packed` to unpack.
+
+        Args:
+            local_dir (str): Path to the local directory.
+            remote_dir (str, optional): Path to the remote directory, starting from the filesystem root. Defaults to ''.
+            shard_size (int, optional): Target size of each shard, in bytes. Defaults to packing.DEFAULT_SHARD_SIZE_BYTES.
+            small_file_threshold (int, optional): Files at least this large are uploaded on their own. Defaults to packing.SMALL_FILE_THRESHOLD_BYTES.
+            max_files (int, optional): Maximum number of shards and files transferred at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight per file. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            checksum (str, optional): Per-part checksum algorithm, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar over the shards and files. Defaults to True.
+
+        Returns:
+            list[str]: Remote paths, relative to `remote_dir`, of the uploaded shards and large files.
+        """
+
+        shards, large_files, shard_paths, directories = prepare_packed_upload(local_dir, remote_dir, shard_size=shard_size, small_file_threshold=small_file_threshold)
+        for directory in directories:
+            self.mkdir(directory, ignore_exists=True)
+
+        shard_dir = tempfile.mkdtemp(prefix="et-shards-")
+        try:
+            packed_transfers = packing.packed_upload_transfers(
+                self.client.url,
+                local_dir,
+                remote_dir,
+                shards,
+                large_files,
+                shard_dir,
+                max_concurrency=max_concurrency,
+                checksum=checksum,
+                progress=False,
+                **self.transfer_options()
+            )
+
+            async def run() -> None:
+                async with transfers.transfer_session(max(max_files, max_concurrency)) as session:
+                    await transfers.transfer_files(packed_transfers, session, max_files=max_files, progress=progress)
+
+            asyncio.run(run())
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
+
+        remote_shards, _ = self.walk(posixpath.join(remote_dir, packing.SHARD_DIRECTORY).strip("/"))
+        for path in packing.stale_shards(remote_dir, remote_shards, shard_paths):
+            self.delete(path)
+
+        return shard_paths + large_files
+
+
+    def download_packed(self, remote_dir: str, local_dir: str, max_files: int = transfers.DEFAULT_MAX_FILES, max_concurrency: int = transfers.DEFAULT_MAX_CONCURRENCY, checksum: str = transfers.DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True) -> list[str]:
+        """Downloads a directory written by `upload_packed`, unpacking each shard as soon as it lands.
+
+        Args:
+            remote_dir (str): Path to the remote directory, starting from the filesystem root.
+            local_dir (str): Path to the local directory.
+            max_files (int, optional): Maximum number of shards and files transferred at once. Defaults to transfers.DEFAULT_MAX_FILES.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight per file. Defaults to transfers.DEFAULT_MAX_CONCURRENCY.
+            checksum (str, optional): Per-part checksum algorithm, or None to disable checksums. Defaults to transfers.DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar over the shards and files. Defaults to True.
+
+        Returns:
+            list[str]: Relative paths of the local files written, unpacked or downloaded.
+        """
+
+        remote_files, _ = self.walk(remote_dir, max_workers=max_files)
+        packed_transfers = list(packing.packed_download_transfers(
+            self.client.url,
+            local_dir,
+            remote_dir,
+            list(remote_files),
+            max_concurrency=max_concurrency,
+            checksum=checksum,
+            progress=False,
+            **self.transfer_options()
+        ))
+
+        async def run() -> None:
+            async with transfers.transfer_session(max(max_files, max_concurrency)) as session:
+                await transfers.transfer_files(packed_transfers, session, max_files=max_files, progress=progress)
+
+        asyncio.run(run())
+
+        return packing.finish_packed_download(local_dir, packed_transfers)
+
 
     @staticmethod
-    def from_json(base_url: str, filesystem_json: dict) -> Self:
+    def from_json(base_url: str, filesystem_json: dict, transport: clients.Transport = None) -> Self:
         """Convert a JSON object to an interactive Filesystem.
 
         Args:
             base_url (str): Base endpoint for requests.
             filesystem_json (dict): JSON description of the Filesystem.
+            transport (clients.Transport, optional): Pooled transport shared with the parent client. Defaults to None.
 
         Returns:
             Self: A Filesystem object.
@@ -104,7 +636,8 @@ class Filesystem(etc.Filesystem):
         new_filesystem = Filesystem(
             base_url,
             filesystem_id=base_filesystem.filesystem_id, 
-            filesystem_name=base_filesystem.filesystem_name
+            filesystem_name=base_filesystem.filesystem_name,
+            transport=transport
         )
         return new_filesystem
     
@@ -113,15 +646,22 @@ class FilesystemsClient(clients.APIClient):
     """Client for interacting with ET Engine Filesystems.
     """
 
-    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL) -> None:
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, transport: clients.Transport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS) -> None:
         """Create a new client for interacting with ET Engine Filesystems.
 
         Args:
             base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            transport (clients.Transport, optional): Pooled transport shared by this client and every Filesystem it creates. Defaults to the shared default transport.
+            index_ttl (float, optional): Number of seconds `connect` trusts the last filesystem listing. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
         """
         
-        super().__init__(f"{base_url}/filesystems")
+        super().__init__(f"{base_url}/filesystems", transport=transport)
         self.base_url = base_url
+        self.index = clients.ResourceIndex(
+            lambda fs: etc.Filesystem.from_json(fs).filesystem_id,
+            lambda fs: etc.Filesystem.from_json(fs).filesystem_name,
+            ttl=index_ttl
+        )
 
 
     def create_filesystem(self, filesystem_name: str) -> Filesystem:
@@ -138,7 +678,8 @@ class FilesystemsClient(clients.APIClient):
             "filesystem_name": filesystem_name
         }
         filesystem_json = self.post(data=data)
-        return Filesystem.from_json(self.base_url, filesystem_json)
+        self.index.put(filesystem_json)
+        return Filesystem.from_json(self.base_url, filesystem_json, transport=self.transport)
 
 
     def list_filesystems(self) -> list[Filesystem]:
@@ -149,12 +690,34 @@ class FilesystemsClient(clients.APIClient):
         """
 
         filesystem_list = self.get()
-        return [Filesystem.from_json(self.base_url, fs) for fs in filesystem_list]
+        self.index.refresh(filesystem_list)
+        return [Filesystem.from_json(self.base_url, fs, transport=self.transport) for fs in filesystem_list]
+
+
+    def iter_filesystems(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> Iterator[Filesystem]:
+        """Lazily iterates over the available filesystems, fetching one page at a time.
+
+        A Filesystem client is only built for each filesystem the iteration reaches that passes `where`.
+
+        Args:
+            where (Callable[[dict], bool], optional): Filter applied to each filesystem's raw JSON description. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of filesystems requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            Filesystem: A Filesystem client for each matching filesystem.
+        """
+
+        for filesystem_json in self.iter_resources(where=where, filters=filters, page_size=page_size):
+            yield Filesystem.from_json(self.base_url, filesystem_json, transport=self.transport)
     
 
     def connect(self, filesystem_name: str) -> Filesystem:
         """Connect the client to a specific Filesystem resource.
 
+        The filesystem is looked up in the client's index, which is only refreshed from the API when it
+        is stale or does not know the name.
+
         Args:
             filesystem_name (str): Name of the filesystem to connect to.
 
@@ -165,8 +728,10 @@ class FilesystemsClient(clients.APIClient):
             Filesystem: A new interactive Filesystem object for the specified filesystem.
         """
 
-        filesystem_list = self.list_filesystems()
-        for fs in filesystem_list:
-            if fs.filesystem_name == filesystem_name:
-                return fs
-        raise Exception("Filesystem does not exist")
\ No newline at end of file
+        filesystem_json = self.index.get(name=filesystem_name)
+        if filesystem_json is None:
+            self.index.refresh(self.get())
+            filesystem_json = self.index.find(name=filesystem_name)
+        if filesystem_json is None:
+            raise Exception("Filesystem does not exist")
+        return Filesystem.from_json(self.base_url, filesystem_json, transport=self.transport)
\ No newline at end of file
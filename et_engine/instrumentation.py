@@ -0,0 +1,273 @@
+import time
+import threading
+from typing import NamedTuple
+
+
+class RequestEvent(NamedTuple):
+    """One API or control request, reported once its retries are over.
+    """
+
+    method: str
+    url: str
+    status: int
+    latency: float
+    attempts: int
+    bytes_sent: int
+    bytes_received: int
+    error: Exception = None
+
+    @property
+    def retries(self) -> int:
+        return self.attempts - 1
+
+
+class PartEvent(NamedTuple):
+    """One part of a multipart transfer, reported once its retries are over.
+    """
+
+    kind: str
+    url: str
+    starting_byte: int
+    num_bytes: int
+    latency: float
+    status: int
+    attempts: int
+    in_flight: int
+    concurrency_limit: int
+    error: Exception = None
+
+    @property
+    def retries(self) -> int:
+        return self.attempts - 1
+
+
+class TransferEvent(NamedTuple):
+    """The parts phase of a whole multipart transfer, reported once every part has moved.
+    """
+
+    kind: str
+    url: str
+    local_file: str
+    num_bytes: int
+    num_parts: int
+    duration: float
+
+    @property
+    def throughput(self) -> float:
+        """Average throughput of the transfer, in bytes per second."""
+        return self.num_bytes / self.duration if self.duration > 0 else 0.0
+
+
+class Hooks:
+    """Receives instrumentation events from transports and transfers.
+
+    Every method is a no-op, so the default hooks cost one empty call per event. Subclass and override
+    the events of interest, and pass an instance as `hooks` to `Engine`, `AsyncEngine` or a transport.
+    Hooks may be called from worker threads and must not raise.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called after each API or control request.
+
+        Args:
+            event (RequestEvent): The request.
+        """
+
+
+    def on_part(self, event: PartEvent) -> None:
+        """Called after each part of a multipart transfer.
+
+        Args:
+            event (PartEvent): The part.
+        """
+
+
+    def on_transfer(self, event: TransferEvent) -> None:
+        """Called after all parts of a multipart transfer have moved.
+
+        Args:
+            event (TransferEvent): The transfer.
+        """
+
+
+NO_HOOKS = Hooks()
+
+
+class CompositeHooks(Hooks):
+    """Forwards every event to several hooks, in order.
+    """
+
+    def __init__(self, *hooks: Hooks) -> None:
+        """Creates a new composite.
+
+        Args:
+            *hooks (Hooks): The hooks to forward to.
+        """
+
+        self.hooks = hooks
+
+
+    def on_request(self, event: RequestEvent) -> None:
+        for hooks in self.hooks:
+            hooks.on_request(event)
+
+
+    def on_part(self, event: PartEvent) -> None:
+        for hooks in self.hooks:
+            hooks.on_part(event)
+
+
+    def on_transfer(self, event: TransferEvent) -> None:
+        for hooks in self.hooks:
+            hooks.on_transfer(event)
+
+
+class RecordingHooks(Hooks):
+    """Keeps every event in memory, e.g. to summarize a benchmark run.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests = []
+        self.parts = []
+        self.transfers = []
+
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self.lock:
+            self.requests.append(event)
+
+
+    def on_part(self, event: PartEvent) -> None:
+        with self.lock:
+            self.parts.append(event)
+
+
+    def on_transfer(self, event: TransferEvent) -> None:
+        with self.lock:
+            self.transfers.append(event)
+
+
+    def summary(self) -> dict:
+        """Aggregates the recorded events.
+
+        Returns:
+            dict: Counts, retries, mean latencies and byte totals of the requests and parts, and the mean throughput of the transfers.
+        """
+
+        def mean(values: list[float]) -> float:
+            return sum(values) / len(values) if values else 0.0
+
+        with self.lock:
+            return {
+                "requests": len(self.requests),
+                "request_retries": sum(e.retries for e in self.requests),
+                "request_errors": sum(e.error is not None for e in self.requests),
+                "mean_request_latency": mean([e.latency for e in self.requests]),
+                "parts": len(self.parts),
+                "part_retries": sum(e.retries for e in self.parts),
+                "part_errors": sum(e.error is not None for e in self.parts),
+                "mean_part_latency": mean([e.latency for e in self.parts]),
+                "part_bytes": sum(e.num_bytes for e in self.parts),
+                "max_in_flight": max((e.in_flight for e in self.parts), default=0),
+                "transfers": len(self.transfers),
+                "mean_throughput": mean([e.throughput for e in self.transfers]),
+            }
+
+
+class OpenTelemetryHooks(Hooks):
+    """Reports events as OpenTelemetry spans and metrics.
+
+    Requests, parts and transfers each become a span, backdated to when they started, and feed the
+    duration, byte, retry and in-flight instruments below. Requires the `opentelemetry-api` package.
+    """
+
+    def __init__(self, tracer: object = None, meter: object = None) -> None:
+        """Creates new OpenTelemetry hooks.
+
+        Args:
+            tracer (opentelemetry.trace.Tracer, optional): Tracer to record spans with. Defaults to the global tracer provider's "et_engine" tracer.
+            meter (opentelemetry.metrics.Meter, optional): Meter to record metrics with. Defaults to the global meter provider's "et_engine" meter.
+
+        Raises:
+            Exception: The opentelemetry-api package is not installed.
+        """
+
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError:
+            raise Exception("OpenTelemetryHooks requires the 'opentelemetry-api' package")
+
+        self.trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer("et_engine")
+        meter = meter if meter is not None else metrics.get_meter("et_engine")
+
+        self.request_duration = meter.create_histogram("et_engine.request.duration", unit="s", description="Latency of API requests, retries included")
+        self.request_retries = meter.create_counter("et_engine.request.retries", description="Retried API requests")
+        self.part_duration = meter.create_histogram("et_engine.part.duration", unit="s", description="Latency of multipart transfer parts, retries included")
+        self.part_bytes = meter.create_counter("et_engine.part.bytes", unit="By", description="Bytes moved by multipart transfer parts")
+        self.part_retries = meter.create_counter("et_engine.part.retries", description="Retried multipart transfer parts")
+        self.part_in_flight = meter.create_histogram("et_engine.part.in_flight", description="Parts in flight when each part finished")
+        self.transfer_throughput = meter.create_histogram("et_engine.transfer.throughput", unit="By/s", description="Average throughput of multipart transfers")
+
+
+    def record_span(self, name: str, duration: float, attributes: dict, error: Exception = None) -> None:
+        """Records a finished span.
+
+        Args:
+            name (str): Name of the span.
+            duration (float): How long ago the span started, in seconds.
+            attributes (dict): Attributes of the span.
+            error (Exception, optional): The error the span ended with. Defaults to None.
+        """
+
+        end = time.time_ns()
+        span = self.tracer.start_span(name, start_time=end - int(duration * 1e9), attributes=attributes)
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, str(error)))
+        span.end(end_time=end)
+
+
+    def on_request(self, event: RequestEvent) -> None:
+        attributes = {"http.request.method": event.method, "url.full": event.url}
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        self.request_duration.record(event.latency, attributes)
+        self.request_retries.add(event.retries, attributes)
+        self.record_span(f"et_engine {event.method}", event.latency, {
+            **attributes,
+            "et_engine.attempts": event.attempts,
+            "http.request.body.size": event.bytes_sent,
+            "http.response.body.size": event.bytes_received
+        }, error=event.error)
+
+
+    def on_part(self, event: PartEvent) -> None:
+        attributes = {"et_engine.transfer.kind": event.kind}
+        self.part_duration.record(event.latency, attributes)
+        self.part_bytes.add(event.num_bytes, attributes)
+        self.part_retries.add(event.retries, attributes)
+        self.part_in_flight.record(event.in_flight, attributes)
+        self.record_span(f"et_engine {event.kind} part", event.latency, {
+            **attributes,
+            "url.full": event.url,
+            "et_engine.part.starting_byte": event.starting_byte,
+            "et_engine.part.bytes": event.num_bytes,
+            "et_engine.attempts": event.attempts,
+            "et_engine.part.in_flight": event.in_flight,
+            "et_engine.part.concurrency_limit": event.concurrency_limit
+        }, error=event.error)
+
+
+    def on_transfer(self, event: TransferEvent) -> None:
+        attributes = {"et_engine.transfer.kind": event.kind}
+        self.transfer_throughput.record(event.throughput, attributes)
+        self.record_span(f"et_engine {event.kind}", event.duration, {
+            **attributes,
+            "url.full": event.url,
+            "et_engine.transfer.local_file": event.local_file,
+            "et_engine.transfer.bytes": event.num_bytes,
+            "et_engine.transfer.parts": event.num_parts,
+            "et_engine.transfer.throughput": event.throughput
+        })
@@ -0,0 +1,104 @@
+import time
+import queue
+import logging
+import logging.handlers
+
+
+DEFAULT_FLUSH_RECORDS = 256
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class BatchedFileHandler(logging.FileHandler):
+    """File handler that flushes after a batch of records instead of after every record.
+
+    The file is flushed once `flush_records` records are written or `flush_interval` seconds have
+    passed since the last flush, whichever comes first. An explicit `flush()` or `close()` always
+    flushes.
+    """
+
+    def __init__(self, filename: str, mode: str = "a", encoding: str = None, flush_records: int = DEFAULT_FLUSH_RECORDS, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        """Opens a log file.
+
+        Args:
+            filename (str): Path to the log file.
+            mode (str, optional): Mode the file is opened with. Defaults to "a".
+            encoding (str, optional): Encoding of the file. Defaults to None.
+            flush_records (int, optional): Number of records written between flushes. Defaults to DEFAULT_FLUSH_RECORDS.
+            flush_interval (float, optional): Longest time between flushes while records are written, in seconds. Defaults to DEFAULT_FLUSH_INTERVAL.
+        """
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.pending = 0
+        self.flushed_at = time.monotonic()
+        self.batching = False
+        super().__init__(filename, mode=mode, encoding=encoding)
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Handler.handle holds the handler lock, so the flag only covers the flush issued by this emit
+        self.batching = True
+        try:
+            super().emit(record)
+        finally:
+            self.batching = False
+
+
+    def flush(self) -> None:
+        """Flushes the file, unless called while writing a record before the batch is complete.
+        """
+        if self.batching:
+            self.pending += 1
+            if self.pending < self.flush_records and time.monotonic() - self.flushed_at < self.flush_interval:
+                return
+        super().flush()
+        self.pending = 0
+        self.flushed_at = time.monotonic()
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a listener in the same process.
+
+    Records are queued as they are, so formatting the message happens on the listener's thread
+    instead of in the logging call. Arguments are therefore formatted slightly later, which only
+    matters for mutable arguments changed right after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that also flushes its handlers whenever the queue stays empty for `flush_interval` seconds.
+
+    Together with `BatchedFileHandler`, records reach the file at most about `flush_interval`
+    seconds after they are logged, even when logging pauses in the middle of a batch.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler, flush_interval: float = DEFAULT_FLUSH_INTERVAL, respect_handler_level: bool = True) -> None:
+        """Creates a listener.
+
+        Args:
+            log_queue (queue.Queue): Queue the records are read from.
+            *handlers (logging.Handler): Handlers the records are passed to, on the listener's thread.
+            flush_interval (float, optional): Idle time after which the handlers are flushed, in seconds. Defaults to DEFAULT_FLUSH_INTERVAL.
+            respect_handler_level (bool, optional): Whether to apply each handler's level. Defaults to True.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if not block:
+            return self.queue.get_nowait()
+        while True:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self.flush()
+
+
+    def flush(self) -> None:
+        """Flushes every handler.
+        """
+        for handler in self.handlers:
+            handler.flush()
@@ -0,0 +1,341 @@
+import os
+import posixpath
+import tarfile
+import asyncio
+import aiohttp
+from typing import Iterable, Iterator
+
+from .clients import MIN_CHUNK_SIZE_BYTES, MAX_CHUNK_SIZE_BYTES
+from . import transfers
+
+
+SHARD_DIRECTORY = ".etshards"
+SHARD_SUFFIX = ".tar"
+DEFAULT_SHARD_SIZE_BYTES = MAX_CHUNK_SIZE_BYTES
+SMALL_FILE_THRESHOLD_BYTES = MIN_CHUNK_SIZE_BYTES
+
+
+def shard_name(index: int) -> str:
+    """Returns the file name of a shard.
+
+    Args:
+        index (int): Position of the shard in its pack.
+
+    Returns:
+        str: The shard file name.
+    """
+
+    return f"shard-{index:05d}{SHARD_SUFFIX}"
+
+
+def is_shard(relative_path: str) -> bool:
+    """Checks whether a remote path, relative to a packed directory, is one of its shards.
+
+    Args:
+        relative_path (str): "/"-separated path relative to the packed directory.
+
+    Returns:
+        bool: Whether the path is a shard.
+    """
+
+    directory, name = posixpath.split(relative_path)
+    return directory == SHARD_DIRECTORY and name.endswith(SHARD_SUFFIX)
+
+
+def tar_member_size(file_size_bytes: int) -> int:
+    """Returns the number of bytes a regular file occupies inside a tar archive.
+
+    Args:
+        file_size_bytes (int): Size of the file, in bytes.
+
+    Returns:
+        int: Size of the header block plus the contents padded to whole blocks, in bytes.
+    """
+
+    blocks = -(-file_size_bytes // tarfile.BLOCKSIZE)
+    return tarfile.BLOCKSIZE * (1 + blocks)
+
+
+def plan_shards(local_files: dict[str, dict], shard_size: int = DEFAULT_SHARD_SIZE_BYTES, small_file_threshold: int = SMALL_FILE_THRESHOLD_BYTES) -> tuple[list[list[str]], list[str]]:
+    """Groups small files into shards of roughly `shard_size` bytes.
+
+    Files are packed in path order, so files from the same directory tend to land in the same shard.
+
+    Args:
+        local_files (dict[str, dict]): Local files keyed by relative path, as returned by `filesystems.scan_local`.
+        shard_size (int, optional): Target size of each shard, in bytes. Defaults to DEFAULT_SHARD_SIZE_BYTES.
+        small_file_threshold (int, optional): Files at least this large are left out of the shards. Defaults to SMALL_FILE_THRESHOLD_BYTES.
+
+    Returns:
+        tuple[list[list[str]], list[str]]: The relative paths in each shard, and the relative paths of the files too large to pack.
+    """
+
+    # Leave room for the end-of-archive marker and the padding to a whole record
+    capacity = shard_size - tarfile.RECORDSIZE
+
+    shards = []
+    large_files = []
+    current = []
+    current_size = 0
+    for relative_path in sorted(local_files):
+        size = local_files[relative_path]["size"]
+        if size >= small_file_threshold:
+            large_files.append(relative_path)
+            continue
+
+        member_size = tar_member_size(size)
+        if current and current_size + member_size > capacity:
+            shards.append(current)
+            current = []
+            current_size = 0
+        current.append(relative_path)
+        current_size += member_size
+
+    if current:
+        shards.append(current)
+    return shards, large_files
+
+
+def write_shard(local_dir: str, relative_paths: list[str], shard_path: str) -> None:
+    """Streams local files into an uncompressed tar shard.
+
+    Args:
+        local_dir (str): Path to the local directory the files are relative to.
+        relative_paths (list[str]): "/"-separated paths of the files to pack.
+        shard_path (str): Path of the shard to write.
+    """
+
+    with tarfile.open(shard_path, "w", format=tarfile.PAX_FORMAT) as tar:
+        for relative_path in relative_paths:
+            tar.add(os.path.join(local_dir, *relative_path.split("/")), arcname=relative_path, recursive=False)
+
+
+def extract_shard(shard_path: str, local_dir: str) -> list[str]:
+    """Unpacks a tar shard into a local directory.
+
+    Members are extracted with the "data" filter, so absolute paths, links out of `local_dir` and
+    special files are rejected. Shards holding files of the same directory are unpacked
+    concurrently, and `tarfile` creates missing parent directories without tolerating a concurrent
+    creation, so every member's parent directory is created here first.
+
+    Args:
+        shard_path (str): Path of the shard to unpack.
+        local_dir (str): Path to the destination directory.
+
+    Returns:
+        list[str]: Relative paths of the unpacked files.
+    """
+
+    with tarfile.open(shard_path, "r") as tar:
+        members = [tarfile.data_filter(member, local_dir) for member in tar.getmembers()]
+        for member in members:
+            os.makedirs(os.path.join(local_dir, *posixpath.dirname(member.name).split("/")), exist_ok=True)
+        tar.extractall(local_dir, members=members, filter="data")
+    return [member.name for member in members if member.isfile()]
+
+
+class ShardUpload(transfers.MultipartUpload):
+    """Packs a group of small files into a tar shard and uploads it as a single file.
+
+    The shard is only written once a worker starts the transfer, so at most one shard per
+    concurrent file transfer exists on disk at a time.
+    """
+
+    def __init__(self, local_dir: str, relative_paths: list[str], shard_path: str, url: str, *args, **kwargs) -> None:
+        """Create a new shard upload.
+
+        Args:
+            local_dir (str): Path to the local directory the files are relative to.
+            relative_paths (list[str]): "/"-separated paths of the files to pack.
+            shard_path (str): Path of the temporary local shard.
+            url (str): Full URL of the remote shard destination.
+            *args, **kwargs: Transfer options, see `transfers.Transfer`.
+        """
+
+        self.local_dir = local_dir
+        self.relative_paths = relative_paths
+        self.written = False
+        super().__init__(shard_path, url, *args, **kwargs)
+
+
+    def stat_file(self) -> None:
+        """Records the size of the shard and sizes it as one part whenever it fits in one.
+
+        Does nothing until the shard is written at the start of `run_async`.
+        """
+
+        if not self.written:
+            return
+        self.auto_chunk_size = False
+        self.chunk_size = min(max(os.path.getsize(self.local_file), MIN_CHUNK_SIZE_BYTES), MAX_CHUNK_SIZE_BYTES)
+        super().stat_file()
+
+
+    async def run_async(self, session: aiohttp.ClientSession) -> str:
+        """Writes the shard in a worker thread, then uploads and removes it.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Returns:
+            str: Whole-shard digest, or None if checksums are disabled.
+        """
+
+        await asyncio.to_thread(write_shard, self.local_dir, self.relative_paths, self.local_file)
+        try:
+            self.written = True
+            self.stat_file()
+            return await super().run_async(session)
+        finally:
+            os.remove(self.local_file)
+
+
+class ShardDownload(transfers.MultipartDownload):
+    """Downloads a tar shard and unpacks it as soon as it lands.
+
+    Parts arrive out of order, so the whole shard is written to a temporary local file before it is
+    unpacked, rather than unpacked as it streams. Up to one shard per concurrent file transfer, at
+    most DEFAULT_SHARD_SIZE_BYTES each, is therefore on disk at a time.
+    """
+
+    def __init__(self, local_dir: str, shard_path: str, url: str, *args, **kwargs) -> None:
+        """Create a new shard download.
+
+        Args:
+            local_dir (str): Path to the destination directory.
+            shard_path (str): Path of the temporary local shard.
+            url (str): Full URL of the remote shard.
+            *args, **kwargs: Transfer options, see `transfers.Transfer`.
+        """
+
+        super().__init__(shard_path, url, *args, **kwargs)
+        self.local_dir = local_dir
+        self.extracted = []
+
+
+    async def run_async(self, session: aiohttp.ClientSession) -> str:
+        """Downloads the shard, then unpacks and removes it in a worker thread.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Returns:
+            str: Whole-shard digest, or None if checksums are disabled.
+        """
+
+        checksum = await super().run_async(session)
+        try:
+            self.extracted = await asyncio.to_thread(extract_shard, self.local_file, self.local_dir)
+        finally:
+            os.remove(self.local_file)
+        return checksum
+
+
+def packed_upload_transfers(url: str, local_dir: str, remote_dir: str, shards: list[list[str]], large_files: list[str], shard_dir: str, **transfer_kwargs) -> Iterator[transfers.Transfer]:
+    """Lazily creates the transfers for a packed upload.
+
+    Args:
+        url (str): Base URL of the filesystem.
+        local_dir (str): Path to the local directory.
+        remote_dir (str): Path to the remote directory.
+        shards (list[list[str]]): Relative paths in each shard, as returned by `plan_shards`.
+        large_files (list[str]): Relative paths of the files uploaded on their own.
+        shard_dir (str): Local directory the temporary shards are written to.
+        **transfer_kwargs: Options passed to each `transfers.Transfer`.
+
+    Yields:
+        transfers.Transfer: One transfer per shard, then one per large file.
+    """
+
+    for index, relative_paths in enumerate(shards):
+        name = shard_name(index)
+        remote_path = posixpath.join(remote_dir, SHARD_DIRECTORY, name).strip("/")
+        yield ShardUpload(local_dir, relative_paths, os.path.join(shard_dir, name), f"{url}/files/{remote_path}", **transfer_kwargs)
+
+    for relative_path in large_files:
+        local_file = os.path.join(local_dir, *relative_path.split("/"))
+        remote_path = posixpath.join(remote_dir, relative_path).strip("/")
+        yield transfers.MultipartUpload(local_file, f"{url}/files/{remote_path}", **transfer_kwargs)
+
+
+def packed_download_transfers(url: str, local_dir: str, remote_dir: str, remote_files: list[str], **transfer_kwargs) -> Iterator[transfers.Transfer]:
+    """Lazily creates the transfers for a packed download.
+
+    Args:
+        url (str): Base URL of the filesystem.
+        local_dir (str): Path to the local directory.
+        remote_dir (str): Path to the remote directory.
+        remote_files (list[str]): Relative paths of the remote files, shards and loose files alike.
+        **transfer_kwargs: Options passed to each `transfers.Transfer`.
+
+    Yields:
+        transfers.Transfer: A `ShardDownload` for each shard and a `transfers.MultipartDownload` for each other file.
+    """
+
+    shard_dir = os.path.join(local_dir, SHARD_DIRECTORY)
+    for relative_path in sorted(remote_files):
+        remote_url = f"{url}/files/{posixpath.join(remote_dir, relative_path).strip('/')}"
+        if is_shard(relative_path):
+            os.makedirs(shard_dir, exist_ok=True)
+            yield ShardDownload(local_dir, os.path.join(shard_dir, posixpath.basename(relative_path)), remote_url, **transfer_kwargs)
+        else:
+            local_file = os.path.join(local_dir, *relative_path.split("/"))
+            os.makedirs(os.path.dirname(local_file) or ".", exist_ok=True)
+            yield transfers.MultipartDownload(local_file, remote_url, **transfer_kwargs)
+
+
+def unpacked_paths(local_dir: str, finished_transfers: list[transfers.Transfer]) -> list[str]:
+    """Collects the local files written by a finished packed download.
+
+    Args:
+        local_dir (str): Path to the local directory.
+        finished_transfers (list[transfers.Transfer]): The transfers created by `packed_download_transfers`.
+
+    Returns:
+        list[str]: "/"-separated paths, relative to `local_dir`, of the unpacked and downloaded files.
+    """
+
+    paths = []
+    for transfer in finished_transfers:
+        if isinstance(transfer, ShardDownload):
+            paths.extend(transfer.extracted)
+        else:
+            paths.append(os.path.relpath(transfer.local_file, local_dir).replace(os.sep, "/"))
+    return sorted(paths)
+
+
+def finish_packed_download(local_dir: str, finished_transfers: list[transfers.Transfer]) -> list[str]:
+    """Removes the emptied temporary shard directory of a finished packed download and lists its files.
+
+    Args:
+        local_dir (str): Path to the local directory.
+        finished_transfers (list[transfers.Transfer]): The transfers created by `packed_download_transfers`.
+
+    Returns:
+        list[str]: "/"-separated paths, relative to `local_dir`, of the unpacked and downloaded files.
+    """
+
+    shard_dir = os.path.join(local_dir, SHARD_DIRECTORY)
+    if os.path.isdir(shard_dir) and not os.listdir(shard_dir):
+        os.rmdir(shard_dir)
+    return unpacked_paths(local_dir, finished_transfers)
+
+
+def stale_shards(remote_dir: str, remote_shards: Iterable[str], shard_paths: list[str]) -> list[str]:
+    """Lists the shards left in a packed directory by an earlier, larger pack.
+
+    Args:
+        remote_dir (str): Path to the remote packed directory.
+        remote_shards (Iterable[str]): Names of the files listed in its shard directory.
+        shard_paths (list[str]): Shard paths of the current pack, relative to `remote_dir`.
+
+    Returns:
+        list[str]: Full paths of the stale shards to delete, starting from the filesystem root.
+    """
+
+    current = {posixpath.basename(path) for path in shard_paths}
+    return sorted(
+        posixpath.join(remote_dir, SHARD_DIRECTORY, name).strip("/")
+        for name in remote_shards
+        if name not in current and name.endswith(SHARD_SUFFIX)
+    )
@@ -0,0 +1,107 @@
+import json
+import gzip
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+GZIP = "gzip"
+ZSTD = "zstd"
+COMPRESSIONS = (GZIP, ZSTD)
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(data: object) -> bytes:
+    """Serializes an object to JSON, with orjson when it is installed.
+
+    The two backends differ on values that are not plain JSON. orjson writes NaN and Infinity as
+    null, and serializes NumPy values, datetimes, UUIDs and dataclasses, also as dictionary keys.
+    The standard library writes NaN/Infinity tokens and raises TypeError on the others.
+
+    Args:
+        data (object): A JSON-like object.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode()
+
+
+def loads(data: bytes | str) -> object:
+    """Parses a JSON document, with orjson when it is installed.
+
+    Args:
+        data (bytes | str): The JSON document.
+
+    Returns:
+        object: The decoded JSON-like object.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def available_compressions() -> tuple[str, ...]:
+    """Lists the request body compressions usable in this environment.
+
+    Returns:
+        tuple[str, ...]: "gzip", plus "zstd" when the zstandard package is installed.
+    """
+
+    return COMPRESSIONS if zstandard is not None else (GZIP,)
+
+
+def compress(body: bytes, compression: str) -> bytes:
+    """Compresses a request body.
+
+    Args:
+        body (bytes): The uncompressed body.
+        compression (str): One of COMPRESSIONS.
+
+    Raises:
+        Exception: The compression is unknown, or zstd was requested without the zstandard package.
+
+    Returns:
+        bytes: The compressed body.
+    """
+
+    if compression == GZIP:
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    if compression == ZSTD:
+        if zstandard is None:
+            raise Exception("zstd compression requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    raise Exception(f"Unsupported compression '{compression}', options are {COMPRESSIONS}")
+
+
+def encode_body(data: object, compression: str = None, min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES) -> tuple[bytes, dict]:
+    """Serializes a request body, compressing it if it is large enough to be worth it.
+
+    Args:
+        data (object): A JSON-like object.
+        compression (str, optional): One of COMPRESSIONS, or None to send the body uncompressed. Defaults to None.
+        min_bytes (int, optional): Bodies smaller than this are sent uncompressed. Defaults to DEFAULT_COMPRESS_MIN_BYTES.
+
+    Returns:
+        tuple[bytes, dict]: The body, and the headers describing its encoding.
+    """
+
+    body = dumps(data)
+    if compression is None or len(body) < min_bytes:
+        return body, {}
+    return compress(body, compression), {"Content-Encoding": compression}
@@ -0,0 +1,449 @@
+import gzip
+import uuid
+import time
+import random
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+from . import batches
+from . import clients
+from . import serialization
+from . import transfers
+
+
+def _now_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _page(request: web.Request, items: list) -> web.Response:
+    """Answers a listing, paginated when the client sent a page size.
+
+    Args:
+        request (web.Request): The listing request.
+        items (list): Every item of the listing.
+
+    Returns:
+        web.Response: A plain JSON list, or a page with the token of the next one.
+    """
+
+    if clients.PAGE_SIZE_PARAM not in request.query:
+        return web.json_response(items)
+
+    limit = int(request.query[clients.PAGE_SIZE_PARAM])
+    offset = int(request.query.get(clients.PAGE_TOKEN_PARAM, 0))
+    page = {clients.PAGE_ITEMS_KEY: items[offset:offset + limit]}
+    if offset + limit < len(items):
+        page[clients.PAGE_TOKEN_PARAM] = str(offset + limit)
+    return web.json_response(page)
+
+
+async def _read_json(request: web.Request) -> dict:
+    """Reads a JSON request body, undoing any request compression.
+
+    Args:
+        request (web.Request): The request.
+
+    Returns:
+        dict: The decoded body, or {} if it is empty.
+    """
+
+    body = await request.read()
+    if body[:2] == b"\x1f\x8b":
+        body = gzip.decompress(body)
+    elif body[:4] == b"\x28\xb5\x2f\xfd":
+        body = serialization.zstandard.ZstdDecompressor().decompress(body)
+    return serialization.loads(body) if body else {}
+
+
+class MockBatch:
+    """Simulated batch whose jobs finish at fixed, pre-drawn times.
+    """
+
+    def __init__(self, batch_json: dict, finish_times: list[float], failed: list[bool]) -> None:
+        self.batch_json = batch_json
+        self.created = time.time()
+        self.finish_times = finish_times
+        self.failed = failed
+
+
+    def job_state(self, job_index: int, now: float) -> str:
+        if now < self.created + self.finish_times[job_index]:
+            return batches.JOB_RUNNING
+        return batches.JOB_FAILED if self.failed[job_index] else batches.JOB_SUCCEEDED
+
+
+    def status(self) -> dict:
+        now = time.time()
+        counts = {batches.JOB_SUCCEEDED: 0, batches.JOB_FAILED: 0, batches.JOB_RUNNING: 0}
+        for job_index in range(len(self.finish_times)):
+            counts[self.job_state(job_index, now)] += 1
+        return counts
+
+
+    def jobs(self, since: float = None) -> list[dict]:
+        now = time.time()
+        jobs = []
+        for job_index, finish_time in enumerate(self.finish_times):
+            state = self.job_state(job_index, now)
+            updated = self.created if state == batches.JOB_RUNNING else self.created + finish_time
+            if since is None or updated > since:
+                jobs.append({"index": job_index, "status": state, "updated": _now_iso(updated)})
+        return jobs
+
+
+class MockEngine:
+    """In-process stand-in for the ET Engine API, for offline tests and benchmarks.
+
+    Serves the filesystem (`/files`, `/list`, `/mkdir`), tool and batch endpoints the clients use
+    from an aiohttp server on a background thread, keeping everything in memory. Latency, a shared
+    bandwidth cap and random transient failures can be injected, and batch jobs finish after
+    `job_seconds` on average. Use it as a context manager:
+
+        with MockEngine(latency=0.02, bandwidth=100 * 1024 * 1024) as server:
+            engine = Engine(server.url)
+    """
+
+    def __init__(self, latency: float = 0.0, bandwidth: float = None, failure_rate: float = 0.0, failure_status: int = 503, job_seconds: float = 1.0, job_failure_rate: float = 0.0, api_key: str = None, seed: int = 0, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Creates a new mock server. Call `start` (or enter it as a context manager) to serve.
+
+        Args:
+            latency (float, optional): Delay added before every response, in seconds. Defaults to 0.0.
+            bandwidth (float, optional): Shared cap on the part bytes moved per second, or None for no cap. Defaults to None.
+            failure_rate (float, optional): Probability that a request is answered with `failure_status` instead. Defaults to 0.0.
+            failure_status (int, optional): Status code of injected failures. Defaults to 503.
+            job_seconds (float, optional): Mean duration of a batch job, in seconds. Each job takes between half and one and a half times this. Defaults to 1.0.
+            job_failure_rate (float, optional): Probability that a batch job fails. Defaults to 0.0.
+            api_key (str, optional): Required value of the Authorization header, or None to accept any non-empty key. Defaults to None.
+            seed (int, optional): Seed of the random failures and job durations. Defaults to 0.
+            host (str, optional): Interface to listen on. Defaults to "127.0.0.1".
+            port (int, optional): Port to listen on, 0 for any free port. Defaults to 0.
+        """
+
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.job_seconds = job_seconds
+        self.job_failure_rate = job_failure_rate
+        self.api_key = api_key
+        self.random = random.Random(seed)
+        self.host = host
+        self.port = port
+
+        self.filesystems = {}
+        self.files = {}
+        self.directories = {}
+        self.uploads = {}
+        self.downloads = {}
+        self.tools = {}
+        self.batches = {}
+        self.request_count = 0
+
+        self.link_free_at = 0.0
+        self.loop = None
+        self.runner = None
+        self.thread = None
+
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, to pass as `base_url` to the clients."""
+        return f"http://{self.host}:{self.port}"
+
+
+    def app(self) -> web.Application:
+        """Builds the aiohttp application.
+
+        Returns:
+            web.Application: The application, with its routes and fault-injection middleware.
+        """
+
+        app = web.Application(middlewares=[self.middleware], client_max_size=2 * clients.MAX_CHUNK_SIZE_BYTES)
+        app.router.add_route("*", "/filesystems", self.handle_filesystems)
+        app.router.add_route("*", "/filesystems/{fs_id}", self.handle_filesystem)
+        app.router.add_route("POST", "/filesystems/{fs_id}/mkdir/{path:.*}", self.handle_mkdir)
+        app.router.add_route("GET", "/filesystems/{fs_id}/list/{path:.*}", self.handle_list)
+        app.router.add_route("*", "/filesystems/{fs_id}/files/{path:.*}", self.handle_file)
+        app.router.add_route("*", "/tools", self.handle_tools)
+        app.router.add_route("*", "/tools/{tool_id}", self.handle_tool)
+        app.router.add_route("*", "/batches", self.handle_batches)
+        app.router.add_route("*", "/batches/{batch_id}", self.handle_batch)
+        app.router.add_route("GET", "/batches/{batch_id}/jobs", self.handle_jobs)
+        return app
+
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler) -> web.Response:
+        self.request_count += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            return web.Response(status=self.failure_status, text="Injected failure")
+
+        api_key = request.headers.get("Authorization")
+        if not api_key or (self.api_key is not None and api_key != self.api_key):
+            return web.Response(status=401, text="Unauthorized")
+        return await handler(request)
+
+
+    async def throttle(self, num_bytes: int) -> None:
+        """Delays a part so that all parts together stay under the bandwidth cap.
+
+        Args:
+            num_bytes (int): Size of the part, in bytes.
+        """
+
+        if not self.bandwidth:
+            return
+        now = time.monotonic()
+        start = max(now, self.link_free_at)
+        self.link_free_at = start + num_bytes / self.bandwidth
+        await asyncio.sleep(self.link_free_at - now)
+
+
+    def filesystem(self, request: web.Request) -> str:
+        fs_id = request.match_info["fs_id"]
+        if fs_id not in self.filesystems:
+            raise web.HTTPNotFound(text=f"Filesystem '{fs_id}' not found")
+        return fs_id
+
+
+    def add_directories(self, fs_id: str, path: str) -> None:
+        parts = path.strip("/").split("/")
+        for depth in range(1, len(parts) + 1):
+            self.directories[fs_id].add("/".join(parts[:depth]))
+
+
+    async def handle_filesystems(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            return _page(request, list(self.filesystems.values()))
+        if request.method == "POST":
+            data = await _read_json(request)
+            name = data["filesystem_name"]
+            if any(fs["filesystem_name"] == name for fs in self.filesystems.values()):
+                raise web.HTTPConflict(text=f"Filesystem '{name}' already exists")
+            fs_id = str(uuid.uuid4())
+            self.filesystems[fs_id] = {"filesystem_id": fs_id, "filesystem_name": name}
+            self.files[fs_id] = {}
+            self.directories[fs_id] = set()
+            return web.json_response(self.filesystems[fs_id])
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "POST"])
+
+
+    async def handle_filesystem(self, request: web.Request) -> web.Response:
+        fs_id = self.filesystem(request)
+        if request.method == "GET":
+            return web.json_response(self.filesystems[fs_id])
+        if request.method == "DELETE":
+            del self.filesystems[fs_id], self.files[fs_id], self.directories[fs_id]
+            return web.Response()
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "DELETE"])
+
+
+    async def handle_mkdir(self, request: web.Request) -> web.Response:
+        fs_id = self.filesystem(request)
+        path = request.match_info["path"].strip("/")
+        if path in self.directories[fs_id]:
+            raise web.HTTPConflict(text=f"Directory '{path}' already exists")
+        self.add_directories(fs_id, path)
+        return web.Response()
+
+
+    async def handle_list(self, request: web.Request) -> web.Response:
+        fs_id = self.filesystem(request)
+        path = request.match_info["path"].strip("/")
+        prefix = f"{path}/" if path else ""
+
+        files = []
+        for file_path, (contents, mtime) in self.files[fs_id].items():
+            if file_path.startswith(prefix) and "/" not in file_path[len(prefix):]:
+                files.append({"name": file_path[len(prefix):], "size": len(contents), "mtime": mtime})
+        directories = [d[len(prefix):] for d in self.directories[fs_id] if d.startswith(prefix) and d != path and "/" not in d[len(prefix):]]
+        return web.json_response({"files": sorted(files, key=lambda f: f["name"]), "directories": sorted(directories)})
+
+
+    async def handle_file(self, request: web.Request) -> web.Response:
+        fs_id = self.filesystem(request)
+        path = request.match_info["path"].strip("/")
+
+        if request.method == "POST":
+            data = await _read_json(request)
+            if data.get("complete"):
+                upload = self.uploads.pop(data["uploadId"])
+                contents = bytearray(upload["size"])
+                for starting_byte, part in upload["parts"].items():
+                    contents[starting_byte:starting_byte + len(part)] = part
+                self.files[fs_id][upload["path"]] = (bytes(contents), time.time())
+                if "/" in upload["path"]:
+                    self.add_directories(fs_id, upload["path"].rsplit("/", 1)[0])
+                return web.Response()
+            upload_id = str(uuid.uuid4())
+            self.uploads[upload_id] = {"path": path, "size": data["size"], "parts": {}}
+            return web.json_response({"uploadId": upload_id})
+
+        if request.method == "PUT":
+            upload_id, byte_range = request.headers["Content-Range"][1:].split("]:")
+            starting_byte = int(byte_range.split("-")[0])
+            part = await request.read()
+            await self.throttle(len(part))
+            self.uploads[upload_id]["parts"][starting_byte] = part
+            return web.Response(headers=self.checksum_headers(request, part))
+
+        if request.method == "GET":
+            if path not in self.files[fs_id]:
+                raise web.HTTPNotFound(text=f"File '{path}' not found")
+            contents = self.files[fs_id][path][0]
+            if "init" in request.query:
+                download_id = str(uuid.uuid4())
+                self.downloads[download_id] = path
+                return web.json_response({"size": len(contents), "download_id": download_id, "mtime": self.files[fs_id][path][1]})
+            start, end = (int(b) for b in request.headers["Content-Range"].split("-"))
+            part = contents[start:end]
+            await self.throttle(len(part))
+            return web.Response(body=part, headers=self.checksum_headers(request, part))
+
+        if request.method == "DELETE":
+            if self.files[fs_id].pop(path, None) is None:
+                raise web.HTTPNotFound(text=f"File '{path}' not found")
+            return web.Response()
+
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "POST", "PUT", "DELETE"])
+
+
+    def checksum_headers(self, request: web.Request, part: bytes) -> dict:
+        """Reports the server-side checksum of a part.
+
+        Uploaded parts get a checksum in every algorithm the client sent one in. Downloaded parts get
+        one in every algorithm, since the client cannot send its checksum before it has the bytes.
+
+        Args:
+            request (web.Request): The part request.
+            part (bytes): The part's bytes.
+
+        Returns:
+            dict: The checksum headers.
+        """
+
+        headers = {}
+        for algorithm in transfers.CHECKSUM_ALGORITHMS:
+            header = f"{transfers.CHECKSUM_HEADER_PREFIX}{algorithm}"
+            if request.method == "GET" or header in request.headers:
+                headers[header] = transfers.compute_checksum(part, algorithm)
+        return headers
+
+
+    async def handle_tools(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            return _page(request, list(self.tools.values()))
+        if request.method == "POST":
+            data = await _read_json(request)
+            tool_id = str(uuid.uuid4())
+            self.tools[tool_id] = {"tool_id": tool_id, "tool_name": data["tool_name"], "tool_description": data.get("tool_description", "")}
+            return web.json_response(self.tools[tool_id])
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "POST"])
+
+
+    async def handle_tool(self, request: web.Request) -> web.Response:
+        tool_id = request.match_info["tool_id"]
+        if tool_id not in self.tools:
+            raise web.HTTPNotFound(text=f"Tool '{tool_id}' not found")
+        if request.method == "GET":
+            return web.json_response(self.tools[tool_id])
+        if request.method == "DELETE":
+            del self.tools[tool_id]
+            return web.Response()
+        if request.method == "POST":
+            data = await _read_json(request)
+            n_jobs = max(len(data.get("variable_args") or []), 1)
+            batch_id = str(uuid.uuid4())
+            batch_json = {"batch_id": batch_id, "batch_tool": tool_id, "n_jobs": n_jobs, "batch_hardware": data.get("hardware")}
+            finish_times = [self.job_seconds * (0.5 + self.random.random()) for _ in range(n_jobs)]
+            failed = [self.random.random() < self.job_failure_rate for _ in range(n_jobs)]
+            self.batches[batch_id] = MockBatch(batch_json, finish_times, failed)
+            return web.json_response(batch_json)
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "POST", "DELETE"])
+
+
+    async def handle_batches(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            return _page(request, [batch.batch_json for batch in self.batches.values()])
+        if request.method == "DELETE":
+            self.batches.clear()
+            return web.Response()
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "DELETE"])
+
+
+    def batch(self, request: web.Request) -> MockBatch:
+        batch_id = request.match_info["batch_id"]
+        if batch_id not in self.batches:
+            raise web.HTTPNotFound(text=f"Batch '{batch_id}' not found")
+        return self.batches[batch_id]
+
+
+    async def handle_batch(self, request: web.Request) -> web.Response:
+        batch = self.batch(request)
+        if request.method == "GET":
+            return web.json_response(batch.status())
+        if request.method == "DELETE":
+            del self.batches[request.match_info["batch_id"]]
+            return web.Response()
+        raise web.HTTPMethodNotAllowed(request.method, ["GET", "DELETE"])
+
+
+    async def handle_jobs(self, request: web.Request) -> web.Response:
+        batch = self.batch(request)
+        since = request.query.get("since")
+        since = datetime.fromisoformat(since).timestamp() if since else None
+        return _page(request, batch.jobs(since))
+
+
+    def start(self) -> "MockEngine":
+        """Starts serving on a background thread.
+
+        Returns:
+            MockEngine: This server, once it accepts connections.
+        """
+
+        ready = threading.Event()
+
+        async def serve() -> None:
+            self.runner = web.AppRunner(self.app())
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, self.host, self.port)
+            await site.start()
+            self.port = self.runner.addresses[0][1]
+            ready.set()
+
+        def run() -> None:
+            self.loop = asyncio.new_event_loop()
+            self.loop.run_until_complete(serve())
+            self.loop.run_forever()
+            self.loop.run_until_complete(self.runner.cleanup())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="MockEngine", daemon=True)
+        self.thread.start()
+        ready.wait()
+        return self
+
+
+    def stop(self) -> None:
+        """Stops serving and waits for the background thread to exit.
+        """
+
+        if self.thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+
+
+    def __enter__(self) -> "MockEngine":
+        return self.start()
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,291 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Self
+import et_engine_core as etc
+
+from . import clients
+from . import serialization
+from . import encoding
+from .batches import Batch, BatchGroup
+from .filesystems import Filesystem
+
+
+DEFAULT_JOBS_PER_REQUEST = 1000
+DEFAULT_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_SUBMIT_WORKERS = 4
+
+
+def shard_jobs(variable_kwargs: Iterable[dict], jobs_per_request: int = DEFAULT_JOBS_PER_REQUEST, max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES) -> Iterator[list[dict]]:
+    """Lazily splits a sweep of job arguments into bounded shards.
+
+    A shard is closed once it holds `jobs_per_request` jobs, or once adding the next job would push
+    its serialized size past `max_request_bytes`. A single job larger than the limit gets a shard of
+    its own. Arrays among the job arguments are encoded with `encoding.encode_arrays` before they
+    are measured.
+
+    Args:
+        variable_kwargs (Iterable[dict]): Arguments of each job. May be a lazy generator.
+        jobs_per_request (int, optional): Maximum number of jobs per shard. Defaults to DEFAULT_JOBS_PER_REQUEST.
+        max_request_bytes (int, optional): Approximate maximum serialized size of a shard, in bytes. Defaults to DEFAULT_MAX_REQUEST_BYTES.
+
+    Yields:
+        list[dict]: Each shard of job arguments, in order.
+    """
+
+    shard = []
+    shard_bytes = 0
+    for job_kwargs in variable_kwargs:
+        job_kwargs = encoding.encode_arrays(job_kwargs)
+        job_bytes = len(serialization.dumps(job_kwargs)) + 1
+        if shard and (len(shard) >= jobs_per_request or shard_bytes + job_bytes > max_request_bytes):
+            yield shard
+            shard = []
+            shard_bytes = 0
+        shard.append(job_kwargs)
+        shard_bytes += job_bytes
+
+    if shard:
+        yield shard
+
+
+class Hardware(etc.Hardware):
+    """Interface for defining ET Engine Hardware specs.
+    """
+
+    def __init__(self, filesystem_list: list[Filesystem] = [], cpu: int = 1, memory: int = 256):
+        """Create an ET Engine Hardware object.
+
+        Args:
+            filesystem_list (list[Filesystem], optional): List of filesystems to give jobs access to. Defaults to [].
+            cpu (int, optional): Number of processors to give jobs access to, in vCPU. Defaults to 1.
+            memory (int, optional): Amount of memory (RAM) to give jobs access to, in MB. Defaults to 256.
+        """
+        super().__init__(filesystem_list, cpu, memory)
+
+
+class Tool(etc.Tool):
+    """Client for interacting with a specific tool.
+    """
+
+    def __init__(self, base_url: str, *args, transport: clients.Transport = None, index: clients.ResourceIndex = None, **kwargs) -> None:
+        """Create an interactive ET Engine Tool object.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            transport (clients.Transport, optional): Pooled transport shared with the parent client. Defaults to the shared default transport.
+            index (clients.ResourceIndex, optional): Index of the parent client, updated when this tool is deleted. Defaults to None.
+        """
+        super().__init__(*args, **kwargs)
+        self.client = clients.APIClient(f"{base_url}/tools/{self.tool_id}", transport=transport)
+        self.base_url = base_url
+        self.index = index
+
+
+    def __call__(self, **kwargs) -> Batch:
+        """Makes the object callable like a function.
+
+        Returns:
+            Batch: the batch of jobs submitted to The Engine.
+        """       
+
+        if "hardware" in kwargs:
+            hardware_arg = kwargs.pop("hardware")
+            assert isinstance(hardware_arg, Hardware)
+            hardware = hardware_arg.to_json()
+
+        else:
+            hardware = Hardware().to_json()
+
+        data = {
+            'fixed_args': encoding.encode_arrays(kwargs),
+            'variable_args': [],
+            'hardware': hardware
+        }
+        batch_json = self.client.post(data=data)
+        return Batch.from_json(self.base_url, batch_json, transport=self.client.transport)
+        
+
+    def run_batch(self, fixed_kwargs: dict = {}, variable_kwargs: list[dict] = [], hardware: Hardware = Hardware()) -> Batch:
+        """Submits a parallelized batch of jobs.
+
+        Argument values that are `array.array` or NumPy arrays are sent compactly as base64 with their
+        dtype and shape (see `encoding.encode_array`). Declare them with `ArrayOf` in the tool's
+        `ArgParser` to decode them.
+
+        Args:
+            fixed_kwargs (dict, optional): Key-value arguments to be passed into each job in the batch. Defaults to {}.
+            variable_kwargs (list, optional): Variable arguments to be passed into separate jobs in the batch. Defaults to [].
+            hardware (Hardware, optional): The compute hardware to run for each job in the batch. Defaults to default hardware.
+
+        Returns:
+            Batch: The batch of jobs submitted to The Engine
+        """
+        
+
+        data = {
+            'fixed_args': encoding.encode_arrays(fixed_kwargs),
+            'variable_args': [encoding.encode_arrays(job_kwargs) for job_kwargs in variable_kwargs]
+        }
+
+        if hardware is None:
+            data['hardware'] = Hardware().to_json()
+        else:
+            assert isinstance(hardware, Hardware)
+            data['hardware'] = hardware.to_json()
+
+        batch_json = self.client.post(data=data)
+        return Batch.from_json(self.base_url, batch_json, transport=self.client.transport)
+              
+
+    def stream_batch(self, variable_kwargs: Iterable[dict], fixed_kwargs: dict = {}, hardware: Hardware = None, jobs_per_request: int = DEFAULT_JOBS_PER_REQUEST, max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES, max_workers: int = DEFAULT_MAX_SUBMIT_WORKERS) -> BatchGroup:
+        """Submits a very large sweep of jobs as a group of bounded batches.
+
+        The sweep is consumed lazily and split with `shard_jobs`, and each shard is submitted as its own
+        `run_batch` request. At most `max_workers` shards are built or in flight at once, so memory and
+        request size stay bounded however long the sweep is.
+
+        Args:
+            variable_kwargs (Iterable[dict]): Variable arguments of each job. May be a lazy generator.
+            fixed_kwargs (dict, optional): Key-value arguments to be passed into each job. Defaults to {}.
+            hardware (Hardware, optional): The compute hardware to run for each job. Defaults to default hardware.
+            jobs_per_request (int, optional): Maximum number of jobs per batch. Defaults to DEFAULT_JOBS_PER_REQUEST.
+            max_request_bytes (int, optional): Approximate maximum size of each request's job arguments, in bytes. Defaults to DEFAULT_MAX_REQUEST_BYTES.
+            max_workers (int, optional): Maximum number of batch submissions in flight at once. Defaults to DEFAULT_MAX_SUBMIT_WORKERS.
+
+        Returns:
+            BatchGroup: One handle over every submitted batch, in sweep order.
+        """
+
+        batches = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for shard in shard_jobs(variable_kwargs, jobs_per_request=jobs_per_request, max_request_bytes=max_request_bytes):
+                if len(pending) >= max_workers:
+                    batches.append(pending.popleft().result())
+                pending.append(executor.submit(self.run_batch, fixed_kwargs, shard, hardware))
+            while pending:
+                batches.append(pending.popleft().result())
+
+        return BatchGroup(batches)
+
+        
+    def status(self) -> dict:
+        """Fetches the current status of the tool.
+
+        Returns:
+            dict: A JSON-like dictionary describing the tool status.
+        """
+        return self.client.get()
+    
+
+    def delete(self) -> None:
+        """Deletes the tool [NOTE: This action cannot be un-done!]
+        """
+        response = self.client.delete()
+        if self.index is not None:
+            self.index.discard(self.tool_id)
+        return response
+    
+
+    @staticmethod
+    def from_json(base_url: str, tool_json: dict, transport: clients.Transport = None, index: clients.ResourceIndex = None) -> Self:
+        """Convert a JSON object to an interactive Tool.
+
+        Args:
+            base_url (str): Base endpoint for requests.
+            tool_json (dict): JSON description of the tool.
+            transport (clients.Transport, optional): Pooled transport shared with the parent client. Defaults to None.
+            index (clients.ResourceIndex, optional): Index of the parent client. Defaults to None.
+
+        Returns:
+            Self: A Tool object.
+        """
+        return Tool(base_url, transport=transport, index=index, **tool_json)
+
+
+class ToolsClient(clients.APIClient):
+    """Client for interacting with ET Engine Tools.
+    """
+
+    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL, transport: clients.Transport = None, index_ttl: float = clients.DEFAULT_INDEX_TTL_SECONDS) -> None:
+        """Create a new client for interacting with ET Engine Tools.
+
+        Args:
+            base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            transport (clients.Transport, optional): Pooled transport shared by this client and every Tool it creates. Defaults to the shared default transport.
+            index_ttl (float, optional): Number of seconds `connect` trusts the last tool listing. Defaults to clients.DEFAULT_INDEX_TTL_SECONDS.
+        """
+        super().__init__(f"{base_url}/tools", transport=transport)
+        self.base_url = base_url
+        self.index = clients.ResourceIndex(lambda t: t["tool_id"], lambda t: t["tool_name"], ttl=index_ttl)
+
+
+    def create_tool(self, tool_name: str, tool_description: str) -> Tool:
+        """Create a new ET Engine Tool.
+
+        Args:
+            tool_name (str): Unique name of the tool.
+            tool_description (str): Description of what the tool does.
+
+        Returns:
+            Tool: A client for the newly-created Tool.
+        """
+        data = {
+            "tool_name": tool_name,
+            "tool_description": tool_description
+        }
+        tool_json = self.post(data=data)
+        self.index.put(tool_json)
+        return Tool.from_json(self.base_url, tool_json, transport=self.transport, index=self.index)
+    
+
+    def list_tools(self) -> list[Tool]:
+        """Lists all the available tools.
+
+        Returns:
+            list[Tool]: A list of individual Tool clients.
+        """
+        tools_list = self.get()
+        self.index.refresh(tools_list)
+        return [Tool.from_json(self.base_url, t, transport=self.transport, index=self.index) for t in tools_list]
+    
+
+    def iter_tools(self, where: Callable[[dict], bool] = None, filters: dict = {}, page_size: int = clients.DEFAULT_PAGE_SIZE) -> Iterator[Tool]:
+        """Lazily iterates over the available tools, fetching one page at a time.
+
+        A Tool client is only built for each tool the iteration reaches that passes `where`.
+
+        Args:
+            where (Callable[[dict], bool], optional): Filter applied to each tool's raw JSON description. Defaults to None.
+            filters (dict, optional): Query string filters passed to the API. Defaults to {}.
+            page_size (int, optional): Number of tools requested per page. Defaults to clients.DEFAULT_PAGE_SIZE.
+
+        Yields:
+            Tool: A Tool client for each matching tool.
+        """
+        for tool_json in self.iter_resources(where=where, filters=filters, page_size=page_size):
+            yield Tool.from_json(self.base_url, tool_json, transport=self.transport, index=self.index)
+    
+
+    def connect(self, tool_name: str) -> Tool:
+        """Connect to a specific Tool.
+
+        The tool is looked up in the client's index, which is only refreshed from the API when it is
+        stale or does not know the name.
+
+        Args:
+            tool_name (str): Name of the Tool to connect to.
+
+        Raises:
+            Exception: No Tool exists with the specified name.
+
+        Returns:
+            Tool: A new Tool client.
+        """
+        tool_json = self.index.get(name=tool_name)
+        if tool_json is None:
+            self.index.refresh(self.get())
+            tool_json = self.index.find(name=tool_name)
+        if tool_json is None:
+            raise Exception("Tool does not exist")
+        return Tool.from_json(self.base_url, tool_json, transport=self.transport, index=self.index)
\ No newline at end of file
@@ -1,140 +1,63 @@
 import os
+import json
+import atexit
+import threading
 import logging
 import sys
-from typing import Self
-import et_engine_core as etc
+import importlib
+import keyword
+from array import array
 
-from . import clients
-from .batches import Batch
-from .filesystems import Filesystem
+from . import encoding
 
 
-class Hardware(etc.Hardware):
-    """Interface for defining ET Engine Hardware specs.
-    """
-
-    def __init__(self, filesystem_list: list[Filesystem] = [], cpu: int = 1, memory: int = 256):
-        """Create an ET Engine Hardware object.
-
-        Args:
-            filesystem_list (list[Filesystem], optional): List of filesystems to give jobs access to. Defaults to [].
-            cpu (int, optional): Number of processors to give jobs access to, in vCPU. Defaults to 1.
-            memory (int, optional): Amount of memory (RAM) to give jobs access to, in MB. Defaults to 256.
-        """
-        super().__init__(filesystem_list, cpu, memory)
-
-
-class Tool(etc.Tool):
-    """Client for interacting with a specific tool.
-    """
-
-    def __init__(self, base_url: str, *args, **kwargs) -> None:
-        """Create an interactive ET Engine Tool object.
-
-        Args:
-            base_url (str): Base endpoint for requests.
-        """
-        super().__init__(*args, **kwargs)
-        self.client = clients.APIClient(f"{base_url}/tools/{self.tool_id}")
-        self.base_url = base_url
-
-
-    def __call__(self, **kwargs) -> Batch:
-        """Makes the object callable like a function.
-
-        Returns:
-            Batch: the batch of jobs submitted to The Engine.
-        """       
-
-        if "hardware" in kwargs:
-            hardware_arg = kwargs.pop("hardware")
-            assert isinstance(hardware_arg, Hardware)
-            hardware = hardware_arg.to_json()
-
-        else:
-            hardware = Hardware().to_json()
-
-        data = {
-            'fixed_args': kwargs,
-            'variable_args': [],
-            'hardware': hardware
-        }
-        batch_json = self.client.post(data=data)
-        return Batch.from_json(self.base_url, batch_json)
-        
-
-    def run_batch(self, fixed_kwargs: dict = {}, variable_kwargs: list[dict] = [], hardware: Hardware = Hardware()) -> Batch:
-        """Submits a parallelized batch of jobs.
-
-        Args:
-            fixed_kwargs (dict, optional): Key-value arguments to be passed into each job in the batch. Defaults to {}.
-            variable_kwargs (list, optional): Variable arguments to be passed into separate jobs in the batch. Defaults to [].
-            hardware (Hardware, optional): The compute hardware to run for each job in the batch. Defaults to default hardware.
-
-        Returns:
-            Batch: The batch of jobs submitted to The Engine
-        """
-        
-
-        data = {
-            'fixed_args': fixed_kwargs,
-            'variable_args': variable_kwargs
-        }
+# Client-side names formerly defined here. They are loaded from `tool_clients` on first access, so
+# tool containers that only need `ArgParser` and `Logger` never import the network stack.
+_LAZY_ATTRIBUTES = (
+    "Tool",
+    "Hardware",
+    "ToolsClient",
+    "shard_jobs",
+    "DEFAULT_JOBS_PER_REQUEST",
+    "DEFAULT_MAX_REQUEST_BYTES",
+    "DEFAULT_MAX_SUBMIT_WORKERS",
+)
 
-        if hardware is None:
-            data['hardware'] = Hardware().to_json()
-        else:
-            assert isinstance(hardware, Hardware)
-            data['hardware'] = hardware.to_json()
 
-        batch_json = self.client.post(data=data)
-        return Batch.from_json(self.base_url, batch_json)
-              
-        
-    def status(self) -> dict:
-        """Fetches the current status of the tool.
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(".tool_clients", __package__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        Returns:
-            dict: A JSON-like dictionary describing the tool status.
-        """
-        return self.client.get()
-    
-
-    def delete(self) -> None:
-        """Deletes the tool [NOTE: This action cannot be un-done!]
-        """
-        return self.client.delete()
-    
 
-    @staticmethod
-    def from_json(base_url: str, tool_json: dict) -> Self:
-        """Convert a JSON object to an interactive Tool.
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-        Args:
-            base_url (str): Base endpoint for requests.
-            tool_json (dict): JSON description of the tool.
-
-        Returns:
-            Self: A Tool object.
-        """
-        return Tool(base_url, **tool_json)
-                
 
 class Logger:
     """
     Utility for tool-side logging. The determination of whether to log, where to log, and what
     logging level to use must be made within the tool.
 
+    With `asynchronous=True`, logging calls only put the record on a queue. A background thread
+    writes the records to the file and flushes it every `flush_records` records or `flush_interval`
+    seconds. The queue is drained on exit, by an unhandled exception, and by `flush()` or `close()`.
+
     NOTE: This will likely be refactored to another module or repository in the future.
     """
 
-    def __init__(self, log_file: str, level='info', append=True):
+    def __init__(self, log_file: str, level='info', append=True, asynchronous=False, flush_records=256, flush_interval=1.0):
         """Creates a logger object.
 
         Args:
             log_file (str): Path to the log file.
             level (str, optional): Log level, options are ['debug', 'info', 'warning', 'error', 'critical']. Defaults to 'info'.
             append (bool, optional): Whether to append to an existing log or overwrite. Defaults to True.
+            asynchronous (bool, optional): Whether to write the log on a background thread instead of in each logging call. Defaults to False.
+            flush_records (int, optional): In asynchronous mode, number of records written between flushes of the file. Defaults to 256.
+            flush_interval (float, optional): In asynchronous mode, longest time a record waits before the file is flushed, in seconds. Defaults to 1.0.
         """
 
         if level.lower() == 'debug':
@@ -156,20 +79,47 @@ class Logger:
             filemode = 'w'
 
         self.logger = logging.getLogger(__name__)
-        log_handler = logging.FileHandler(
-            filename=log_file,
-            encoding='utf-8',
-            mode=filemode
-        )
+        self.listener = None
+        self.lock = threading.Lock()
+        log_format = logging.Formatter('%(asctime)s %(message)s', datefmt='%Y-%m-%d %I:%M:%S %p')
+
+        if asynchronous:
+            # Imported here so synchronous tools don't pay for logging.handlers
+            import queue
+            from . import log_handlers
+
+            self.log_handler = log_handlers.BatchedFileHandler(
+                filename=log_file,
+                encoding='utf-8',
+                mode=filemode,
+                flush_records=flush_records,
+                flush_interval=flush_interval
+            )
+            self.log_handler.setFormatter(log_format)
+            self.queue = queue.SimpleQueue()
+            queue_handler = log_handlers.LocalQueueHandler(self.queue)
+            self.listener = log_handlers.BatchingQueueListener(self.queue, self.log_handler, flush_interval=flush_interval)
+            self.listener.start()
+            atexit.register(self.close)
+            handlers = [queue_handler]
+
+        else:
+            self.log_handler = logging.FileHandler(
+                filename=log_file,
+                encoding='utf-8',
+                mode=filemode
+            )
+            self.log_handler.setFormatter(log_format)
+            handlers = [self.log_handler]
+
         logging.basicConfig(
-            handlers=[log_handler], 
-            level=logging_level,
-            format='%(asctime)s %(message)s',
-            datefmt='%Y-%m-%d %I:%M:%S %p'
+            handlers=handlers, 
+            level=logging_level
         )
 
         def handle_unhandled_exception(exc_type, exc_value, exc_traceback):
             self.logger.critical("UNHANDLED EXCEPTION", exc_info=(exc_type, exc_value, exc_traceback))
+            self.flush()
 
         sys.excepthook = handle_unhandled_exception
 
@@ -190,18 +140,137 @@ class Logger:
         self.logger.debug(*args, **kwargs)
 
 
+    def flush(self) -> None:
+        """Waits until every record logged so far is written, then flushes the log file.
+        """
+        with self.lock:
+            if self.listener is not None:
+                # Stopping the listener drains the queue
+                self.listener.stop()
+                self.listener.start()
+            self.log_handler.flush()
+
+
+    def close(self) -> None:
+        """Drains the queue and stops the background writer in asynchronous mode, then flushes the log file.
+
+        Logging calls made after closing are no longer written.
+        """
+        with self.lock:
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+                atexit.unregister(self.close)
+            self.log_handler.flush()
+
+
+class ListOf:
+    """Argument type for delimited lists, e.g. `ListOf(int)` parses "1,2,3" to [1, 2, 3].
+
+    Values starting with "[" are parsed as JSON lists instead.
+    """
+
+    def __init__(self, item_type: type = str, separator: str = ",") -> None:
+        """Creates a new list type.
+
+        Args:
+            item_type (type, optional): Type each item is cast to. Defaults to str.
+            separator (str, optional): Delimiter between items. Defaults to ",".
+        """
+        self.item_type = item_type
+        self.separator = separator
+
+
+    def __call__(self, value: str | list) -> list:
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith("["):
+                value = json.loads(value)
+            elif not value:
+                return []
+            else:
+                value = value.split(self.separator)
+        return [self.item_type(item) for item in value]
+
+
+    def __repr__(self) -> str:
+        return f"ListOf({getattr(self.item_type, '__name__', self.item_type)})"
+
+
+class ArrayOf:
+    """Argument type for numeric arrays, decoded straight into an `array.array` or NumPy array.
+
+    Accepts arrays encoded by `Tool.run_batch` (see `encoding.encode_array`), delimited text
+    ("0.5,1.5") or a JSON list ("[0.5, 1.5]"). Arguments arrive as environment variables, so an
+    encoded array holds at most about 95 KiB of data (see `encoding.MAX_ENCODED_BYTES`); larger
+    arrays are better uploaded to a filesystem and read from there.
+    """
+
+    def __init__(self, typecode: str = "d", separator: str = ",", numpy: bool = False) -> None:
+        """Creates a new array type.
+
+        Args:
+            typecode (str, optional): `array` typecode of the items, e.g. "d" for float64 or "q" for int64. Encoded arrays of another type are converted. Defaults to "d".
+            separator (str, optional): Delimiter between items in delimited text. Defaults to ",".
+            numpy (bool, optional): Whether to return a NumPy array, with the encoded shape if there is one. Defaults to False.
+        """
+        self.typecode = typecode
+        self.separator = separator
+        self.numpy = numpy
+        self.item_type = float if typecode in "fd" else int
+
+
+    def __call__(self, value: str | list) -> array:
+        if encoding.is_encoded(value):
+            if self.numpy:
+                return encoding.decode_array(value, numpy=True).astype(encoding.dtype_of(self.typecode), copy=False)
+            decoded = encoding.decode_array(value)
+            return decoded if decoded.typecode == self.typecode else array(self.typecode, map(self.item_type, decoded))
+
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith("["):
+                value = json.loads(value)
+            elif not value:
+                value = []
+            else:
+                value = value.split(self.separator)
+        if self.numpy:
+            import numpy as np
+            return np.array(value, dtype=encoding.dtype_of(self.typecode))
+        return array(self.typecode, map(self.item_type, value))
+
+
+    def __repr__(self) -> str:
+        return f"ArrayOf({self.typecode!r})"
+
+
+def JSON(value: str | object) -> object:
+    """Argument type for JSON documents, e.g. nested configuration.
+
+    Args:
+        value (str | object): A JSON document, or an already decoded default.
+
+    Returns:
+        object: The decoded value.
+    """
+    return json.loads(value) if isinstance(value, str) else value
+
+
 class Argument:
     """Tool-side argument handling.
 
     NOTE: This will likely be refactored to another module or repository in the future.
     """
 
+    _UNRESOLVED = object()
+
     def __init__(self, name: str, type: type = str, description: str = "", required: bool = False, default: object = None) -> None:
         """Creates a new Argument to be parsed by the tool.
 
         Args:
             name (str): Name/key of the argument.
-            type (type, optional): Object type of the argument. Defaults to str.
+            type (type, optional): Object type of the argument, or a structured type such as `ListOf`, `ArrayOf` or `JSON`. Defaults to str.
             description (str, optional): Description of the argument. Defaults to "".
             required (bool, optional): Whether the argument is required or not. Defaults to False.
             default (object, optional): Default value of the argument. Defaults to None.
@@ -211,14 +280,14 @@ class Argument:
         self.description = description
         self.required = required
         self.default = default
+        self._value = Argument._UNRESOLVED
 
 
-    @property
-    def value(self) -> object:
-        """Sets the value of this argument.
+    def resolve(self) -> object:
+        """Reads the argument from the environment and casts it to its type, then caches the result.
 
         Raises:
-            Exception: If the argument is required but not found in the environment variables.
+            Exception: If the argument is required but not found in the environment variables, or cannot be cast to its type.
 
         Returns:
             object: The argument value.
@@ -232,23 +301,74 @@ class Argument:
             arg_value = os.environ.get(self.name, default=self.default)
 
         if arg_value is not None:
-            arg_value = self.type(arg_value)
+            try:
+                arg_value = self.type(arg_value)
+            except Exception as e:
+                raise Exception(f"Invalid value for argument '{self.name}': {e}")
 
+        self._value = arg_value
         return arg_value
 
 
+    @property
+    def value(self) -> object:
+        """The value of this argument, read from the environment on first access only.
+
+        Raises:
+            Exception: If the argument is required but not found in the environment variables.
+
+        Returns:
+            object: The argument value.
+        """
+        if self._value is Argument._UNRESOLVED:
+            return self.resolve()
+        return self._value
+
+
+class ArgNamespace:
+    """Base class of the slotted namespaces returned by `ArgParser.parse_args`.
+    """
+
+    __slots__ = ()
+
+    def as_dict(self) -> dict:
+        """Returns the arguments as a dictionary.
+
+        Returns:
+            dict: Argument values keyed by name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())})"
+
+
 class ArgParser:
     """Tool-side argument parser.
+
+    By default each argument is read from the environment as soon as it is added and set as an
+    attribute of the parser. With `lazy=True`, adding arguments only declares them, and
+    `parse_args` reads them all at once into a slotted namespace, reporting every missing or
+    invalid argument together:
+
+        parser = ArgParser("my-tool", lazy=True)
+        parser.add_argument("depths", type=ArrayOf("d"), required=True)
+        parser.add_argument("config", type=JSON, default={})
+        args = parser.parse_args()
     """
 
-    def __init__(self, name: str = "") -> None:
+    def __init__(self, name: str = "", lazy: bool = False) -> None:
         """Creates a new collection of arguments to be parsed.
 
         Args:
             name (str, optional): name of the parser. Defaults to "".
+            lazy (bool, optional): Whether to defer reading the arguments to `parse_args`. Defaults to False.
         """
         self.name = name
+        self.lazy = lazy
         self.arguments = []
+        self.namespace = None
 
 
     def add_argument(self, name: str, type: type = str, description: str = "", required: bool = False, default: object = None) -> None:
@@ -260,81 +380,86 @@ class ArgParser:
             description (str, optional): Description of the argument. Defaults to "".
             required (bool, optional): Whether the argument is required or not. Defaults to False.
             default (object, optional): Default value of the argument. Defaults to None.
+
+        Raises:
+            Exception: The name cannot be used for this argument, see `check_name`.
         """
+        self.check_name(name)
         arg = Argument(name, type=type, description=description, required=required, default=default)
         self.arguments.append(arg)
-        self.__setattr__(arg.name, arg.value)
-
-
-    def __str__(self) -> str:
-        """Prints a summary of the arguments and their values.
-
-        Returns:
-            str: A multi-line string representation of the arguments and their values.
-        """
-        output_string = f"-----{self.name}-----\n"
-        for arg in self.arguments:
-            output_string += f"{arg.name}: {arg.value}\n"
-        output_string += "-" * (10 + len(self.name))
-        return output_string
+        self.namespace = None
+        if not self.lazy:
+            self.__setattr__(arg.name, arg.value)
 
 
-class ToolsClient(clients.APIClient):
-    """Client for interacting with ET Engine Tools.
-    """
+    def check_name(self, name: str) -> None:
+        """Checks that a new argument's name is free, so it can become an attribute.
 
-    def __init__(self, base_url: str = clients.DEFAULT_BASE_URL) -> None:
-        """Create a new client for interacting with ET Engine Tools.
+        Names must be unique and must not shadow a member of the parsed namespace (e.g. `as_dict`).
+        A lazy parser's names must also be valid identifiers, and an eager parser's must not shadow
+        one of its own attributes (e.g. `name` or `parse_args`).
 
         Args:
-            base_url (str, optional): Base endpoint for requests. Defaults to clients.DEFAULT_BASE_URL.
+            name (str): Name of the new argument.
+
+        Raises:
+            Exception: The name is already taken or cannot be an attribute.
         """
-        super().__init__(f"{base_url}/tools")
-        self.base_url = base_url
+        if any(arg.name == name for arg in self.arguments):
+            raise Exception(f"Argument '{name}' was already added to '{self.name}'")
+        if hasattr(ArgNamespace, name):
+            raise Exception(f"Argument name '{name}' is reserved by the parsed namespace")
+        if self.lazy and (not name.isidentifier() or keyword.iskeyword(name)):
+            raise Exception(f"Argument name '{name}' must be a valid identifier to parse into a namespace")
+        if not self.lazy and hasattr(self, name):
+            raise Exception(f"Argument name '{name}' clashes with an ArgParser attribute, use ArgParser(lazy=True) and read it from parse_args() instead")
 
 
-    def create_tool(self, tool_name: str, tool_description: str) -> Tool:
-        """Create a new ET Engine Tool.
+    def parse_args(self) -> ArgNamespace:
+        """Reads every argument once and returns them in a slotted namespace.
 
-        Args:
-            tool_name (str): Unique name of the tool.
-            tool_description (str): Description of what the tool does.
+        The result is cached, so calling this again is free until another argument is added.
+
+        Raises:
+            Exception: One or more arguments are missing or invalid. The message lists all of them.
 
         Returns:
-            Tool: A client for the newly-created Tool.
+            ArgNamespace: An object with one attribute per argument.
         """
-        data = {
-            "tool_name": tool_name,
-            "tool_description": tool_description
-        }
-        tool_json = self.post(data=data)
-        return Tool.from_json(self.base_url, tool_json)
-    
+        if self.namespace is not None:
+            return self.namespace
 
-    def list_tools(self) -> list[Tool]:
-        """Lists all the available tools.
+        names = [arg.name for arg in self.arguments]
+        invalid = [name for name in names if not name.isidentifier() or keyword.iskeyword(name)]
+        if invalid:
+            raise Exception(f"Argument names must be valid identifiers to parse into a namespace: {', '.join(invalid)}")
 
-        Returns:
-            list[Tool]: A list of individual Tool clients.
-        """
-        tools_list = self.get()
-        return [Tool.from_json(self.base_url, t) for t in tools_list]
-    
+        values = {}
+        errors = []
+        for arg in self.arguments:
+            try:
+                values[arg.name] = arg.value
+            except Exception as e:
+                errors.append(str(e))
+        if errors:
+            raise Exception(f"{len(errors)} invalid argument(s) for '{self.name}':\n" + "\n".join(errors))
 
-    def connect(self, tool_name: str) -> Tool:
-        """Connect to a specific Tool.
+        namespace_class = type(f"{self.name.title().replace('-', '').replace(' ', '')}Args", (ArgNamespace,), {"__slots__": tuple(names)})
+        namespace = namespace_class()
+        for name, value in values.items():
+            setattr(namespace, name, value)
+        self.namespace = namespace
+        return namespace
 
-        Args:
-            tool_name (str): Name of the Tool to connect to.
 
-        Raises:
-            Exception: No Tool exists with the specified name.
+    def __str__(self) -> str:
+        """Prints a summary of the arguments and their values.
 
         Returns:
-            Tool: A new Tool client.
+            str: A multi-line string representation of the arguments and their values.
         """
-        tools_list = self.list_tools()
-        for t in tools_list:
-            if t.tool_name == tool_name:
-                return t
-        raise Exception("Tool does not exist")
\ No newline at end of file
+        output_string = f"-----{self.name}-----\n"
+        for arg in self.arguments:
+            output_string += f"{arg.name}: {arg.value}\n"
+        output_string += "-" * (10 + len(self.name))
+        return output_string
@@ -0,0 +1,1630 @@
+import os
+import json
+import math
+import mmap
+import base64
+import hashlib
+import zlib
+import time
+import threading
+import warnings
+from typing import Awaitable, Callable, Iterable, Iterator
+
+import asyncio
+import aiohttp
+
+from tqdm import tqdm
+
+from .clients import MIN_CHUNK_SIZE_BYTES, MAX_CHUNK_SIZE_BYTES, RetryPolicy, TokenBucket, TransientError, Transport, default_transport
+from .instrumentation import Hooks, PartEvent, TransferEvent
+
+
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_INITIAL_CONCURRENCY = 5
+DEFAULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+DEFAULT_TIMEOUT_SECONDS = 7200
+DEFAULT_CONTROL_TIMEOUT_SECONDS = 60
+MANIFEST_SUFFIX = ".etmanifest"
+STREAM_CHUNK_SIZE_BYTES = 1024 * 1024
+AUTO_CHUNK_SIZE = "auto"
+DEFAULT_CHECKSUM_ALGORITHM = "sha256"
+CHECKSUM_ALGORITHMS = ("sha256", "crc32")
+CHECKSUM_HEADER_PREFIX = "x-et-checksum-"
+# Fields of a download's init response that identify the remote file's contents, in order of preference
+REMOTE_IDENTITY_KEYS = ("etag", "mtime", "last_modified")
+DEFAULT_MAX_FILES = 16
+DEFAULT_TARGET_PARTS = 1000
+ASSUMED_STREAM_BYTES_PER_SECOND = 50 * 1024 * 1024
+MAX_REQUEST_OVERHEAD = 0.05
+
+
+def choose_chunk_size(file_size_bytes: int, target_parts: int = DEFAULT_TARGET_PARTS, rtt: float = None, min_parts: int = DEFAULT_MAX_CONCURRENCY) -> int:
+    """Picks a part size for a file, within MIN_CHUNK_SIZE_BYTES and MAX_CHUNK_SIZE_BYTES.
+
+    The size starts from splitting the file into `target_parts` parts. When a round-trip time is
+    known, it is raised so that one round trip costs at most MAX_REQUEST_OVERHEAD of the time needed
+    to stream a part at ASSUMED_STREAM_BYTES_PER_SECOND, and rounded up to a whole MiB. It is then
+    capped so the file still splits into at least `min_parts` parts, leaving the concurrency
+    controller parts to run in parallel.
+
+    The file therefore always splits into at least min(min_parts, ceil(file_size_bytes /
+    MIN_CHUNK_SIZE_BYTES)) parts, whatever the round-trip time.
+
+    Args:
+        file_size_bytes (int): Total size of the file, in bytes.
+        target_parts (int, optional): Desired number of parts. Defaults to DEFAULT_TARGET_PARTS.
+        rtt (float, optional): Observed round-trip time of a part request to The Engine, in seconds. Defaults to None.
+        min_parts (int, optional): Minimum number of parts, usually the transfer's maximum concurrency. Defaults to DEFAULT_MAX_CONCURRENCY.
+
+    Returns:
+        int: Size of each chunk, in bytes.
+    """
+
+    chunk_size = math.ceil(file_size_bytes / max(1, target_parts))
+    if rtt is not None and rtt > 0:
+        chunk_size = max(chunk_size, math.ceil(rtt * ASSUMED_STREAM_BYTES_PER_SECOND / MAX_REQUEST_OVERHEAD))
+
+    mebibyte = 1024 * 1024
+    chunk_size = math.ceil(chunk_size / mebibyte) * mebibyte
+    # Rounded down, so that ceil(file_size_bytes / chunk_size) >= min_parts
+    max_chunk_size = file_size_bytes // max(1, min_parts) // mebibyte * mebibyte
+    chunk_size = min(chunk_size, max_chunk_size)
+    return min(max(chunk_size, MIN_CHUNK_SIZE_BYTES), MAX_CHUNK_SIZE_BYTES)
+
+
+def transfer_session(limit: int, timeout: int = DEFAULT_TIMEOUT_SECONDS) -> aiohttp.ClientSession:
+    """Opens an asynchronous session for transfers. Must be called with an event loop running.
+
+    Args:
+        limit (int): Maximum number of simultaneous connections.
+        timeout (int, optional): Total timeout of each request, in seconds. Defaults to DEFAULT_TIMEOUT_SECONDS.
+
+    Returns:
+        aiohttp.ClientSession: The session. Close it, or use it as an asynchronous context manager.
+    """
+
+    connector = aiohttp.TCPConnector(limit=limit)
+    return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout), connector=connector)
+
+
+class ChecksumError(TransientError):
+    """A transferred part did not match its expected checksum.
+    """
+
+
+class IncompletePartError(TransientError):
+    """A downloaded part had fewer or more bytes than requested, e.g. a truncated response body.
+    """
+
+
+class Checksum:
+    """Incremental checksum of a part, using one of CHECKSUM_ALGORITHMS.
+
+    Both algorithms release the GIL on large buffers, so checksums are computed in a thread pool
+    rather than on the event loop.
+    """
+
+    def __init__(self, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> None:
+        """Creates a new, empty checksum.
+
+        Args:
+            algorithm (str, optional): Checksum algorithm, one of CHECKSUM_ALGORITHMS. Defaults to DEFAULT_CHECKSUM_ALGORITHM.
+
+        Raises:
+            Exception: Unsupported algorithm.
+        """
+
+        if algorithm not in CHECKSUM_ALGORITHMS:
+            raise Exception(f"Unsupported checksum algorithm '{algorithm}', options are {CHECKSUM_ALGORITHMS}")
+
+        self.algorithm = algorithm
+        self.hasher = hashlib.sha256() if algorithm == "sha256" else None
+        self.crc = 0
+
+
+    def update(self, data: bytes) -> "Checksum":
+        """Adds bytes to the checksum.
+
+        Args:
+            data (bytes): Bytes-like object to add.
+
+        Returns:
+            Checksum: This checksum, for chaining.
+        """
+
+        if self.hasher is not None:
+            self.hasher.update(data)
+        else:
+            self.crc = zlib.crc32(data, self.crc)
+        return self
+
+
+    def digest(self) -> str:
+        """Returns the checksum as a base64 string.
+
+        Returns:
+            str: The base64-encoded digest.
+        """
+
+        if self.hasher is not None:
+            raw = self.hasher.digest()
+        else:
+            raw = self.crc.to_bytes(4, "big")
+        return base64.b64encode(raw).decode()
+
+
+def compute_checksum(data: bytes, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
+    """Computes the base64 checksum of a buffer.
+
+    Args:
+        data (bytes): Bytes-like object to checksum.
+        algorithm (str, optional): Checksum algorithm, one of CHECKSUM_ALGORITHMS. Defaults to DEFAULT_CHECKSUM_ALGORITHM.
+
+    Returns:
+        str: The base64-encoded digest.
+    """
+
+    return Checksum(algorithm).update(data).digest()
+
+
+def composite_checksum(part_checksums: list[str], algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
+    """Combines ordered part checksums into a whole-file digest.
+
+    Like S3 multipart ETags, the result is the checksum of the concatenated raw part digests followed
+    by the number of parts, so it can be computed without re-reading the file.
+
+    Args:
+        part_checksums (list[str]): Base64 part checksums, in file order.
+        algorithm (str, optional): Checksum algorithm, one of CHECKSUM_ALGORITHMS. Defaults to DEFAULT_CHECKSUM_ALGORITHM.
+
+    Returns:
+        str: The whole-file digest, in the form "<base64>-<number of parts>".
+    """
+
+    checksum = Checksum(algorithm)
+    for part_checksum in part_checksums:
+        checksum.update(base64.b64decode(part_checksum))
+    return f"{checksum.digest()}-{len(part_checksums)}"
+
+
+class ConcurrencyController:
+    """Adaptive (AIMD) limit on the number of parts in flight during a transfer.
+
+    Completed parts are grouped into windows of roughly `limit` parts. At the end of each window the
+    aggregate throughput is compared to the previous window: if throughput held up the limit is
+    increased additively, and if per-byte latency grew without a matching gain in throughput (i.e.
+    parts are queueing rather than moving faster) the limit is decreased multiplicatively. Failed
+    parts always trigger a multiplicative decrease.
+    """
+
+    def __init__(self, min_concurrency: int = DEFAULT_MIN_CONCURRENCY, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY, increase: float = 1.0, decrease: float = 0.5, latency_tolerance: float = 2.0) -> None:
+        """Creates a new concurrency controller.
+
+        Args:
+            min_concurrency (int, optional): Floor on the number of parts in flight. Defaults to DEFAULT_MIN_CONCURRENCY.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight. Defaults to DEFAULT_MAX_CONCURRENCY.
+            initial_concurrency (int, optional): Starting number of parts in flight, clamped to the floor and ceiling. Defaults to DEFAULT_INITIAL_CONCURRENCY.
+            increase (float, optional): Additive increase applied after a healthy window. Defaults to 1.0.
+            decrease (float, optional): Multiplicative factor applied after a congested window or a failure. Defaults to 0.5.
+            latency_tolerance (float, optional): Growth in per-byte latency over the best window average that counts as congestion. Defaults to 2.0.
+        """
+
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise Exception("Concurrency bounds must satisfy 1 <= min_concurrency <= max_concurrency")
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+
+        self.limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+
+        self.best_latency_per_byte = None
+        self.last_throughput = None
+        self.window_start = None
+        self.window_parts = 0
+        self.window_bytes = 0
+        self.window_latency = 0.0
+
+        self.total_bytes = 0
+        self.total_parts = 0
+
+
+    async def acquire(self) -> None:
+        """Waits until another part may be put in flight.
+        """
+
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            if self.window_start is None:
+                self.window_start = time.monotonic()
+
+
+    async def release(self, num_bytes: int, latency: float, ok: bool = True) -> None:
+        """Records the outcome of a part and adjusts the limit.
+
+        Args:
+            num_bytes (int): Number of bytes moved by the part.
+            latency (float): Wall-clock duration of the part, in seconds.
+            ok (bool, optional): Whether the part succeeded. Defaults to True.
+        """
+
+        async with self.condition:
+            self.in_flight -= 1
+            if ok:
+                self.record(num_bytes, latency)
+            else:
+                self.limit = max(self.min_concurrency, self.limit * self.decrease)
+                self.reset_window()
+            self.condition.notify_all()
+
+
+    def record(self, num_bytes: int, latency: float) -> None:
+        """Adds a successful part to the current window, closing the window once it is full.
+
+        Args:
+            num_bytes (int): Number of bytes moved by the part.
+            latency (float): Wall-clock duration of the part, in seconds.
+        """
+
+        self.total_bytes += num_bytes
+        self.total_parts += 1
+        self.window_parts += 1
+        self.window_bytes += num_bytes
+        self.window_latency += latency
+
+        if self.window_parts < max(1, int(self.limit)):
+            return
+
+        elapsed = time.monotonic() - self.window_start
+        throughput = self.window_bytes / elapsed if elapsed > 0 else 0.0
+        latency_per_byte = self.window_latency / self.window_bytes if self.window_bytes > 0 else 0.0
+
+        congested = (
+            self.best_latency_per_byte is not None
+            and latency_per_byte > self.latency_tolerance * self.best_latency_per_byte
+            and self.last_throughput is not None
+            and throughput <= 1.05 * self.last_throughput
+        )
+        if congested:
+            self.limit = max(self.min_concurrency, self.limit * self.decrease)
+        elif self.last_throughput is None or throughput >= 0.95 * self.last_throughput:
+            self.limit = min(self.max_concurrency, self.limit + self.increase)
+
+        if latency_per_byte > 0 and (self.best_latency_per_byte is None or latency_per_byte < self.best_latency_per_byte):
+            self.best_latency_per_byte = latency_per_byte
+        self.last_throughput = throughput
+        self.reset_window()
+
+
+    def reset_window(self) -> None:
+        """Starts a new measurement window.
+        """
+
+        self.window_start = time.monotonic()
+        self.window_parts = 0
+        self.window_bytes = 0
+        self.window_latency = 0.0
+
+
+class MemoryBudget:
+    """Asynchronous limit on the number of part bytes buffered at once.
+
+    A part that is larger than the whole budget is still admitted when nothing else is buffered, so a
+    small budget slows a transfer down rather than deadlocking it.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES) -> None:
+        """Creates a new memory budget.
+
+        Args:
+            max_bytes (int, optional): Maximum number of bytes buffered at once. Defaults to DEFAULT_MEMORY_BUDGET_BYTES.
+        """
+
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.condition = asyncio.Condition()
+
+
+    async def acquire(self, num_bytes: int) -> None:
+        """Waits until `num_bytes` fit within the budget, then reserves them.
+
+        Args:
+            num_bytes (int): Number of bytes to reserve.
+        """
+
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.used_bytes == 0 or self.used_bytes + num_bytes <= self.max_bytes)
+            self.used_bytes += num_bytes
+
+
+    async def release(self, num_bytes: int) -> None:
+        """Returns previously reserved bytes to the budget.
+
+        Args:
+            num_bytes (int): Number of bytes to release.
+        """
+
+        async with self.condition:
+            self.used_bytes -= num_bytes
+            self.condition.notify_all()
+
+
+class PartFile:
+    """A single open file descriptor shared by every part of a transfer.
+
+    Reads are served as zero-copy `memoryview` slices of a read-only memory map, falling back to
+    `os.pread` where a map cannot be created. Writes go straight to their offsets with `os.pwrite`,
+    so parts never reopen the file or hop through a thread pool.
+    """
+
+    def __init__(self, path: str, writable: bool = False) -> None:
+        """Opens a file for positional part I/O.
+
+        Args:
+            path (str): Path to the local file.
+            writable (bool, optional): Whether to open the file for writing instead of reading. Defaults to False.
+        """
+
+        self.path = path
+        self.writable = writable
+        self.lock = threading.Lock()
+
+        flags = (os.O_RDWR if writable else os.O_RDONLY) | getattr(os, "O_BINARY", 0)
+        self.fd = os.open(path, flags)
+
+        self.mmap = None
+        self.view = None
+        if not writable and os.fstat(self.fd).st_size > 0:
+            try:
+                self.mmap = mmap.mmap(self.fd, 0, access=mmap.ACCESS_READ)
+                self.view = memoryview(self.mmap)
+            except (OSError, ValueError):
+                self.mmap = None
+
+
+    def read(self, offset: int, length: int) -> memoryview | bytes:
+        """Reads one part of the file.
+
+        Args:
+            offset (int): Index of the first byte to read.
+            length (int): Number of bytes to read.
+
+        Returns:
+            memoryview | bytes: The requested bytes, as a view of the memory map when available.
+        """
+
+        if self.view is not None:
+            return self.view[offset:offset + length]
+
+        if hasattr(os, "pread"):
+            return os.pread(self.fd, length, offset)
+
+        with self.lock:
+            os.lseek(self.fd, offset, os.SEEK_SET)
+            return os.read(self.fd, length)
+
+
+    def write(self, offset: int, data: bytes) -> None:
+        """Writes bytes at a specific offset of the file.
+
+        Args:
+            offset (int): Index of the first byte to write.
+            data (bytes): The bytes to write.
+        """
+
+        view = memoryview(data)
+        while len(view) > 0:
+            if hasattr(os, "pwrite"):
+                written = os.pwrite(self.fd, view, offset)
+            else:
+                with self.lock:
+                    os.lseek(self.fd, offset, os.SEEK_SET)
+                    written = os.write(self.fd, view)
+            view = view[written:]
+            offset += written
+
+
+    def checksum(self, offset: int, length: int, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
+        """Computes the checksum of a range of the file. Blocking, intended to run in a thread pool.
+
+        Args:
+            offset (int): Index of the first byte.
+            length (int): Number of bytes.
+            algorithm (str, optional): Checksum algorithm, one of CHECKSUM_ALGORITHMS. Defaults to DEFAULT_CHECKSUM_ALGORITHM.
+
+        Returns:
+            str: The base64-encoded digest.
+        """
+
+        checksum = Checksum(algorithm)
+        end = offset + length
+        while offset < end:
+            data = self.read(offset, min(STREAM_CHUNK_SIZE_BYTES, end - offset))
+            if len(data) == 0:
+                break
+            checksum.update(data)
+            offset += len(data)
+        return checksum.digest()
+
+
+    def close(self) -> None:
+        """Releases the memory map and closes the file descriptor.
+        """
+
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.mmap is not None:
+            try:
+                self.mmap.close()
+            except BufferError:
+                # A part payload still references the map; it is unmapped once that is collected
+                pass
+            self.mmap = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class TransferManifest:
+    """Sidecar journal of which parts of a transfer have finished.
+
+    The manifest is stored next to the local file as JSON lines: a header describing the transfer,
+    followed by one `[start, checksum]` record per finished part. Records are appended and flushed as
+    parts complete, so a restarted process can pick up the same transfer and only move the parts that
+    are still missing. A truncated last line from an interrupted write is ignored on load.
+
+    Writes are serialized by a lock, so parts can be recorded from worker threads, and records
+    arriving after `remove` are dropped instead of recreating the file.
+    """
+
+    def __init__(self, path: str, kind: str, url: str, transfer_id: str, chunk_size: int, file_size_bytes: int, completed: set[int] = None, extra: dict = None, checksums: dict[int, str] = None) -> None:
+        """Creates a new manifest.
+
+        Args:
+            path (str): Path of the manifest file.
+            kind (str): Type of transfer, either "upload" or "download".
+            url (str): Full URL of the remote file.
+            transfer_id (str): Upload or download ID issued by The Engine.
+            chunk_size (int): Size of each chunk, in bytes.
+            file_size_bytes (int): Total size of the file, in bytes.
+            completed (set[int], optional): Starting bytes of the finished parts. Defaults to None.
+            extra (dict, optional): Additional JSON-serializable fields used to validate the manifest. Defaults to None.
+            checksums (dict[int, str], optional): Checksums of the finished parts, keyed by starting byte. Defaults to None.
+        """
+
+        self.path = path
+        self.kind = kind
+        self.url = url
+        self.transfer_id = transfer_id
+        self.chunk_size = chunk_size
+        self.file_size_bytes = file_size_bytes
+        self.completed = set(completed) if completed is not None else set()
+        self.extra = extra if extra is not None else {}
+        self.checksums = dict(checksums) if checksums is not None else {}
+        self.lock = threading.Lock()
+        self.removed = False
+
+
+    def matches(self, kind: str, url: str, chunk_size: int, file_size_bytes: int, extra: dict = None) -> bool:
+        """Checks whether this manifest describes the given transfer.
+
+        Args:
+            kind (str): Type of transfer, either "upload" or "download".
+            url (str): Full URL of the remote file.
+            chunk_size (int): Size of each chunk, in bytes, or None to accept any chunk size.
+            file_size_bytes (int): Total size of the file, in bytes.
+            extra (dict, optional): Additional fields that must match exactly. Defaults to None.
+
+        Returns:
+            bool: Whether the manifest can be used to resume the transfer.
+        """
+
+        return (
+            self.kind == kind
+            and self.url == url
+            and (chunk_size is None or self.chunk_size == chunk_size)
+            and self.file_size_bytes == file_size_bytes
+            and all(self.extra.get(k) == v for k, v in (extra or {}).items())
+        )
+
+
+    def completed_ranges(self) -> list[list[int]]:
+        """Merges the finished parts into contiguous byte ranges.
+
+        Returns:
+            list[list[int]]: Sorted `[start, end)` byte ranges.
+        """
+
+        ranges = []
+        for start in sorted(self.completed):
+            end = min(start + self.chunk_size, self.file_size_bytes)
+            if ranges and ranges[-1][1] == start:
+                ranges[-1][1] = end
+            else:
+                ranges.append([start, end])
+        return ranges
+
+
+    def mark_complete(self, starting_byte: int, checksum: str = None) -> None:
+        """Records a finished part and appends it to the manifest on disk.
+
+        Blocks on file I/O, so transfers call it in a worker thread.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            checksum (str, optional): Checksum of the part. Defaults to None.
+        """
+
+        with self.lock:
+            if self.removed:
+                return
+            self.completed.add(starting_byte)
+            if checksum is not None:
+                self.checksums[starting_byte] = checksum
+
+            with open(self.path, "a") as f:
+                f.write(json.dumps([starting_byte, checksum]) + "\n")
+
+
+    def save(self) -> None:
+        """Atomically rewrites the whole manifest to disk.
+        """
+
+        header = {
+            "kind": self.kind,
+            "url": self.url,
+            "transfer_id": self.transfer_id,
+            "chunk_size": self.chunk_size,
+            "file_size_bytes": self.file_size_bytes,
+            "extra": self.extra
+        }
+        temp_path = f"{self.path}.tmp"
+        with self.lock:
+            with open(temp_path, "w") as f:
+                f.write(json.dumps(header) + "\n")
+                for start in sorted(self.completed):
+                    f.write(json.dumps([start, self.checksums.get(start)]) + "\n")
+            os.replace(temp_path, self.path)
+            self.removed = False
+
+
+    def remove(self) -> None:
+        """Deletes the manifest from disk, if it exists. Parts recorded afterwards are not written.
+        """
+
+        with self.lock:
+            self.removed = True
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+    @staticmethod
+    def load(path: str) -> "TransferManifest":
+        """Reads a manifest from disk.
+
+        Args:
+            path (str): Path of the manifest file.
+
+        Returns:
+            TransferManifest: The manifest, or None if it does not exist or cannot be read.
+        """
+
+        try:
+            with open(path, "r") as f:
+                header = json.loads(f.readline())
+                records = []
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except (OSError, ValueError):
+            return None
+
+        completed = set()
+        checksums = {}
+        for start, checksum in records:
+            completed.add(start)
+            if checksum is not None:
+                checksums[start] = checksum
+
+        return TransferManifest(
+            path,
+            header["kind"],
+            header["url"],
+            header["transfer_id"],
+            header["chunk_size"],
+            header["file_size_bytes"],
+            completed=completed,
+            extra=header.get("extra"),
+            checksums=checksums
+        )
+
+
+class Transfer:
+    """Base class for parallelized multipart transfers to and from ET Engine.
+
+    Subclasses define how a single part is moved in `transfer_part`; this class owns the part loop,
+    the session handling and the adaptive concurrency limit.
+    """
+
+    kind = None
+
+    def __init__(self, local_file: str, url: str, chunk_size: int | str = MIN_CHUNK_SIZE_BYTES, timeout: int = DEFAULT_TIMEOUT_SECONDS, transport: Transport = None, min_concurrency: int = DEFAULT_MIN_CONCURRENCY, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, resume: bool = False, memory_budget: int = DEFAULT_MEMORY_BUDGET_BYTES, target_parts: int = DEFAULT_TARGET_PARTS, checksum: str = DEFAULT_CHECKSUM_ALGORITHM, progress: bool = True, retry_policy: RetryPolicy = None, hooks: Hooks = None, request_limiter: TokenBucket = None, bandwidth_limiter: TokenBucket = None, control_timeout: int = DEFAULT_CONTROL_TIMEOUT_SECONDS) -> None:
+        """Create a new multipart transfer.
+
+        Args:
+            local_file (str): Path to the local file.
+            url (str): Full URL of the remote file.
+            chunk_size (int | str, optional): Size of each chunk, in bytes, or AUTO_CHUNK_SIZE to pick it from the file size, `max_concurrency` and the round-trip time observed by earlier transfers on the transport (see `choose_chunk_size`). Defaults to MIN_CHUNK_SIZE_BYTES.
+            timeout (int, optional): Timeout of each part on a session opened for this transfer, in seconds. Defaults to DEFAULT_TIMEOUT_SECONDS.
+            transport (Transport, optional): Pooled transport for the control requests, whose retry policy, hooks, limiters and observed round-trip time the transfer shares. A transfer only run through `run_async` may be given an `aio.AsyncTransport` instead. Defaults to the shared default transport.
+            min_concurrency (int, optional): Floor on the number of parts in flight. Defaults to DEFAULT_MIN_CONCURRENCY.
+            max_concurrency (int, optional): Ceiling on the number of parts in flight. Defaults to DEFAULT_MAX_CONCURRENCY.
+            resume (bool, optional): Whether to record progress in a sidecar manifest and continue a matching interrupted transfer. Defaults to False.
+            memory_budget (int, optional): Maximum number of part bytes buffered at once, in bytes. Defaults to DEFAULT_MEMORY_BUDGET_BYTES.
+            target_parts (int, optional): Desired number of parts when `chunk_size` is AUTO_CHUNK_SIZE. Defaults to DEFAULT_TARGET_PARTS.
+            checksum (str, optional): Per-part checksum algorithm, one of CHECKSUM_ALGORITHMS, or None to disable checksums. Defaults to DEFAULT_CHECKSUM_ALGORITHM.
+            progress (bool, optional): Whether to show a progress bar for the parts. Defaults to True.
+            retry_policy (RetryPolicy, optional): Retry policy for the control requests and each part. Defaults to the transport's policy.
+            hooks (Hooks, optional): Instrumentation hooks notified of each part and of the whole transfer. Defaults to the transport's hooks.
+            request_limiter (TokenBucket, optional): Limit on control requests per second. Defaults to the transport's limiter.
+            bandwidth_limiter (TokenBucket, optional): Limit on part bytes per second. Defaults to the transport's limiter.
+            control_timeout (int, optional): Timeout of each control request (initializing and completing the transfer), in seconds. Defaults to DEFAULT_CONTROL_TIMEOUT_SECONDS.
+        """
+
+        self.local_file = local_file
+        self.url = url
+        self.transport = transport if transport is not None else default_transport()
+        self.retry_policy = retry_policy if retry_policy is not None else self.transport.retry_policy
+        self.hooks = hooks if hooks is not None else self.transport.hooks
+        self.request_limiter = request_limiter if request_limiter is not None else self.transport.request_limiter
+        self.bandwidth_limiter = bandwidth_limiter if bandwidth_limiter is not None else self.transport.bandwidth_limiter
+        self.part_attempts = {}
+        self.rtt_observed = False
+
+        self.auto_chunk_size = chunk_size == AUTO_CHUNK_SIZE
+        self.chunk_size = MIN_CHUNK_SIZE_BYTES if self.auto_chunk_size else chunk_size
+        self.target_parts = target_parts
+        self.timeout = timeout
+        self.control_timeout = control_timeout
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.memory_budget = memory_budget
+
+        self.file_size_bytes = None
+        self.num_parts = None
+        self.controller = None
+        self.part_file = None
+
+        if checksum is not None and checksum not in CHECKSUM_ALGORITHMS:
+            raise Exception(f"Unsupported checksum algorithm '{checksum}', options are {CHECKSUM_ALGORITHMS}")
+        self.checksum = checksum
+        self.progress = progress
+        self.checksum_header = f"{CHECKSUM_HEADER_PREFIX}{checksum}"
+        self.part_checksums = {}
+
+        self.resume = resume
+        self.manifest_path = f"{local_file}.{self.kind}{MANIFEST_SUFFIX}"
+        self.manifest = None
+
+
+    def load_manifest(self, extra: dict = None) -> TransferManifest:
+        """Loads the sidecar manifest if resuming and it matches this transfer.
+
+        Args:
+            extra (dict, optional): Additional fields the manifest must match. Defaults to None.
+
+        Returns:
+            TransferManifest: The matching manifest, or None.
+        """
+
+        if not self.resume:
+            return None
+
+        chunk_size = None if self.auto_chunk_size else self.chunk_size
+        manifest = TransferManifest.load(self.manifest_path)
+        if manifest is None or not manifest.matches(self.kind, self.url, chunk_size, self.file_size_bytes, extra=extra):
+            return None
+
+        self.chunk_size = manifest.chunk_size
+        self.num_parts = math.ceil(self.file_size_bytes / self.chunk_size)
+        return manifest
+
+
+    def select_chunk_size(self) -> None:
+        """Picks the chunk size once the file size is known, if it was requested automatically.
+
+        The round-trip time comes from the first part of an earlier transfer on the same transport,
+        since the control requests include server-side work. The first automatically sized transfer
+        on a transport is sized from the file size and concurrency alone.
+        """
+
+        if self.auto_chunk_size:
+            self.chunk_size = choose_chunk_size(self.file_size_bytes, target_parts=self.target_parts, rtt=self.transport.observed_rtt, min_parts=self.max_concurrency)
+        self.num_parts = math.ceil(self.file_size_bytes / self.chunk_size)
+
+
+    def observe_rtt(self, num_bytes: int, latency: float) -> None:
+        """Records the round-trip time of the transport from the first finished part of this transfer.
+
+        The time spent streaming the part at ASSUMED_STREAM_BYTES_PER_SECOND is subtracted, leaving
+        an estimate of the per-request overhead.
+
+        Args:
+            num_bytes (int): Number of bytes moved by the part.
+            latency (float): Duration of the part, in seconds.
+        """
+
+        if not self.rtt_observed:
+            self.rtt_observed = True
+            self.transport.observed_rtt = max(0.0, latency - num_bytes / ASSUMED_STREAM_BYTES_PER_SECOND)
+
+
+    def start_manifest(self, transfer_id: str, extra: dict = None) -> None:
+        """Starts recording progress for a new transfer, if resuming is enabled.
+
+        Args:
+            transfer_id (str): Upload or download ID issued by The Engine.
+            extra (dict, optional): Additional fields used to validate the manifest later. Defaults to None.
+        """
+
+        if not self.resume:
+            return
+
+        self.manifest = TransferManifest(
+            self.manifest_path,
+            self.kind,
+            self.url,
+            transfer_id,
+            self.chunk_size,
+            self.file_size_bytes,
+            extra=extra
+        )
+        self.manifest.save()
+
+
+    def pending_parts(self) -> Iterator[int]:
+        """Lazily yields the starting bytes of the parts that still need to be transferred.
+
+        Yields:
+            int: Starting byte of a missing part.
+        """
+
+        completed = self.manifest.completed if self.manifest is not None else set()
+        for starting_byte in range(0, self.file_size_bytes, self.chunk_size):
+            if starting_byte not in completed:
+                yield starting_byte
+
+
+    def part_length(self, starting_byte: int) -> int:
+        """Number of bytes in the part starting at `starting_byte`.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+
+        Returns:
+            int: Length of the part, in bytes.
+        """
+
+        return min(self.chunk_size, self.file_size_bytes - starting_byte)
+
+
+    @property
+    def file_checksum(self) -> str:
+        """Whole-file digest combined from the part checksums, available once every part has finished.
+
+        Returns:
+            str: The composite digest, or None if checksums are disabled or parts are missing.
+        """
+
+        if self.checksum is None or self.file_size_bytes is None:
+            return None
+
+        starts = range(0, self.file_size_bytes, self.chunk_size)
+        if any(start not in self.part_checksums for start in starts):
+            return None
+        return composite_checksum([self.part_checksums[start] for start in starts], self.checksum)
+
+
+    async def compute_part_checksum(self, starting_byte: int, data: bytes = None) -> str:
+        """Computes the checksum of a part in the default thread pool, off the event loop.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            data (bytes, optional): The part's bytes. If None, they are read back from the local file. Defaults to None.
+
+        Returns:
+            str: The base64-encoded digest, or None if checksums are disabled.
+        """
+
+        if self.checksum is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if data is not None:
+            return await loop.run_in_executor(None, compute_checksum, data, self.checksum)
+        return await loop.run_in_executor(None, self.part_file.checksum, starting_byte, self.part_length(starting_byte), self.checksum)
+
+
+    def verify_part_checksum(self, starting_byte: int, checksum: str, response: aiohttp.ClientResponse) -> None:
+        """Compares a part's checksum with the one reported by The Engine, if any, and records it.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            checksum (str): Locally computed checksum of the part.
+            response (aiohttp.ClientResponse): Response for the part.
+
+        Raises:
+            ChecksumError: The checksums do not match.
+        """
+
+        if checksum is None:
+            return
+
+        remote_checksum = response.headers.get(self.checksum_header)
+        if remote_checksum is not None and remote_checksum != checksum:
+            raise ChecksumError(f"Checksum mismatch for part starting at byte {starting_byte}")
+        self.part_checksums[starting_byte] = checksum
+
+
+    async def validate_resume(self, session: aiohttp.ClientSession) -> None:
+        """Checks that a resumed transfer can continue, before any part is sent. Overridden by subclasses.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+        """
+
+
+    async def run_async(self, session: aiohttp.ClientSession) -> str:
+        """Runs the whole transfer, including its control requests, on an existing asynchronous session. Implemented by subclasses.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Returns:
+            str: Whole-file digest, or None if checksums are disabled.
+        """
+
+        raise NotImplementedError
+
+
+    def open_part_file(self) -> PartFile:
+        """Opens the local file that parts are read from or written to. Implemented by subclasses.
+
+        Returns:
+            PartFile: The open local file.
+        """
+
+        raise NotImplementedError
+
+
+    async def transfer_part(self, starting_byte: int, session: aiohttp.ClientSession) -> int:
+        """Moves one part of the file. Implemented by subclasses.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Returns:
+            int: HTTP status code of the response.
+        """
+
+        raise NotImplementedError
+
+
+    async def retry_part(self, starting_byte: int, operation: Callable[[], Awaitable[int]]) -> int:
+        """Runs the request of one part under the retry policy, counting its attempts for the hooks.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            operation (Callable[[], Awaitable[int]]): Sends the part and returns the HTTP status code of the response.
+
+        Returns:
+            int: HTTP status code of the response.
+        """
+
+        self.part_attempts[starting_byte] = 0
+
+        async def attempt() -> int:
+            self.part_attempts[starting_byte] += 1
+            return await operation()
+
+        return await self.retry_policy.call_async(attempt)
+
+
+    def part_event(self, starting_byte: int, num_bytes: int, latency: float, status: int = None, error: Exception = None) -> PartEvent:
+        """Describes a finished part for the hooks.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            num_bytes (int): Number of bytes moved by the part.
+            latency (float): Wall-clock duration of the part, retries included, in seconds.
+            status (int, optional): HTTP status code of the response. Defaults to None.
+            error (Exception, optional): The error the part failed with. Defaults to None.
+
+        Returns:
+            PartEvent: The event.
+        """
+
+        return PartEvent(
+            self.kind,
+            self.url,
+            starting_byte,
+            num_bytes,
+            latency,
+            status,
+            self.part_attempts.pop(starting_byte, 1),
+            self.controller.in_flight,
+            int(self.controller.limit),
+            error
+        )
+
+
+    async def transfer_parts(self, session: aiohttp.ClientSession = None) -> list[int]:
+        """Runs every part of the transfer under the adaptive concurrency limit.
+
+        A single producer feeds the missing parts into a bounded queue that a fixed pool of workers
+        drains, and each worker reserves its part's bytes from the memory budget before reading, so
+        the number of tasks and the buffered bytes stay flat regardless of the file size.
+
+        Args:
+            session (aiohttp.ClientSession, optional): An existing asynchronous session to transfer on. If None, a dedicated session is opened for this transfer. Defaults to None.
+
+        Returns:
+            list[int]: A list of HTTP status codes.
+        """
+
+        if session is None:
+            async with transfer_session(self.max_concurrency, timeout=self.timeout) as session:
+                return await self.transfer_parts(session)
+
+        await self.validate_resume(session)
+
+        self.controller = ConcurrencyController(
+            min_concurrency=self.min_concurrency,
+            max_concurrency=self.max_concurrency
+        )
+        budget = MemoryBudget(self.memory_budget)
+        if self.manifest is not None:
+            self.part_checksums.update(self.manifest.checksums)
+        queue = asyncio.Queue(maxsize=self.max_concurrency)
+        parts = []
+
+        completed = len(self.manifest.completed) if self.manifest is not None else 0
+        pbar = tqdm(desc=f"[{self.file_size_bytes / 1024 / 1024 // 1} MB] {self.local_file}", total=self.num_parts - completed, disable=not self.progress)
+
+        async def produce() -> None:
+            for starting_byte in self.pending_parts():
+                await queue.put(starting_byte)
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while (starting_byte := await queue.get()) is not None:
+                part_length = self.part_length(starting_byte)
+                await budget.acquire(part_length)
+                try:
+                    # Wait for bandwidth before starting the clock, so shaping is not mistaken for congestion
+                    if self.bandwidth_limiter is not None:
+                        await self.bandwidth_limiter.acquire_async(part_length)
+                    await self.controller.acquire()
+                    start = time.monotonic()
+                    try:
+                        status = await self.transfer_part(starting_byte, session)
+                    except BaseException as err:
+                        latency = time.monotonic() - start
+                        if isinstance(err, Exception):
+                            self.hooks.on_part(self.part_event(starting_byte, 0, latency, error=err))
+                        await self.controller.release(0, latency, ok=False)
+                        raise
+                    latency = time.monotonic() - start
+                    self.observe_rtt(part_length, latency)
+                    self.hooks.on_part(self.part_event(starting_byte, part_length, latency, status=status))
+                    await self.controller.release(part_length, latency)
+                finally:
+                    await budget.release(part_length)
+
+                if self.manifest is not None:
+                    await asyncio.to_thread(self.manifest.mark_complete, starting_byte, checksum=self.part_checksums.get(starting_byte))
+                parts.append(status)
+                pbar.update(1)
+
+        self.part_file = self.open_part_file()
+        start = time.monotonic()
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(consume()) for _ in range(self.max_concurrency)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.part_file.close()
+            self.part_file = None
+            pbar.close()
+
+        self.hooks.on_transfer(TransferEvent(self.kind, self.url, self.local_file, self.controller.total_bytes, len(parts), time.monotonic() - start))
+        return parts
+
+
+class MultipartUpload(Transfer):
+    """Client for handling parallelized multipart uploads to ET Engine.
+    """
+
+    kind = "upload"
+
+    def __init__(self, local_file: str, url: str, *args, **kwargs) -> None:
+        """Create a new Multipart Upload job.
+
+        Args:
+            local_file (str): Valid path the local file to upload.
+            url (str): Full URL of the remote file destination.
+            *args, **kwargs: Transfer options, see `Transfer`.
+        """
+
+        super().__init__(local_file, url, *args, **kwargs)
+        self.file_mtime_ns = None
+        self.upload_id = None
+        self.stat_file()
+
+
+    def stat_file(self) -> None:
+        """Records the size and modification time of the local file, then picks the chunk size.
+        """
+
+        file_stat = os.stat(self.local_file)
+        self.file_size_bytes = file_stat.st_size
+        self.file_mtime_ns = file_stat.st_mtime_ns
+        self.select_chunk_size()
+
+
+    def resume_upload(self) -> bool:
+        """Picks up an interrupted upload of the same, unmodified file from its manifest.
+
+        Returns:
+            bool: Whether a matching upload was found.
+        """
+
+        manifest = self.load_manifest(extra={"mtime_ns": self.file_mtime_ns})
+        if manifest is None:
+            return False
+
+        self.manifest = manifest
+        self.upload_id = manifest.transfer_id
+        return True
+
+
+    def request_upload(self) -> None:
+        """Initialize the upload with a POST request, or resume a matching interrupted upload.
+        """
+
+        if self.resume_upload():
+            return
+
+        response = self.transport.request(
+            "POST",
+            self.url,
+            retry_policy=self.retry_policy,
+            data=json.dumps({
+                'size': self.file_size_bytes
+            }),
+            headers={
+                'Authorization': os.environ['ET_ENGINE_API_KEY']
+            },
+            timeout=self.control_timeout
+        )
+
+        response.raise_for_status()
+        upload_details = response.json()
+        self.upload_id = upload_details['uploadId']
+        self.select_chunk_size()
+        self.start_manifest(self.upload_id, extra={"mtime_ns": self.file_mtime_ns})
+
+
+    async def request_upload_async(self, session: aiohttp.ClientSession) -> None:
+        """Initialize the upload with a POST request on an existing asynchronous session, or resume a matching interrupted upload.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+        """
+
+        if self.resume_upload():
+            return
+
+        async def send() -> dict:
+            if self.request_limiter is not None:
+                await self.request_limiter.acquire_async()
+            async with session.post(
+                self.url,
+                data=json.dumps({
+                    'size': self.file_size_bytes
+                }),
+                headers={
+                    'Authorization': os.environ['ET_ENGINE_API_KEY']
+                },
+                timeout=aiohttp.ClientTimeout(total=self.control_timeout)
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        upload_details = await self.retry_policy.call_async(send, idempotent=False)
+        self.upload_id = upload_details['uploadId']
+        self.select_chunk_size()
+        self.start_manifest(self.upload_id, extra={"mtime_ns": self.file_mtime_ns})
+
+
+    def open_part_file(self) -> PartFile:
+        """Opens the local file for zero-copy reads.
+
+        Returns:
+            PartFile: The open local file.
+        """
+
+        return PartFile(self.local_file)
+
+
+    async def run_async(self, session: aiohttp.ClientSession) -> str:
+        """Initializes, uploads and completes the upload on an existing asynchronous session.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Returns:
+            str: Whole-file digest, or None if checksums are disabled.
+        """
+
+        await self.request_upload_async(session)
+        await self.transfer_parts(session)
+        await self.complete_upload_async(session)
+        return self.file_checksum
+
+
+    def upload(self) -> None:
+        """Launch the parallelized upload.
+        """
+
+        asyncio.run(self.transfer_parts())
+
+
+    def complete_upload(self) -> None:
+        """Confirm the upload is complete with a POST request.
+
+        Raises:
+            Exception: The upload has not been initialized yet.
+        """
+
+        if self.upload_id is None:
+            raise Exception("Upload not yet initialized")
+
+        response = self.transport.request(
+            "POST",
+            self.url,
+            retry_policy=self.retry_policy,
+            data=json.dumps({
+                'uploadId': self.upload_id,
+                'complete': True
+            }),
+            headers={
+                'Authorization': os.environ['ET_ENGINE_API_KEY']
+            },
+            timeout=self.control_timeout
+        )
+
+        response.raise_for_status()
+        if self.manifest is not None:
+            self.manifest.remove()
+
+
+    async def complete_upload_async(self, session: aiohttp.ClientSession) -> None:
+        """Confirm the upload is complete with a POST request on an existing asynchronous session.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Raises:
+            Exception: The upload has not been initialized yet.
+        """
+
+        if self.upload_id is None:
+            raise Exception("Upload not yet initialized")
+
+        async def send() -> None:
+            if self.request_limiter is not None:
+                await self.request_limiter.acquire_async()
+            async with session.post(
+                self.url,
+                data=json.dumps({
+                    'uploadId': self.upload_id,
+                    'complete': True
+                }),
+                headers={
+                    'Authorization': os.environ['ET_ENGINE_API_KEY']
+                },
+                timeout=aiohttp.ClientTimeout(total=self.control_timeout)
+            ) as response:
+                response.raise_for_status()
+
+        await self.retry_policy.call_async(send, idempotent=False)
+        if self.manifest is not None:
+            self.manifest.remove()
+
+
+    async def transfer_part(self, starting_byte: int, session: aiohttp.ClientSession) -> int:
+        """Uploads one part in a multipart upload.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Raises:
+            Exception: The upload has not yet been initialized.
+            aiohttp.ClientResponseError: The part was rejected, or still failed once its retries ran out.
+
+        Returns:
+            int: HTTP status code of the response.
+        """
+
+        if self.upload_id is None:
+            raise Exception("Upload not yet initialized")
+
+        chunk = self.part_file.read(starting_byte, self.part_length(starting_byte))
+        chunk_length = len(chunk)
+
+        content_range = f"[{self.upload_id}]:{starting_byte}-{starting_byte+chunk_length}"
+
+        headers = {
+            'Authorization': os.environ['ET_ENGINE_API_KEY'],
+            'Content-Range': content_range
+        }
+
+        checksum = await self.compute_part_checksum(starting_byte, chunk)
+        if checksum is not None:
+            headers[self.checksum_header] = checksum
+
+        async def send() -> int:
+            async with session.put(self.url, data=chunk, headers=headers) as response:
+                response.raise_for_status()
+                self.verify_part_checksum(starting_byte, checksum, response)
+                return response.status
+
+        return await self.retry_part(starting_byte, send)
+
+
+class MultipartDownload(Transfer):
+    """Client for handling parallelized multipart downloads from ET Engine.
+    """
+
+    kind = "download"
+
+    def __init__(self, local_file: str, url: str, *args, **kwargs) -> None:
+        """Create a new Multipart Download job.
+
+        Args:
+            local_file (str): Valid path the local file to download to.
+            url (str): Full URL of the remote file source.
+            *args, **kwargs: Transfer options, see `Transfer`.
+        """
+
+        super().__init__(local_file, url, *args, **kwargs)
+        self.download_id = None
+        self.new_download_id = None
+        self.remote_identity = {}
+
+
+    def request_download(self) -> None:
+        """Initialize the download with a GET request.
+        """
+
+        response = self.transport.request(
+            "GET",
+            self.url,
+            retry_policy=self.retry_policy,
+            params={
+                "init": True
+            },
+            headers={
+                'Authorization': os.environ['ET_ENGINE_API_KEY']
+            },
+            timeout=self.control_timeout
+        )
+        if not response.ok:
+            raise Exception(response.text)
+
+        download_info = response.json()
+        self.file_size_bytes = download_info['size']
+        self.download_id = download_info['download_id']
+        self.remote_identity = {key: download_info[key] for key in REMOTE_IDENTITY_KEYS if key in download_info}
+        self.select_chunk_size()
+
+        self.prepare_file()
+
+
+    async def request_download_async(self, session: aiohttp.ClientSession) -> None:
+        """Initialize the download with a GET request on an existing asynchronous session.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+        """
+
+        async def send() -> dict:
+            if self.request_limiter is not None:
+                await self.request_limiter.acquire_async()
+            async with session.get(
+                self.url,
+                params={
+                    "init": "True"
+                },
+                headers={
+                    'Authorization': os.environ['ET_ENGINE_API_KEY']
+                },
+                timeout=aiohttp.ClientTimeout(total=self.control_timeout)
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        download_info = await self.retry_policy.call_async(send)
+        self.file_size_bytes = download_info['size']
+        self.download_id = download_info['download_id']
+        self.remote_identity = {key: download_info[key] for key in REMOTE_IDENTITY_KEYS if key in download_info}
+        self.select_chunk_size()
+
+        self.prepare_file()
+
+
+    def prepare_file(self) -> None:
+        """Reuses the partial file of a matching interrupted download, or creates a new one.
+
+        The manifest records the remote file's identity (its ETag or modification time, see
+        REMOTE_IDENTITY_KEYS) when the init response reports one, and an interrupted download is
+        only resumed if it is unchanged. Without an identity, `validate_resume` compares a finished
+        part with the remote file instead.
+        """
+
+        extra = {"remote": self.remote_identity} if self.remote_identity else None
+        self.new_download_id = self.download_id
+        manifest = self.load_manifest(extra=extra)
+        if manifest is not None:
+            partial_file = f"{self.local_file}.{manifest.transfer_id}"
+            if os.path.exists(partial_file) and os.stat(partial_file).st_size == self.file_size_bytes:
+                self.download_id = manifest.transfer_id
+                self.manifest = manifest
+                return
+
+        stale = TransferManifest.load(self.manifest_path) if self.resume else None
+        if stale is not None and stale.transfer_id != self.download_id:
+            if extra is not None and stale.matches(self.kind, self.url, None, self.file_size_bytes) and stale.extra.get("remote") != self.remote_identity:
+                warnings.warn(f"{self.url} changed since its download was interrupted, restarting the download")
+            try:
+                os.remove(f"{self.local_file}.{stale.transfer_id}")
+            except FileNotFoundError:
+                pass
+
+        self.initialize_file()
+        self.start_manifest(self.download_id, extra=extra)
+
+
+    async def validate_resume(self, session: aiohttp.ClientSession) -> None:
+        """Restarts a resumed download if the remote file was replaced since it was interrupted.
+
+        Only needed when the init response reports no identity for the remote file. The first
+        finished part with a recorded checksum is downloaded again and compared with it, so a
+        replaced file of the same size is caught. Without checksums, the download is resumed as is.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+        """
+
+        if self.manifest is None or self.remote_identity or self.checksum is None or not self.manifest.checksums:
+            return
+
+        starting_byte = min(self.manifest.checksums)
+        headers = {
+            'Authorization': os.environ['ET_ENGINE_API_KEY'],
+            'Content-Range': f"{starting_byte}-{starting_byte+self.chunk_size}"
+        }
+
+        async def receive() -> str:
+            loop = asyncio.get_running_loop()
+            checksum = Checksum(self.checksum)
+            async with session.get(self.url, headers=headers) as response:
+                response.raise_for_status()
+                async for data in response.content.iter_chunked(STREAM_CHUNK_SIZE_BYTES):
+                    await loop.run_in_executor(None, checksum.update, data)
+            return checksum.digest()
+
+        if await self.retry_policy.call_async(receive) == self.manifest.checksums[starting_byte]:
+            return
+
+        warnings.warn(f"{self.url} changed since its download was interrupted, restarting the download")
+        self.abort_download(keep_partial=False)
+        self.manifest.remove()
+        self.manifest = None
+        self.part_checksums.clear()
+        self.download_id = self.new_download_id
+        self.initialize_file()
+        self.start_manifest(self.download_id)
+
+
+    def initialize_file(self) -> None:
+        """Creates a local file to be filled in parts during the download.
+
+        Raises:
+            Exception: The download has not been initialized.
+        """
+
+        if self.file_size_bytes is None or self.download_id is None or self.num_parts is None:
+            raise Exception("Download not yet initialized")
+
+        destination = f"{self.local_file}.{self.download_id}"
+        with open(destination, "wb") as f:
+            if self.file_size_bytes > 0:
+                f.seek(self.file_size_bytes - 1)
+                f.write(b'\0')
+
+
+    def open_part_file(self) -> PartFile:
+        """Opens the temporary download file for positional writes.
+
+        Returns:
+            PartFile: The open temporary file.
+        """
+
+        return PartFile(f"{self.local_file}.{self.download_id}", writable=True)
+
+
+    async def run_async(self, session: aiohttp.ClientSession) -> str:
+        """Initializes, downloads and completes the download on an existing asynchronous session.
+
+        Args:
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Returns:
+            str: Whole-file digest, or None if checksums are disabled.
+        """
+
+        await self.request_download_async(session)
+        try:
+            await self.transfer_parts(session)
+        except BaseException:
+            self.abort_download()
+            raise
+        self.complete_download()
+        return self.file_checksum
+
+
+    def download(self) -> None:
+        """Launch the paralellized download.
+        """
+
+        asyncio.run(self.transfer_parts())
+
+
+    def complete_download(self) -> None:
+        """Complete the download by renaming the temporary file
+        """
+
+        destination = f"{self.local_file}.{self.download_id}"
+        os.replace(destination, self.local_file)
+        if self.manifest is not None:
+            self.manifest.remove()
+
+
+    def abort_download(self, keep_partial: bool = None) -> None:
+        """Removes the partial file of a failed download, unless it is being kept to resume later.
+
+        Args:
+            keep_partial (bool, optional): Whether to keep the partial file. Defaults to keeping it when resuming is enabled.
+        """
+
+        if keep_partial is None:
+            keep_partial = self.resume
+        if keep_partial or self.download_id is None:
+            return
+
+        try:
+            os.remove(f"{self.local_file}.{self.download_id}")
+        except FileNotFoundError:
+            pass
+
+
+    async def transfer_part(self, starting_byte: int, session: aiohttp.ClientSession) -> int:
+        """Downloads one part in the multipart download.
+
+        Args:
+            starting_byte (int): Index of the first byte in the part.
+            session (aiohttp.ClientSession): The base asynchronous client session.
+
+        Raises:
+            aiohttp.ClientResponseError: The part was rejected, or still failed once its retries ran out.
+            ChecksumError: The part still did not match its checksum once its retries ran out.
+            IncompletePartError: The part still had the wrong length once its retries ran out.
+
+        Returns:
+            int: HTTP status code of the response.
+        """
+
+        part_length = self.part_length(starting_byte)
+        content_range = f"{starting_byte}-{starting_byte+self.chunk_size}"
+
+        headers = {
+            'Authorization': os.environ['ET_ENGINE_API_KEY'],
+            'Content-Range': content_range
+        }
+
+        async def receive() -> int:
+            async with session.get(self.url, headers=headers) as response:
+                response.raise_for_status()
+
+                # Hash the bytes as they arrive, so the checksum covers what was received rather than the file range
+                loop = asyncio.get_running_loop()
+                checksum = Checksum(self.checksum) if self.checksum is not None else None
+                offset = starting_byte
+                async for data in response.content.iter_chunked(STREAM_CHUNK_SIZE_BYTES):
+                    if offset + len(data) > starting_byte + part_length:
+                        raise IncompletePartError(f"Part starting at byte {starting_byte} is longer than {part_length} bytes")
+                    self.part_file.write(offset, data)
+                    if checksum is not None:
+                        await loop.run_in_executor(None, checksum.update, data)
+                    offset += len(data)
+
+                if offset - starting_byte != part_length:
+                    raise IncompletePartError(f"Part starting at byte {starting_byte} has {offset - starting_byte} of {part_length} bytes")
+
+                self.verify_part_checksum(starting_byte, checksum.digest() if checksum is not None else None, response)
+                return response.status
+
+        return await self.retry_part(starting_byte, receive)
+
+
+async def transfer_files(transfers: Iterable[Transfer], session: aiohttp.ClientSession, max_files: int = DEFAULT_MAX_FILES, progress: bool = True) -> list[str]:
+    """Runs many file transfers concurrently on one session.
+
+    A fixed pool of `max_files` workers pulls transfers from the iterable, so transfers are only
+    created as workers become free. Part-level concurrency within each file is still governed by its
+    own adaptive limit.
+
+    Args:
+        transfers (Iterable[Transfer]): The transfers to run. May be a lazy generator.
+        session (aiohttp.ClientSession): The base asynchronous client session.
+        max_files (int, optional): Maximum number of files transferred at once. Defaults to DEFAULT_MAX_FILES.
+        progress (bool, optional): Whether to show a progress bar over the files. Defaults to True.
+
+    Returns:
+        list[str]: Whole-file digests, in completion order.
+    """
+
+    transfers = iter(transfers)
+    checksums = []
+    pbar = tqdm(desc="files", unit="file", disable=not progress)
+
+    async def worker() -> None:
+        for transfer in transfers:
+            checksums.append(await transfer.run_async(session))
+            pbar.update(1)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(max_files)]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        pbar.close()
+
+    return checksums
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from et_engine import Engine
+from et_engine.clients import RetryPolicy
+from et_engine.testing import MockEngine
+
+
+MiB = 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("ET_ENGINE_API_KEY", "test-key")
+
+
+@pytest.fixture
+def server():
+    with MockEngine() as server:
+        yield server
+
+
+@pytest.fixture
+def engine(server):
+    engine = Engine(server.url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05))
+    yield engine
+    engine.close()
+
+
+@pytest.fixture
+def filesystem(engine):
+    return engine.filesystems.create_filesystem("test")
+
+
+def write_random(path: str, size: int) -> bytes:
+    """Writes `size` random bytes to a new file.
+
+    Args:
+        path (str): Path of the file.
+        size (int): Number of bytes.
+
+    Returns:
+        bytes: The contents written.
+    """
+
+    contents = os.urandom(size)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(contents)
+    return contents
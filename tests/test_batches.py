@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from et_engine import Engine, AsyncEngine
+from et_engine import batches
+from et_engine.testing import MockEngine
+
+
+@pytest.fixture
+def server():
+    with MockEngine(job_seconds=0.2, job_failure_rate=0.3, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def outputs(filesystem, tmp_path):
+    """Writes an output for every job of a 6-job batch to the filesystem."""
+    for i in range(6):
+        (tmp_path / "out.txt").write_text(f"job {i}")
+        filesystem.upload(str(tmp_path / "out.txt"), f"results/{i}/out.txt", progress=False)
+    return filesystem
+
+
+def test_job_table():
+    table = batches.JobTable(3)
+    changes = table.apply([{"index": 0, "status": batches.JOB_SUCCEEDED}, {"job_index": 2, "state": batches.JOB_FAILED}])
+
+    assert changes == [batches.JobChange(0, batches.JOB_UNKNOWN, batches.JOB_SUCCEEDED), batches.JobChange(2, batches.JOB_UNKNOWN, batches.JOB_FAILED)]
+    assert table.apply([{"index": 0, "status": batches.JOB_SUCCEEDED}]) == []
+    assert table.n_finished() == 2
+    assert table.indices(batches.JOB_FAILED) == [2]
+    assert table.counts() == {batches.JOB_UNKNOWN: 1, batches.JOB_SUCCEEDED: 1, batches.JOB_FAILED: 1}
+
+
+def test_wait_and_jobs(engine):
+    batch = engine.tools.create_tool("tool", "").run_batch({}, [{"i": i} for i in range(6)])
+    batch.wait(min_interval=0.05, max_interval=0.2)
+
+    status = batch.status()
+    assert status.succeeded + status.failed == 6
+    table = batch.jobs()
+    assert len(table.indices(batches.JOB_SUCCEEDED)) == status.succeeded
+    assert batch.changes() == []
+
+
+def test_group_status_sums_fields():
+    class Status:
+        def __init__(self, succeeded, failed):
+            self.succeeded = succeeded
+            self.failed = failed
+            self.n_jobs = 10
+
+    status = batches.GroupStatus([Status(1, 2), Status(3, 4)])
+    assert (status.succeeded, status.failed, status.running) == (4, 6, 0)
+    assert not hasattr(status, "n_jobs")
+
+
+def test_group_wait(engine):
+    batch = engine.tools.create_tool("tool", "").run_batch({}, [{"i": i} for i in range(6)])
+    group = batches.BatchGroup([batch, batch])
+    group.wait(min_interval=0.05, max_interval=0.2)
+
+    status = group.status()
+    assert status.succeeded + status.failed == 12
+
+
+def test_gather(outputs, engine, tmp_path, capfd):
+    batch = engine.tools.create_tool("tool", "").run_batch({}, [{"i": i} for i in range(6)])
+    gathered = list(batch.gather(outputs, "results/{i}/out.txt", str(tmp_path / "gathered"), min_interval=0.05, max_interval=0.2))
+
+    succeeded = batch.jobs(refresh=False).indices(batches.JOB_SUCCEEDED)
+    assert 0 < len(succeeded) < 6
+    assert sorted(gathered) == sorted(str(tmp_path / "gathered" / "results" / str(i) / "out.txt") for i in succeeded)
+    for i in succeeded:
+        assert (tmp_path / "gathered" / "results" / str(i) / "out.txt").read_text() == f"job {i}"
+
+    # Downloads draw no progress bars unless asked to
+    assert "MB]" not in capfd.readouterr().err
+
+
+def test_async_gather(outputs, server, tmp_path, capfd):
+    async def gather() -> tuple[list[str], list[int]]:
+        async with AsyncEngine(server.url) as engine:
+            filesystem = await engine.filesystems.connect("test")
+            tool = await engine.tools.create_tool("tool", "")
+            batch = await tool.run_batch({}, [{"i": i} for i in range(6)])
+            gathered = [path async for path in batch.gather(filesystem, "results/{i}/out.txt", str(tmp_path / "gathered"), min_interval=0.05, max_interval=0.2)]
+            return gathered, batch.job_table.indices(batches.JOB_SUCCEEDED)
+
+    gathered, succeeded = asyncio.run(gather())
+
+    assert sorted(gathered) == sorted(str(tmp_path / "gathered" / "results" / str(i) / "out.txt") for i in succeeded)
+    assert "MB]" not in capfd.readouterr().err
@@ -0,0 +1,201 @@
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+from aiohttp import web
+
+from et_engine import Engine
+from et_engine import clients
+from et_engine.clients import RetryPolicy, ResourceIndex
+from et_engine.testing import MockEngine
+
+
+def http_error(status: int, headers: dict = None) -> requests.exceptions.HTTPError:
+    """Builds the error `raise_for_status` would raise for a response.
+
+    Args:
+        status (int): HTTP status code.
+        headers (dict, optional): Response headers. Defaults to None.
+
+    Returns:
+        requests.exceptions.HTTPError: The error.
+    """
+
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(response=response)
+
+
+class RateLimitedEngine(MockEngine):
+    """Mock server that answers the first `rejections` listings with 429 and a Retry-After.
+    """
+
+    def __init__(self, rejections: int, retry_after: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.rejections = rejections
+        self.retry_after = retry_after
+        self.listings = 0
+
+
+    async def handle_filesystems(self, request: web.Request) -> web.Response:
+        if request.method == "GET":
+            self.listings += 1
+            if self.rejections:
+                self.rejections -= 1
+                return web.Response(status=429, headers={"Retry-After": self.retry_after})
+        return await super().handle_filesystems(request)
+
+
+@pytest.mark.parametrize("status, idempotent, transient", [
+    (503, True, True),
+    (500, True, True),
+    (404, True, False),
+    (400, True, False),
+    (500, False, False),
+    (429, False, True),
+])
+def test_retry_policy_classifies_status_codes(status, idempotent, transient):
+    assert RetryPolicy().is_transient(http_error(status), idempotent=idempotent) is transient
+
+
+def test_retry_policy_classifies_connection_errors():
+    policy = RetryPolicy()
+    assert policy.is_transient(requests.exceptions.ConnectionError())
+    assert policy.is_transient(clients.TransientError())
+    assert not policy.is_transient(requests.exceptions.ConnectionError(), idempotent=False)
+    assert not policy.is_transient(ValueError())
+
+
+def test_retry_after_seconds_and_date():
+    policy = RetryPolicy()
+    assert policy.retry_after(http_error(429, {"Retry-After": "3"})) == 3
+    assert policy.retry_after(http_error(500, {"Retry-After": "3"})) is None
+    assert policy.retry_after(http_error(503)) is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = policy.retry_after(http_error(503, {"Retry-After": format_datetime(retry_at, usegmt=True)}))
+    assert 25 < delay <= 30
+
+
+def test_next_delay_honors_attempts_and_budget():
+    policy = RetryPolicy(max_attempts=3, base_delay=1, max_delay=2)
+    deadline = time.monotonic() + 60
+
+    assert 0 <= policy.next_delay(http_error(503), 1, deadline) <= 1
+    assert policy.next_delay(http_error(429, {"Retry-After": "5"}), 1, deadline) == 5
+    assert policy.next_delay(http_error(503), 3, deadline) is None
+    assert policy.next_delay(http_error(429, {"Retry-After": "120"}), 1, deadline) is None
+    assert policy.next_delay(http_error(404), 1, deadline) is None
+
+
+def test_retry_policy_call():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+    errors = [http_error(503), http_error(503)]
+
+    def flaky() -> str:
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert policy.call(flaky) == "ok"
+
+    calls = []
+
+    def failing() -> None:
+        calls.append(1)
+        raise http_error(503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        policy.call(failing)
+    assert len(calls) == 3
+
+
+def test_request_waits_for_retry_after():
+    with RateLimitedEngine(rejections=1, retry_after="0.3") as server:
+        engine = Engine(server.url)
+        start = time.monotonic()
+        assert engine.filesystems.list_filesystems() == []
+        assert time.monotonic() - start >= 0.3
+        assert server.listings == 2
+        engine.close()
+
+
+def test_request_gives_up_after_max_attempts():
+    with RateLimitedEngine(rejections=10, retry_after="0") as server:
+        engine = Engine(server.url, retry_policy=RetryPolicy(max_attempts=2))
+        with pytest.raises(requests.exceptions.HTTPError):
+            engine.filesystems.list_filesystems()
+        assert server.listings == 2
+        engine.close()
+
+
+def test_resource_index_ttl_and_miss(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(clients.time, "monotonic", lambda: now[0])
+    index = ResourceIndex(lambda r: r["id"], lambda r: r["name"], ttl=10)
+
+    assert index.get(name="a") is None
+    index.refresh([{"id": "1", "name": "a"}])
+    assert index.get(name="a") == {"id": "1", "name": "a"}
+    assert index.get(resource_id="1") == {"id": "1", "name": "a"}
+    assert index.get(name="b") is None
+
+    now[0] += 10
+    assert not index.fresh
+    assert index.get(name="a") is None
+    assert index.find(name="a") == {"id": "1", "name": "a"}
+
+    index.refresh([{"id": "1", "name": "a"}])
+    index.discard("1")
+    assert index.get(name="a") is None
+    index.put({"id": "2", "name": "b"})
+    assert index.get(name="b") == {"id": "2", "name": "b"}
+    index.invalidate()
+    assert index.find(name="b") is None
+
+
+def test_connect_uses_index(server, engine):
+    engine.filesystems.create_filesystem("a")
+    engine.filesystems.list_filesystems()
+    other = Engine(server.url)
+    other.filesystems.create_filesystem("b")
+
+    requests_before = server.request_count
+    assert engine.filesystems.connect("a").filesystem_name == "a"
+    assert server.request_count == requests_before
+
+    # A name missing from a fresh index still refreshes it
+    assert engine.filesystems.connect("b").filesystem_name == "b"
+    assert server.request_count == requests_before + 1
+    with pytest.raises(Exception, match="does not exist"):
+        engine.filesystems.connect("c")
+    other.close()
+
+
+def test_page_items():
+    assert clients.page_items(None) == ([], None)
+    assert clients.page_items([{"id": 1}]) == ([{"id": 1}], None)
+    assert clients.page_items({clients.PAGE_ITEMS_KEY: [{"id": 1}], clients.PAGE_TOKEN_PARAM: "1"}) == ([{"id": 1}], "1")
+
+
+def test_pagination(server, engine):
+    names = [f"fs-{i:02d}" for i in range(25)]
+    for name in names:
+        engine.filesystems.create_filesystem(name)
+
+    requests_before = server.request_count
+    pages = list(engine.filesystems.iter_pages(page_size=10))
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert server.request_count == requests_before + 3
+
+    listed = [fs.filesystem_name for fs in engine.filesystems.iter_filesystems(page_size=7)]
+    assert listed == names
+
+    # Iteration stops fetching pages once the caller stops
+    requests_before = server.request_count
+    matches = engine.filesystems.iter_filesystems(where=lambda fs: fs["filesystem_name"] == "fs-03", page_size=5)
+    assert next(matches).filesystem_name == "fs-03"
+    assert server.request_count == requests_before + 1
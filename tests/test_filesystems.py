@@ -0,0 +1,183 @@
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from et_engine import AsyncEngine, filesystems, packing
+from et_engine.filesystems import SYNC_UPLOAD, SYNC_DOWNLOAD
+
+from conftest import write_random
+
+
+LOCAL = {
+    "same.txt": {"size": 3, "mtime": 100.0},
+    "edited.txt": {"size": 3, "mtime": 200.0},
+    "resized.txt": {"size": 4, "mtime": 100.0},
+    "new.txt": {"size": 1, "mtime": 100.0},
+}
+REMOTE = {
+    "same.txt": {"size": 3, "mtime": 100.0},
+    "edited.txt": {"size": 3, "mtime": 100.0},
+    "resized.txt": {"size": 3, "mtime": 100.0},
+    "remote_only.txt": {"size": 1, "mtime": 100.0},
+}
+
+
+@pytest.mark.parametrize("direction, compare, expected", [
+    (SYNC_UPLOAD, "exists", ["new.txt"]),
+    (SYNC_UPLOAD, "size", ["new.txt", "resized.txt"]),
+    (SYNC_UPLOAD, "mtime", ["edited.txt", "new.txt", "resized.txt"]),
+    (SYNC_DOWNLOAD, "exists", ["remote_only.txt"]),
+    (SYNC_DOWNLOAD, "mtime", ["remote_only.txt", "resized.txt"]),
+])
+def test_plan_sync(direction, compare, expected):
+    assert filesystems.plan_sync(LOCAL, REMOTE, "", direction, compare) == expected
+
+
+def test_plan_sync_by_hash(tmp_path):
+    (tmp_path / "a").write_bytes(b"abc")
+    (tmp_path / "b").write_bytes(b"xyz")
+    local_files = filesystems.scan_local(str(tmp_path))
+    remote_files = {
+        "a": {"size": 3, "sha256": filesystems.local_checksum(str(tmp_path / "a"))},
+        "b": {"size": 3, "sha256": "other"},
+    }
+
+    assert filesystems.plan_sync(local_files, remote_files, str(tmp_path), SYNC_UPLOAD, "hash") == ["b"]
+
+
+def test_plan_sync_rejects_invalid_options():
+    with pytest.raises(Exception, match="direction"):
+        filesystems.plan_sync(LOCAL, REMOTE, "", "sideways", "size")
+    with pytest.raises(Exception, match="comparison"):
+        filesystems.plan_sync(LOCAL, REMOTE, "", SYNC_UPLOAD, "color")
+
+
+def test_unknown_metadata_counts_as_changed():
+    assert filesystems.needs_sync({"size": 3, "mtime": 1.0}, {"size": 3}, "mtime")
+    assert filesystems.needs_sync({"size": None}, {"size": None}, "size")
+    assert not filesystems.needs_sync({"size": 3}, {"size": 3}, "size")
+
+
+def test_directories_to_create():
+    paths = ["a/b/c.txt", "d.txt", "a/e.txt"]
+
+    assert filesystems.directories_to_create("x/y", paths, {"a"}, False) == ["x", "x/y", "x/y/a/b"]
+    assert filesystems.directories_to_create("x/y", paths, set(), True) == ["x/y/a", "x/y/a/b"]
+    assert filesystems.directories_to_create("", ["d.txt"], set(), False) == []
+
+
+def test_add_listings():
+    files, directories = {}, set()
+    listings = [("", {"files": ["a.txt"], "directories": ["d"]}), ("missing", None)]
+
+    assert filesystems.add_listings(listings, files, directories) == ["d"]
+    assert filesystems.add_listings([("d", {"files": [{"name": "b.txt", "size": 3}]})], files, directories) == []
+    assert files == {"a.txt": {}, "d/b.txt": {"size": 3, "mtime": None, "sha256": None}}
+    assert directories == {"d"}
+
+
+def test_stale_shards():
+    shard_paths = [f"{packing.SHARD_DIRECTORY}/{packing.shard_name(0)}"]
+    remote_shards = [packing.shard_name(0), packing.shard_name(1), "notes.txt"]
+
+    assert packing.stale_shards("x/", remote_shards, shard_paths) == [f"x/{packing.SHARD_DIRECTORY}/{packing.shard_name(1)}"]
+
+
+def test_sync_round_trip(filesystem, tmp_path):
+    source = tmp_path / "source"
+    contents = {
+        "top.txt": write_random(str(source / "top.txt"), 10),
+        "a/b/deep.bin": write_random(str(source / "a" / "b" / "deep.bin"), 1024),
+        "a/empty": write_random(str(source / "a" / "empty"), 0),
+    }
+
+    assert filesystem.sync(str(source), "remote/dir", progress=False) == sorted(contents)
+    assert filesystem.sync(str(source), "remote/dir", progress=False) == []
+
+    # A same-size edit is picked up by the default size and mtime comparison
+    time.sleep(0.01)
+    (source / "top.txt").write_bytes(b"x" * 10)
+    assert filesystem.sync(str(source), "remote/dir", progress=False) == ["top.txt"]
+    contents["top.txt"] = b"x" * 10
+
+    destination = tmp_path / "destination"
+    assert filesystem.sync(str(destination), "remote/dir", direction=SYNC_DOWNLOAD, progress=False) == sorted(contents)
+    for relative_path, expected in contents.items():
+        assert (destination / relative_path).read_bytes() == expected
+    assert filesystem.sync(str(destination), "remote/dir", direction=SYNC_DOWNLOAD, progress=False) == []
+
+
+def test_mkdir(filesystem):
+    filesystem.mkdir("a")
+    filesystem.mkdir("a", ignore_exists=True)
+    with pytest.raises(Exception):
+        filesystem.mkdir("a")
+    assert filesystem.ls()["directories"] == ["a"]
+
+
+def test_packed_round_trip(filesystem, tmp_path):
+    source = tmp_path / "source"
+    contents = {f"small/{i}.txt": write_random(str(source / "small" / f"{i}.txt"), i) for i in range(50)}
+    contents["large/file.bin"] = write_random(str(source / "large" / "file.bin"), filesystems.packing.SMALL_FILE_THRESHOLD_BYTES)
+
+    uploaded = filesystem.upload_packed(str(source), "packed/dir", progress=False)
+    assert "large/file.bin" in uploaded
+    assert len(uploaded) == 2
+
+    destination = tmp_path / "destination"
+    assert filesystem.download_packed("packed/dir", str(destination), progress=False) == sorted(contents)
+    for relative_path, expected in contents.items():
+        assert (destination / relative_path).read_bytes() == expected
+    assert not os.path.exists(destination / filesystems.packing.SHARD_DIRECTORY)
+
+
+def test_packed_round_trip_splits_directories_across_shards(filesystem, tmp_path):
+    source = tmp_path / "source"
+    contents = {f"d/e/f/{i}.txt": write_random(str(source / "d" / "e" / "f" / f"{i}.txt"), 100) for i in range(40)}
+
+    uploaded = filesystem.upload_packed(str(source), "packed/dir", shard_size=300, progress=False)
+    assert len(uploaded) > 10
+
+    destination = tmp_path / "destination"
+    assert filesystem.download_packed("packed/dir", str(destination), progress=False) == sorted(contents)
+    for relative_path, expected in contents.items():
+        assert (destination / relative_path).read_bytes() == expected
+
+
+def test_concurrent_shards_share_parent_directories(tmp_path):
+    source = tmp_path / "source"
+    shards = []
+    for i in range(8):
+        write_random(str(source / "d" / "e" / "f" / f"{i}.txt"), 10)
+        shards.append(str(tmp_path / f"{i}{packing.SHARD_SUFFIX}"))
+        packing.write_shard(str(source), [f"d/e/f/{i}.txt"], shards[-1])
+
+    for attempt in range(50):
+        destination = str(tmp_path / f"destination-{attempt}")
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            extracted = list(executor.map(lambda shard: packing.extract_shard(shard, destination), shards))
+        assert sorted(sum(extracted, [])) == [f"d/e/f/{i}.txt" for i in range(8)]
+
+
+def test_async_sync_and_packed_round_trip(server, tmp_path):
+    source = tmp_path / "source"
+    contents = {f"d/{i}.txt": write_random(str(source / "d" / f"{i}.txt"), 100) for i in range(20)}
+
+    async def round_trip() -> tuple[list[str], list[str], list[str]]:
+        async with AsyncEngine(server.url) as engine:
+            filesystem = await engine.filesystems.create_filesystem("test")
+            synced = await filesystem.sync(str(source), "synced", progress=False)
+            pulled = await filesystem.sync(str(tmp_path / "pulled"), "synced", direction=filesystems.SYNC_DOWNLOAD, progress=False)
+            await filesystem.upload_packed(str(source), "packed", shard_size=300, progress=False)
+            unpacked = await filesystem.download_packed("packed", str(tmp_path / "unpacked"), progress=False)
+            return synced, pulled, unpacked
+
+    synced, pulled, unpacked = asyncio.run(round_trip())
+
+    assert synced == pulled == unpacked == sorted(contents)
+    for relative_path, expected in contents.items():
+        assert (tmp_path / "pulled" / relative_path).read_bytes() == expected
+        assert (tmp_path / "unpacked" / relative_path).read_bytes() == expected
@@ -0,0 +1,205 @@
+import os
+import sys
+import subprocess
+from array import array
+
+import pytest
+
+from et_engine import encoding
+from et_engine.tools import ArgParser, ArgNamespace, ListOf, ArrayOf, JSON
+
+
+def test_list_of():
+    assert ListOf(int)("1,2,3") == [1, 2, 3]
+    assert ListOf(float, separator=";")("0.5;1.5") == [0.5, 1.5]
+    assert ListOf(int)("[4, 5]") == [4, 5]
+    assert ListOf()("") == []
+    assert ListOf(int)([1, "2"]) == [1, 2]
+
+
+def test_array_of():
+    assert ArrayOf("d")("0.5,1.5") == array("d", [0.5, 1.5])
+    assert ArrayOf("q")("[1, 2, 3]") == array("q", [1, 2, 3])
+    assert ArrayOf("d")("") == array("d")
+
+    encoded = encoding.encode_array(array("d", [0.5, 1.5]))
+    assert ArrayOf("d")(encoded) == array("d", [0.5, 1.5])
+    assert ArrayOf("f")(encoded) == array("f", [0.5, 1.5])
+
+
+def test_array_of_numpy():
+    np = pytest.importorskip("numpy")
+    encoded = encoding.encode_array(np.arange(6, dtype=np.int32).reshape(2, 3))
+
+    decoded = ArrayOf("d", numpy=True)(encoded)
+    assert decoded.shape == (2, 3)
+    assert decoded.dtype == np.float64
+    assert ArrayOf("q", numpy=True)("1,2").tolist() == [1, 2]
+
+
+def test_json():
+    assert JSON('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert JSON({"a": 1}) == {"a": 1}
+
+
+def test_parse_args(monkeypatch):
+    monkeypatch.setenv("count", "3")
+    monkeypatch.setenv("depths", "1.5,2.5")
+    monkeypatch.setenv("config", '{"mode": "fast"}')
+
+    parser = ArgParser("my-tool", lazy=True)
+    parser.add_argument("count", type=int, required=True)
+    parser.add_argument("depths", type=ArrayOf("d"))
+    parser.add_argument("config", type=JSON, default={})
+    parser.add_argument("label", default="none")
+    args = parser.parse_args()
+
+    assert isinstance(args, ArgNamespace)
+    assert args.as_dict() == {"count": 3, "depths": array("d", [1.5, 2.5]), "config": {"mode": "fast"}, "label": "none"}
+    with pytest.raises(AttributeError):
+        args.other = 1
+
+    # The result is cached until another argument is added
+    monkeypatch.setenv("count", "4")
+    assert parser.parse_args() is args
+    parser.add_argument("extra", default=0)
+    assert parser.parse_args() is not args
+    assert parser.parse_args().count == 3
+
+
+def test_parse_args_reports_every_error(monkeypatch):
+    monkeypatch.setenv("count", "three")
+    monkeypatch.delenv("path", raising=False)
+
+    parser = ArgParser("my-tool", lazy=True)
+    parser.add_argument("count", type=int)
+    parser.add_argument("path", required=True)
+
+    with pytest.raises(Exception) as error:
+        parser.parse_args()
+    assert "2 invalid argument(s)" in str(error.value)
+    assert "'count'" in str(error.value)
+    assert "'path'" in str(error.value)
+
+
+@pytest.mark.parametrize("name, message", [
+    ("count", "already added"),
+    ("as_dict", "reserved by the parsed namespace"),
+    ("__class__", "reserved by the parsed namespace"),
+    ("my-depth", "valid identifier"),
+    ("class", "valid identifier"),
+])
+def test_add_argument_rejects_invalid_names(name, message):
+    parser = ArgParser("my-tool", lazy=True)
+    parser.add_argument("count")
+
+    with pytest.raises(Exception, match=message):
+        parser.add_argument(name)
+    assert [arg.name for arg in parser.arguments] == ["count"]
+
+
+def test_eager_parser_rejects_its_own_attributes():
+    parser = ArgParser("my-tool")
+    for name in ("name", "arguments", "parse_args"):
+        with pytest.raises(Exception, match="clashes with an ArgParser attribute"):
+            parser.add_argument(name)
+
+    assert ArgParser("my-tool", lazy=True).add_argument("name") is None
+
+
+def test_eager_parser_sets_attributes(monkeypatch):
+    monkeypatch.setenv("count", "3")
+
+    parser = ArgParser("my-tool")
+    parser.add_argument("count", type=int)
+
+    assert parser.count == 3
+
+
+def test_encoding_round_trip():
+    for typecode, values in (("d", [0.5, -1.25, 1e300]), ("q", [1, -2, 2**62]), ("B", [0, 255]), ("f", [])):
+        encoded = encoding.encode_array(array(typecode, values))
+        assert encoding.is_encoded(encoded)
+        decoded = encoding.decode_array(encoded)
+        assert decoded.itemsize == array(typecode).itemsize
+        assert decoded.tolist() == values
+
+
+def test_encoding_round_trip_numpy():
+    np = pytest.importorskip("numpy")
+    for value in (np.linspace(0, 1, 12).reshape(3, 4), np.arange(5, dtype=">i4"), np.array([True, False]), np.float32(2.5) * np.ones(())):
+        decoded = encoding.decode_array(encoding.encode_array(value), numpy=True)
+        assert decoded.shape == value.shape
+        assert np.array_equal(decoded, value)
+
+
+def test_encode_arrays():
+    kwargs = {"a": 1, "b": "text"}
+    assert encoding.encode_arrays(kwargs) is kwargs
+
+    encoded = encoding.encode_arrays({"a": 1, "b": array("d", [1.0])})
+    assert encoded["a"] == 1
+    assert encoding.decode_array(encoded["b"]) == array("d", [1.0])
+
+
+def test_encode_rejects_arrays_over_the_argument_limit():
+    largest = encoding.MAX_ENCODED_BYTES * 3 // 4 - 64
+    assert len(encoding.encode_array(array("B", bytes(largest)))) <= encoding.MAX_ENCODED_BYTES
+
+    with pytest.raises(Exception, match="byte limit of a job argument"):
+        encoding.encode_array(array("d", [0.0]) * (100 * 1024 // 8))
+    with pytest.raises(Exception, match="byte limit of a job argument"):
+        encoding.encode_arrays({"a": array("B", bytes(encoding.MAX_ENCODED_BYTES))})
+
+
+def test_decode_rejects_invalid():
+    with pytest.raises(Exception, match="Invalid encoded array"):
+        encoding.decode_array("etarray:<f8:2:not base64!")
+    with pytest.raises(Exception, match="Unsupported array dtype"):
+        encoding.decode_array("etarray:<c16:1:AAAAAAAAAAAAAAAAAAAAAA==")
+    with pytest.raises(Exception, match="Cannot encode"):
+        encoding.encode_array([1.0, 2.0])
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Logger configures the logging module and sys.excepthook globally, so each case runs in its own interpreter
+LOGGER_SCRIPT = """
+import sys
+from et_engine.tools import Logger
+logger = Logger(sys.argv[1], append=False, asynchronous=True, flush_records=10**6, flush_interval=3600)
+for i in range(1000):
+    logger.info("record %d", i)
+with open(sys.argv[1]) as f:
+    written_before_close = f.read().count("record ")
+{finish}
+print(written_before_close)
+"""
+
+
+@pytest.mark.parametrize("finish", ["logger.close()", "logger.flush()", ""])
+def test_batched_logger_writes_every_record(tmp_path, finish):
+    log_file = tmp_path / "tool.log"
+    output = subprocess.run(
+        [sys.executable, "-c", LOGGER_SCRIPT.format(finish=finish), str(log_file)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT
+    ).stdout
+
+    # The end of the batch is still buffered after logging, yet every record reaches the file by close, flush or exit
+    assert int(output) < 1000
+    assert log_file.read_text().count("record ") == 1000
+
+
+def test_batched_logger_flushes_on_unhandled_exception(tmp_path):
+    log_file = tmp_path / "tool.log"
+    script = LOGGER_SCRIPT.format(finish="raise RuntimeError('boom')")
+    result = subprocess.run([sys.executable, "-c", script, str(log_file)], capture_output=True, text=True, cwd=REPO_ROOT)
+
+    assert result.returncode != 0
+    log = log_file.read_text()
+    assert log.count("record ") == 1000
+    assert "UNHANDLED EXCEPTION" in log
+    assert "boom" in log
@@ -0,0 +1,226 @@
+import os
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from et_engine import Engine, AsyncEngine
+from et_engine import transfers
+from et_engine.clients import RetryPolicy
+from et_engine.testing import MockEngine
+
+from conftest import MiB, write_random
+
+
+class SlowControlEngine(MockEngine):
+    """Mock server that answers upload control requests after a delay.
+    """
+
+    def __init__(self, *args, delay: float = 0.5, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+
+
+    async def handle_file(self, request: web.Request) -> web.Response:
+        if request.method == "POST":
+            await asyncio.sleep(self.delay)
+        return await super().handle_file(request)
+
+
+class FaultyEngine(MockEngine):
+    """Mock server that fails or corrupts chosen part requests.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.parts = {"PUT": 0, "GET": 0}
+        self.fail_after = {}
+        self.corrupt_checksums = 0
+        self.truncate_parts = 0
+
+
+    async def handle_file(self, request: web.Request) -> web.Response:
+        is_part = request.method == "PUT" or (request.method == "GET" and "init" not in request.query)
+        if not is_part:
+            return await super().handle_file(request)
+
+        remaining = self.fail_after.get(request.method)
+        if remaining is not None:
+            if remaining == 0:
+                return web.Response(status=400, text="Injected fatal failure")
+            self.fail_after[request.method] = remaining - 1
+
+        self.parts[request.method] += 1
+        response = await super().handle_file(request)
+        if request.method == "GET" and self.truncate_parts:
+            self.truncate_parts -= 1
+            return web.Response(body=response.body[:100])
+        return response
+
+
+    def checksum_headers(self, request: web.Request, part: bytes) -> dict:
+        headers = super().checksum_headers(request, part)
+        if self.corrupt_checksums:
+            self.corrupt_checksums -= 1
+            headers = {header: "0" * len(value) for header, value in headers.items()}
+        return headers
+
+
+@pytest.fixture
+def faulty():
+    with FaultyEngine() as server:
+        yield server
+
+
+@pytest.fixture
+def faulty_filesystem(faulty):
+    engine = Engine(faulty.url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05))
+    yield engine.filesystems.create_filesystem("test")
+    engine.close()
+
+
+@pytest.mark.parametrize("size", [0, 1, 8 * MiB, 20 * MiB + 7])
+def test_round_trip(filesystem, tmp_path, size):
+    contents = write_random(str(tmp_path / "in"), size)
+
+    uploaded = filesystem.upload(str(tmp_path / "in"), "file")
+    downloaded = filesystem.download("file", str(tmp_path / "out"))
+
+    assert (tmp_path / "out").read_bytes() == contents
+    assert uploaded == downloaded
+
+
+def test_round_trip_auto_chunk_size(filesystem, tmp_path):
+    contents = write_random(str(tmp_path / "in"), 40 * MiB)
+
+    filesystem.upload(str(tmp_path / "in"), "file", chunk_size=transfers.AUTO_CHUNK_SIZE)
+    filesystem.download("file", str(tmp_path / "out"), chunk_size=transfers.AUTO_CHUNK_SIZE)
+
+    assert (tmp_path / "out").read_bytes() == contents
+    assert filesystem.client.transport.observed_rtt is not None
+
+
+def test_async_transfers_share_the_async_transport(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(transfers, "default_transport", lambda: pytest.fail("Created a synchronous transport"))
+    contents = write_random(str(tmp_path / "in"), 20 * MiB)
+
+    async def round_trip() -> float:
+        async with AsyncEngine(server.url) as engine:
+            filesystem = await engine.filesystems.create_filesystem("test")
+            await filesystem.upload(str(tmp_path / "in"), "file", chunk_size=transfers.AUTO_CHUNK_SIZE, progress=False)
+            await filesystem.download("file", str(tmp_path / "out"), progress=False)
+            return engine.transport.observed_rtt
+
+    assert asyncio.run(round_trip()) is not None
+    assert (tmp_path / "out").read_bytes() == contents
+
+
+def test_async_control_requests_use_the_control_timeout(tmp_path):
+    write_random(str(tmp_path / "in"), 1024)
+
+    async def upload(control_timeout: float) -> None:
+        async with AsyncEngine(slow.url, control_timeout=control_timeout, retry_policy=RetryPolicy(max_attempts=1)) as engine:
+            filesystem = await engine.filesystems.create_filesystem(f"test-{control_timeout}")
+            await filesystem.upload(str(tmp_path / "in"), "file", progress=False)
+
+    with SlowControlEngine(delay=0.5) as slow:
+        with pytest.raises(TimeoutError):
+            asyncio.run(upload(0.1))
+        asyncio.run(upload(5))
+
+
+def test_upload_resumes_after_failure(faulty, faulty_filesystem, tmp_path):
+    local_file = str(tmp_path / "in")
+    contents = write_random(local_file, 40 * MiB)
+    options = dict(min_concurrency=1, max_concurrency=1, resume=True)
+
+    faulty.fail_after["PUT"] = 2
+    with pytest.raises(Exception):
+        faulty_filesystem.upload(local_file, "file", **options)
+    assert os.path.exists(f"{local_file}.upload{transfers.MANIFEST_SUFFIX}")
+
+    del faulty.fail_after["PUT"]
+    faulty.parts["PUT"] = 0
+    faulty_filesystem.upload(local_file, "file", **options)
+
+    assert faulty.parts["PUT"] == 3
+    assert not os.path.exists(f"{local_file}.upload{transfers.MANIFEST_SUFFIX}")
+    faulty_filesystem.download("file", str(tmp_path / "out"))
+    assert (tmp_path / "out").read_bytes() == contents
+
+
+def test_download_resumes_after_failure(faulty, faulty_filesystem, tmp_path):
+    contents = write_random(str(tmp_path / "in"), 40 * MiB)
+    faulty_filesystem.upload(str(tmp_path / "in"), "file")
+    local_file = str(tmp_path / "out")
+    options = dict(min_concurrency=1, max_concurrency=1, resume=True)
+
+    faulty.fail_after["GET"] = 2
+    with pytest.raises(Exception):
+        faulty_filesystem.download("file", local_file, **options)
+    assert os.path.exists(f"{local_file}.download{transfers.MANIFEST_SUFFIX}")
+
+    del faulty.fail_after["GET"]
+    faulty.parts["GET"] = 0
+    faulty_filesystem.download("file", local_file, **options)
+
+    assert faulty.parts["GET"] == 3
+    assert (tmp_path / "out").read_bytes() == contents
+
+
+def test_download_restarts_when_remote_changed(faulty, faulty_filesystem, tmp_path):
+    write_random(str(tmp_path / "in"), 40 * MiB)
+    faulty_filesystem.upload(str(tmp_path / "in"), "file")
+    local_file = str(tmp_path / "out")
+    options = dict(min_concurrency=1, max_concurrency=1, resume=True)
+
+    faulty.fail_after["GET"] = 2
+    with pytest.raises(Exception):
+        faulty_filesystem.download("file", local_file, **options)
+    del faulty.fail_after["GET"]
+
+    contents = write_random(str(tmp_path / "in"), 40 * MiB)
+    faulty_filesystem.upload(str(tmp_path / "in"), "file")
+    with pytest.warns(UserWarning):
+        faulty_filesystem.download("file", local_file, **options)
+
+    assert (tmp_path / "out").read_bytes() == contents
+
+
+def test_checksum_mismatch_is_retried(faulty, faulty_filesystem, tmp_path):
+    contents = write_random(str(tmp_path / "in"), 20 * MiB)
+
+    faulty.corrupt_checksums = 1
+    faulty_filesystem.upload(str(tmp_path / "in"), "file")
+    faulty.corrupt_checksums = 1
+    faulty_filesystem.download("file", str(tmp_path / "out"))
+
+    assert (tmp_path / "out").read_bytes() == contents
+    assert faulty.parts["PUT"] == 4
+    assert faulty.parts["GET"] == 4
+
+
+def test_checksum_mismatch_raises_when_retries_run_out(faulty, faulty_filesystem, tmp_path):
+    write_random(str(tmp_path / "in"), 1 * MiB)
+
+    faulty.corrupt_checksums = 100
+    with pytest.raises(transfers.ChecksumError):
+        faulty_filesystem.upload(str(tmp_path / "in"), "file")
+
+
+def test_short_download_part_is_retried(faulty, faulty_filesystem, tmp_path):
+    contents = write_random(str(tmp_path / "in"), 20 * MiB)
+    faulty_filesystem.upload(str(tmp_path / "in"), "file")
+
+    faulty.truncate_parts = 2
+    faulty_filesystem.download("file", str(tmp_path / "out"))
+
+    assert (tmp_path / "out").read_bytes() == contents
+
+
+def test_choose_chunk_size_leaves_enough_parts_for_concurrency():
+    for file_size in (10 * MiB, 100 * MiB, 1024 * MiB, 64 * 1024 * MiB):
+        chunk_size = transfers.choose_chunk_size(file_size, target_parts=transfers.DEFAULT_TARGET_PARTS, rtt=1.0, min_parts=16)
+        num_parts = -(-file_size // chunk_size)
+        assert transfers.MIN_CHUNK_SIZE_BYTES <= chunk_size <= transfers.MAX_CHUNK_SIZE_BYTES
+        assert num_parts >= min(16, -(-file_size // transfers.MIN_CHUNK_SIZE_BYTES))